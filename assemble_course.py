@@ -0,0 +1,143 @@
+"""
+Joins the rendered scenes into one chaptered course video without re-encoding.
+
+Scenes are taken in course order (COURSE_MODULES, each module's scenes in
+source order): intro, MPLS, topology, packet structure, the six flow scenes,
+control plane, summary. Every input is probed first and must share codec,
+profile, resolution, pixel format, frame rate and time base with the first
+one; otherwise the stream copy would produce a broken file, so assembly stops
+with the differences instead. The ffmpeg concat demuxer then copies the
+streams, and each scene becomes a chapter named after its Scene class.
+
+    python assemble_course.py -q h -o media/L2VPN_Course.mp4
+    python assemble_course.py -q h --locale de -o media/L2VPN_Course_de.mp4
+"""
+import argparse
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from l2vpn_i18n import SOURCE_LOCALE
+from render_common import COURSE_MODULES, quality_settings, scene_classes, scene_input_file
+
+# Stream properties that must be identical for a stream copy to be valid.
+MATCHED_VIDEO_FIELDS = ("codec_name", "profile", "width", "height", "pix_fmt", "r_frame_rate", "time_base")
+MATCHED_AUDIO_FIELDS = ("codec_name", "sample_rate", "channels", "time_base")
+
+
+def course_scenes(modules=COURSE_MODULES) -> list:
+    """Returns the Scene classes of the course, in order."""
+    return [scene_class for module in modules for scene_class in scene_classes(module)]
+
+
+def scene_output(scene_class: type, quality: str = "h", locale: str = SOURCE_LOCALE) -> Path:
+    """Returns where the manim CLI (or render_locales.py) writes the movie of one scene."""
+    with tempconfig({**quality_settings(quality), "input_file": scene_input_file(scene_class)}):
+        name = scene_class.__name__ if locale == SOURCE_LOCALE else f"{scene_class.__name__}_{locale}"
+        return config.get_dir("video_dir") / f"{name}{config.movie_file_extension}"
+
+
+def probe(path: Path) -> dict:
+    """Reads stream and container properties with ffprobe."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "stream=codec_type," + ",".join(sorted(set(MATCHED_VIDEO_FIELDS + MATCHED_AUDIO_FIELDS))),
+            "-show_entries", "format=duration",
+            "-of", "json",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _stream_signature(info: dict) -> list:
+    signature = []
+    for stream in info["streams"]:
+        fields = MATCHED_VIDEO_FIELDS if stream["codec_type"] == "video" else MATCHED_AUDIO_FIELDS
+        signature.append((stream["codec_type"], tuple((field, stream.get(field)) for field in fields)))
+    return signature
+
+
+def validate(inputs: list) -> list:
+    """
+    Probes every input and checks it can be stream-copied after the first.
+
+    Args:
+        inputs: (chapter title, path) pairs.
+
+    Returns:
+        The duration of every input in seconds.
+    """
+    infos = [probe(path) for _, path in inputs]
+    reference = _stream_signature(infos[0])
+    problems = []
+    for (title, path), info in zip(inputs, infos):
+        signature = _stream_signature(info)
+        if signature != reference:
+            problems.append(f"{title} ({path}): {signature} != {reference}")
+    if problems:
+        raise ValueError("Inputs cannot be joined without re-encoding:\n" + "\n".join(problems))
+    return [float(info["format"]["duration"]) for info in infos]
+
+
+def chapter_metadata(titles: list, durations: list) -> str:
+    """Builds an FFMETADATA1 document with one chapter per input."""
+    lines = [";FFMETADATA1"]
+    start = 0
+    for title, duration in zip(titles, durations):
+        end = start + round(duration * 1000)
+        escaped = "".join("\\" + char if char in "=;#\\\n" else char for char in title)
+        lines += ["[CHAPTER]", "TIMEBASE=1/1000", f"START={start}", f"END={end}", f"title={escaped}"]
+        start = end
+    return "\n".join(lines) + "\n"
+
+
+def assemble(inputs: list, output: Path):
+    """
+    Concatenates `inputs` ((chapter title, path) pairs) into `output` by stream copy.
+
+    Returns:
+        The total duration in seconds.
+    """
+    durations = validate(inputs)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as scratch:
+        playlist = Path(scratch) / "inputs.txt"
+        playlist.write_text("".join(f"file '{Path(path).resolve()}'\n" for _, path in inputs), encoding="utf-8")
+        metadata = Path(scratch) / "chapters.txt"
+        metadata.write_text(chapter_metadata([title for title, _ in inputs], durations), encoding="utf-8")
+        subprocess.run(
+            [
+                config.ffmpeg_executable, "-y", "-v", "error",
+                "-f", "concat", "-safe", "0", "-i", str(playlist),
+                "-i", str(metadata),
+                "-map", "0", "-map_metadata", "1", "-map_chapters", "1",
+                "-c", "copy",
+                "-movflags", "+faststart",
+                str(output),
+            ],
+            check=True,
+        )
+    return sum(durations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Join rendered scenes into one chaptered course video.")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag of the inputs (default: h)")
+    parser.add_argument("--locale", default=SOURCE_LOCALE, help="locale of the inputs, see render_locales.py")
+    parser.add_argument("-o", "--output", required=True, help="output movie file")
+    args = parser.parse_args()
+
+    course = [(scene.__name__, scene_output(scene, args.quality, args.locale)) for scene in course_scenes()]
+    missing = [str(path) for _, path in course if not path.exists()]
+    if missing:
+        parser.error("missing renders:\n  " + "\n  ".join(missing))
+    total = assemble(course, Path(args.output))
+    print(f"{args.output}: {len(course)} chapters, {total:.1f}s")
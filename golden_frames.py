@@ -0,0 +1,267 @@
+"""
+Golden-frame regression check for every Scene class.
+
+Selected frames of each scene are rendered at a small size and compared with
+stored golden images through perceptual hashes:
+
+    play ends      the frame after every play()/wait(), keyed play_000, play_001, ...
+    section ends   the frame at every next_section(), keyed section_000, ...
+    timestamps     frames at chosen scene times (--at Scene:12.5), keyed t_12.500
+
+Only those frames are rasterized; everything in between is interpolated but
+never drawn, so a whole course checks in about a minute on a laptop across a
+process pool. A frame passes when the Hamming distance between its hash
+and the golden hash stays within --tolerance bits. A changed number of plays
+or sections shows up as missing or unexpected keys. Failures name the scene
+and the play index, and the rendered frame is written next to the golden one
+(<key>.actual.png) for inspection.
+
+    python golden_frames.py update                      # record golden frames of the whole course
+    python golden_frames.py update l2vpn_flow_scenes.py --at PacketFlowScene_PE1_Encapsulation:6.0
+    python golden_frames.py check                       # exit code 1 on any difference
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from render_common import COURSE_MODULES, REPO_DIR, load_scene_class, scene_classes
+from render_frames import NullFileWriter
+
+GOLDEN_DIR = REPO_DIR / "golden"
+MANIFEST_NAME = "manifest.json"
+DEFAULT_PIXEL_WIDTH = 320
+DEFAULT_PIXEL_HEIGHT = 180
+DEFAULT_FRAME_RATE = 10  # the frame at a play's end does not depend on it
+DEFAULT_TOLERANCE = 6  # bits out of HASH_SIZE**2
+HASH_SIZE = 16
+HASH_SAMPLE = 64  # frames are reduced to HASH_SAMPLE x HASH_SAMPLE grey before the DCT
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(HASH_SAMPLE)
+
+
+def perceptual_hash(pixels: np.ndarray) -> str:
+    """
+    DCT hash of an RGB(A) frame: the sign of the lowest HASH_SIZE x HASH_SIZE
+    frequencies against their median, as a hex string.
+    """
+    grey = Image.fromarray(np.ascontiguousarray(pixels[:, :, :3])).convert("L")
+    sample = np.asarray(grey.resize((HASH_SAMPLE, HASH_SAMPLE), Image.BOX), dtype=np.float64)
+    low = (_DCT @ sample @ _DCT.T)[:HASH_SIZE, :HASH_SIZE]
+    bits = (low > np.median(low)).flatten()
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):0{HASH_SIZE * HASH_SIZE // 4}x}"
+
+
+def hash_distance(first: str, second: str) -> int:
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+
+class CheckpointFileWriter(NullFileWriter):
+    """A NullFileWriter that captures the frame at every section boundary."""
+    def next_section(self, name, type, skip_animations):
+        self.renderer.capture(f"section_{len(self.sections) - 1:03d}")
+        super().next_section(name, type, skip_animations)
+
+
+class CheckpointRenderer(CairoRenderer):
+    """
+    A CairoRenderer that rasterizes only the frames selected for comparison:
+    the end of every play, section boundaries and the given scene times.
+    Captures are (key, play index, RGB pixels) tuples in `captures`.
+    """
+    def __init__(self, timestamps=(), **kwargs):
+        super().__init__(file_writer_class=CheckpointFileWriter, **kwargs)
+        self.pending = sorted(timestamps)
+        self.captures = []
+        self.scene = None
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+
+    def capture(self, key: str):
+        self.static_image = None
+        self.update_frame(self.scene)
+        self.captures.append((key, self.num_plays, self.camera.pixel_array[:, :, :3].copy()))
+
+    def _advance(self, seconds: float):
+        self.time += seconds
+        while self.pending and self.pending[0] <= self.time + 1e-9:
+            self.capture(f"t_{self.pending.pop(0):.3f}")
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None  # nothing is drawn per frame, so there is nothing to reuse
+        return None
+
+    def render(self, scene, time, moving_mobjects):
+        if not self.skip_animations:
+            self._advance(1 / self.camera.frame_rate)
+
+    def freeze_current_frame(self, duration: float):
+        if not self.skip_animations:
+            self._advance(int(duration * self.camera.frame_rate) / self.camera.frame_rate)
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.capture(f"play_{self.num_plays - 1:03d}")
+
+
+def capture_scene(job) -> tuple:
+    """
+    Pool worker: renders one scene and returns its checkpoints.
+
+    Args:
+        job: (module, scene name, timestamps, pixel width, pixel height, frame rate).
+
+    Returns:
+        (scene name, [(key, play index, pixels), ...])
+    """
+    module, scene_name, timestamps, pixel_width, pixel_height, frame_rate = job
+    scene_class = load_scene_class(module, scene_name)
+    settings = {
+        "pixel_width": pixel_width,
+        "pixel_height": pixel_height,
+        "frame_rate": frame_rate,
+        "disable_caching": True,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "progress_bar": "none",
+        "verbosity": "ERROR",
+    }
+    with tempconfig(settings):
+        renderer = CheckpointRenderer(timestamps)
+        scene_class(renderer=renderer).render()
+    return scene_name, renderer.captures
+
+
+def run_captures(targets, timestamps: dict, processes=None, pixel_width: int = DEFAULT_PIXEL_WIDTH,
+                 pixel_height: int = DEFAULT_PIXEL_HEIGHT, frame_rate: int = DEFAULT_FRAME_RATE):
+    """Yields (module, scene name, captures) for every (module, scene name) target, across a process pool."""
+    jobs = [(module, name, timestamps.get(name, []), pixel_width, pixel_height, frame_rate) for module, name in targets]
+    modules = {name: module for module, name in targets}
+    with multiprocessing.Pool(processes) as pool:
+        for scene_name, captures in pool.imap_unordered(capture_scene, jobs):
+            yield modules[scene_name], scene_name, captures
+
+
+def load_manifest(golden_dir: Path) -> dict:
+    path = golden_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def update(targets, timestamps: dict, golden_dir: Path = GOLDEN_DIR, processes=None, **size) -> dict:
+    """
+    Renders `targets` and stores their frames and hashes as the new golden set.
+
+    Args:
+        targets: (module, scene name) pairs.
+        timestamps: Scene name -> scene times to capture besides play and section ends.
+        golden_dir: Where the golden images and the manifest live.
+        processes: Pool size; None uses every CPU.
+
+    Returns:
+        The updated manifest.
+    """
+    manifest = load_manifest(golden_dir)
+    # Scenes keep the timestamps they were recorded with unless new ones are given.
+    timestamps = {**{name: manifest[name]["timestamps"] for _, name in targets if name in manifest}, **timestamps}
+    for module, scene_name, captures in run_captures(targets, timestamps, processes, **size):
+        scene_dir = golden_dir / scene_name
+        scene_dir.mkdir(parents=True, exist_ok=True)
+        for stale in scene_dir.glob("*.png"):
+            stale.unlink()
+        frames = {}
+        for key, play, pixels in captures:
+            Image.fromarray(pixels).save(scene_dir / f"{key}.png")
+            frames[key] = {"play": play, "hash": perceptual_hash(pixels)}
+        manifest[scene_name] = {"module": module, "timestamps": timestamps.get(scene_name, []), "frames": frames}
+        print(f"{scene_name}: {len(frames)} golden frames")
+    golden_dir.mkdir(parents=True, exist_ok=True)
+    (golden_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest
+
+
+def check(targets, golden_dir: Path = GOLDEN_DIR, tolerance: int = DEFAULT_TOLERANCE, processes=None, **size) -> list:
+    """
+    Renders `targets` and compares them with the golden set.
+
+    Returns:
+        A list of failure messages naming the scene, frame key and play index.
+    """
+    manifest = load_manifest(golden_dir)
+    failures = []
+    missing = [name for _, name in targets if name not in manifest]
+    failures += [f"{name}: no golden frames, run `golden_frames.py update` first" for name in missing]
+    targets = [(module, name) for module, name in targets if name in manifest]
+    timestamps = {name: manifest[name]["timestamps"] for _, name in targets}
+    for _, scene_name, captures in run_captures(targets, timestamps, processes, **size):
+        golden = manifest[scene_name]["frames"]
+        seen = set()
+        for key, play, pixels in captures:
+            seen.add(key)
+            if key not in golden:
+                failures.append(f"{scene_name} play {play}: unexpected frame {key} (more plays or sections than recorded)")
+                continue
+            distance = hash_distance(perceptual_hash(pixels), golden[key]["hash"])
+            if distance > tolerance:
+                failures.append(f"{scene_name} play {play}: {key} differs by {distance} bits "
+                                f"(golden play {golden[key]['play']})")
+                Image.fromarray(pixels).save(golden_dir / scene_name / f"{key}.actual.png")
+        for key in sorted(set(golden) - seen):
+            failures.append(f"{scene_name} play {golden[key]['play']}: golden frame {key} was not rendered")
+        print(f"{scene_name}: {len(captures)} frames checked")
+    return failures
+
+
+def _targets(module, scenes) -> list:
+    if module and scenes:
+        return [(module, name) for name in scenes]
+    modules = [module] if module else COURSE_MODULES
+    return [(module, scene_class.__name__) for module in modules for scene_class in scene_classes(module)]
+
+
+def _parse_at(values) -> dict:
+    timestamps = {}
+    for value in values:
+        scene_name, _, seconds = value.rpartition(":")
+        timestamps.setdefault(scene_name, []).append(float(seconds))
+    return timestamps
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden-frame regression check with perceptual hashes.")
+    parser.add_argument("command", choices=("update", "check"))
+    parser.add_argument("module", nargs="?", help="Scene module; default: every course module")
+    parser.add_argument("scenes", nargs="*", help="Scene class names; default: every Scene in the module")
+    parser.add_argument("--golden-dir", default=str(GOLDEN_DIR))
+    parser.add_argument("--at", action="append", default=[], metavar="SCENE:SECONDS",
+                        help="also keep the frame at this scene time (update only; repeatable)")
+    parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE, help="allowed differing hash bits")
+    parser.add_argument("-j", "--processes", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    targets = _targets(args.module, args.scenes)
+    if args.command == "update":
+        update(targets, _parse_at(args.at), Path(args.golden_dir), args.processes)
+        sys.exit(0)
+    failures = check(targets, Path(args.golden_dir), args.tolerance, args.processes)
+    for failure in failures:
+        print(f"DIFFERS: {failure}")
+    sys.exit(1 if failures else 0)
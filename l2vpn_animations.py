@@ -0,0 +1,206 @@
+"""
+Animations shared by the scenes.
+
+GroupReveal replaces LaggedStart(*[Create(m) / Write(m) / FadeIn(m) ...]).
+LaggedStart builds one Animation per mobject, and each deep-copies its
+mobject as a starting state. GroupReveal is one Animation over all the items:
+
+    schedule     item i runs from i * lag_ratio to i * lag_ratio + 1 (in item
+                 durations), exactly like LaggedStart; one vectorized clip per
+                 frame gives every item's progress
+    state        per leaf only the fill opacity, stroke opacity and stroke
+                 width are kept up front; the points of a leaf are copied
+                 when its item starts and dropped when it ends, so memory
+                 follows the items in flight, not the group size
+    styles       "create" (partial paths, like Create), "write" (outline then
+                 fill, like Write) and "fade" (opacity and optional shift, like
+                 FadeIn)
+
+Finished and pending items cost nothing per frame. Leaves are assumed to have
+one fill and one stroke opacity (true of everything in these scenes); per-point
+opacity gradients come back as their first value.
+
+    python l2vpn_animations.py --routers 2000     # GroupReveal against LaggedStart
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from manim import Animation, Group, linear, smooth
+from manim.utils.bezier import integer_interpolate, partial_bezier_points
+
+STYLES = ("create", "write", "fade")
+WRITE_STROKE_WIDTH = 2  # the outline width of DrawBorderThenFill
+
+
+def _partial_points(points: np.ndarray, n_points_per_curve: int, proportion: float) -> np.ndarray:
+    """The first `proportion` of a path, keeping the point count (the rest collapses onto the end)."""
+    n_curves = len(points) // n_points_per_curve
+    if n_curves == 0 or proportion >= 1:
+        return points
+    index, residue = integer_interpolate(0, n_curves, proportion)
+    start = index * n_points_per_curve
+    result = points.copy()
+    if index < n_curves:
+        result[start:start + n_points_per_curve] = partial_bezier_points(
+            points[start:start + n_points_per_curve], 0, residue)
+        start += n_points_per_curve
+    result[start:] = result[start - 1] if start else points[0]
+    return result
+
+
+class GroupReveal(Animation):
+    """
+    Reveals many mobjects with staggered starts, like LaggedStart over
+    Create/Write/FadeIn, as one animation.
+
+        self.play(GroupReveal(*routers, lag_ratio=0.1))
+        self.play(GroupReveal(router, (label, "write"), (cloud, "fade"), lag_ratio=0.3, run_time=4))
+        self.play(GroupReveal(*bullets, style="fade", shift=RIGHT * 0.3, lag_ratio=0.5))
+
+    Args:
+        *items: Mobjects, or (mobject, style) pairs to override `style`.
+        style: Default style: "create", "write" or "fade".
+        lag_ratio: Start of each item after the previous one, in item durations.
+        shift: For "fade" items, the distance they travel while fading in.
+        item_rate_func: Rate function of every item (the group's own rate_func
+            maps time onto the whole schedule, linear by default as in LaggedStart).
+        run_time: Defaults to one second per item duration of the schedule,
+            as LaggedStart with one-second animations.
+    """
+    def __init__(self, *items, style: str = "create", lag_ratio: float = 0.3, shift=None,
+                 item_rate_func=smooth, run_time: float = None, rate_func=linear, **kwargs):
+        pairs = [item if isinstance(item, tuple) else (item, style) for item in items]
+        for _mobject, item_style in pairs:
+            if item_style not in STYLES:
+                raise ValueError(f"unknown reveal style {item_style!r}; expected one of {', '.join(STYLES)}")
+        self.items = [mobject for mobject, _style in pairs]
+        self.styles = [item_style for _mobject, item_style in pairs]
+        self.shift_vector = None if shift is None else np.asarray(shift, dtype=np.float64)
+        self.item_rate_func = item_rate_func
+        self.starts = np.arange(len(pairs)) * lag_ratio
+        self.span = (self.starts[-1] + 1) if len(pairs) else 1.0
+        super().__init__(Group(*self.items), run_time=self.span if run_time is None else run_time,
+                         rate_func=rate_func, introducer=True, **kwargs)
+
+    def create_starting_mobject(self):
+        return self.mobject  # no copy: every item keeps its own small restore state
+
+    def begin(self):
+        self.leaves = [item.family_members_with_points() for item in self.items]
+        self.originals = [
+            [(leaf.get_fill_opacity(), leaf.get_stroke_opacity(), leaf.get_stroke_width()) for leaf in leaves]
+            for leaves in self.leaves
+        ]
+        self.points = [None] * len(self.items)  # leaf points of items in flight
+        self.offsets = [0.0] * len(self.items)  # how far a fading item has travelled
+        self.phase = np.zeros(len(self.items), dtype=np.int8)  # 0 pending, 1 in flight, 2 done
+        for index in range(len(self.items)):
+            self._hide(index)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        progress = np.clip(alpha * self.span - self.starts, 0.0, 1.0)
+        target = np.where(progress <= 0, 0, np.where(progress >= 1, 2, 1))
+        for index in np.flatnonzero((target != self.phase) | (target == 1)).tolist():
+            if target[index] == 0:
+                self._restore(index)
+                self._hide(index)
+            elif target[index] == 2:
+                self._restore(index)
+            else:
+                if self.phase[index] != 1:
+                    self.points[index] = [leaf.points.copy() for leaf in self.leaves[index]]
+                self._draw(index, float(progress[index]))
+            self.phase[index] = target[index]
+
+    def _hide(self, index: int):
+        for leaf in self.leaves[index]:
+            leaf.set_fill(opacity=0, family=False)
+            leaf.set_stroke(opacity=0, family=False)
+
+    def _restore(self, index: int):
+        points = self.points[index]
+        for position, (leaf, (fill, stroke, width)) in enumerate(zip(self.leaves[index], self.originals[index])):
+            if points is not None:
+                leaf.set_points(points[position])
+            leaf.set_fill(opacity=fill, family=False)
+            leaf.set_stroke(width=width, opacity=stroke, family=False)
+        self.points[index] = None
+        self._move(index, 0.0)
+
+    def _move(self, index: int, remaining: float):
+        """Places a fading item `remaining` of its shift short of its final position."""
+        if self.shift_vector is None or self.styles[index] != "fade":
+            return
+        offset = -remaining
+        self.items[index].shift(self.shift_vector * (offset - self.offsets[index]))
+        self.offsets[index] = offset
+
+    def _draw(self, index: int, progress: float):
+        style, leaves, originals = self.styles[index], self.leaves[index], self.originals[index]
+        if style == "fade":
+            level = self.item_rate_func(progress)
+            for leaf, (fill, stroke, _width) in zip(leaves, originals):
+                leaf.set_fill(opacity=fill * level, family=False)
+                leaf.set_stroke(opacity=stroke * level, family=False)
+            self._move(index, 1 - level)
+            return
+        # Leaves of one item follow each other: fully (lag 1) for Create, overlapping for Write
+        count = len(leaves)
+        lag = 1.0 if style == "create" else min(4.0 / max(1.0, count), 0.2)
+        span = (count - 1) * lag + 1
+        for position, (leaf, points, (fill, stroke, width)) in enumerate(zip(leaves, self.points[index], originals)):
+            local = self.item_rate_func(float(np.clip(progress * span - position * lag, 0.0, 1.0)))
+            if style == "create":
+                leaf.set_points(_partial_points(points, leaf.n_points_per_curve, local))
+                leaf.set_fill(opacity=fill if local > 0 else 0, family=False)
+                leaf.set_stroke(opacity=stroke if local > 0 else 0, family=False)
+            elif local < 0.5:
+                # Write, first half: the outline is drawn
+                leaf.set_points(_partial_points(points, leaf.n_points_per_curve, 2 * local))
+                leaf.set_fill(opacity=0, family=False)
+                leaf.set_stroke(width=WRITE_STROKE_WIDTH, opacity=1 if local > 0 else 0, family=False)
+            else:
+                # Write, second half: the fill comes in and the outline settles
+                fill_level = 2 * local - 1
+                leaf.set_points(points)
+                leaf.set_fill(opacity=fill * fill_level, family=False)
+                leaf.set_stroke(width=WRITE_STROKE_WIDTH + (width - WRITE_STROKE_WIDTH) * fill_level,
+                                opacity=1 + (stroke - 1) * fill_level, family=False)
+
+
+def _benchmark(build, frames: int) -> tuple:
+    """Peak traced memory (bytes) and seconds of begin() plus `frames` interpolations."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    animation = build()
+    animation.begin()
+    for frame in range(1, frames + 1):
+        animation.interpolate(frame / frames)
+    animation.finish()
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+if __name__ == "__main__":
+    from manim import Create, LaggedStart
+
+    from l2vpn_elements import PROVIDER_COLOR, create_router
+
+    parser = argparse.ArgumentParser(description="Compare GroupReveal with LaggedStart on many routers.")
+    parser.add_argument("--routers", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--lag-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+
+    routers = [create_router(f"P{i + 1}", PROVIDER_COLOR).scale(0.2) for i in range(args.routers)]
+    for name, build in (
+        ("LaggedStart", lambda: LaggedStart(*[Create(router) for router in routers], lag_ratio=args.lag_ratio)),
+        ("GroupReveal", lambda: GroupReveal(*routers, lag_ratio=args.lag_ratio)),
+    ):
+        peak, elapsed = _benchmark(build, args.frames)
+        print(f"{name:12s} {args.routers} routers, {args.frames} frames: {elapsed:.2f}s, peak {peak / 2**20:.1f} MiB")
@@ -0,0 +1,123 @@
+import os
+import tempfile
+
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    Write,
+    FadeIn,
+    FadeOut,
+    ReplacementTransform,
+    UP,
+    DOWN,
+    LEFT,
+    YELLOW_C,
+    config,
+)
+
+# Project specific imports
+from l2vpn_elements import LABEL_COLOR
+from l2vpn_flow_scenes import create_full_l2vpn_packet
+from l2vpn_i18n import _
+from l2vpn_pcap import pseudowire_frame, pseudowire_packets, segment_texts, summarize, write_pcap
+from l2vpn_vpls import format_mac
+
+# Configure default font size for slides if needed
+config.font_size = 28
+
+CAPTURE_ENV = "L2VPN_PCAP"
+CAPTURE_PACKETS = 6
+CAPTURE_STACKS = 4
+# Stand-in capture when no file is given: (label stack outermost first, control word)
+SAMPLE_STACKS = [
+    ([16001, 300], True),
+    ([16001, 300], True),
+    ([16002, 301], True),
+    ([300], True),        # after PHP at the penultimate hop
+    ([16003, 17010, 302], True),
+    ([16001, 303], False),
+]
+SAMPLE_DST_MAC = 0x001B213A4C00  # Intel and VMware OUIs: MACs starting with a 0 nibble, as most do
+SAMPLE_SRC_MAC = 0x0050569C1E01
+
+
+def sample_capture(path):
+    """Writes a short capture of Ethernet pseudowire frames with SAMPLE_STACKS."""
+    frames = [
+        pseudowire_frame(labels, control_word, inner_dst=SAMPLE_DST_MAC + i, inner_src=SAMPLE_SRC_MAC)
+        for i, (labels, control_word) in enumerate(SAMPLE_STACKS)
+    ]
+    write_pcap(path, frames * 50, interval=0.0004)
+
+
+class CapturedPseudowireScene(Scene):
+    """
+    Steps through real pseudowire packets of a capture (the L2VPN_PCAP
+    environment variable, or a small generated one) with their label values.
+
+        L2VPN_PCAP=core.pcapng manim -pql l2vpn_capture_scene.py CapturedPseudowireScene
+    """
+    def construct(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.environ.get(CAPTURE_ENV)
+            if not path:
+                path = os.path.join(directory, "sample.pcap")
+                sample_capture(path)
+            summary = summarize(path)
+            packets = list(pseudowire_packets(path, CAPTURE_PACKETS))
+
+        title = Text(_("Captured Pseudowire Traffic"), font_size=40).to_edge(UP)
+        self.play(Write(title))
+        overview = Text(
+            _("{frames} frames, {pw} Ethernet pseudowire frames, {cw} with a control word").format(
+                frames=summary["frames"], pw=summary["ethernet_pw"], cw=summary["control_words"]),
+            font_size=22,
+        ).next_to(title, DOWN, buff=0.3)
+        self.play(FadeIn(overview))
+        self.wait(1)
+
+        if not packets:
+            self.play(Write(Text(_("No Ethernet pseudowire frames in this capture."), font_size=28)))
+            self.wait(2)
+            return
+
+        packet, caption = None, None
+        for index, captured in enumerate(packets):
+            next_packet = create_full_l2vpn_packet(**segment_texts(captured)).scale(0.8).shift(UP * 0.3)
+            next_caption = VGroup(
+                Text(_("Packet {index} at {time:.6f} s, {length} bytes").format(
+                    index=index + 1, time=captured["timestamp"], length=captured["length"]), font_size=22),
+                Text(_("Label stack: {labels}").format(labels=" | ".join(map(str, captured["labels"]))),
+                     font_size=20, color=LABEL_COLOR),
+                Text(f"{format_mac(captured['inner_src'])} -> {format_mac(captured['inner_dst'])}", font_size=20),
+            ).arrange(DOWN, buff=0.15).next_to(next_packet, DOWN, buff=0.5)
+            if packet is None:
+                self.play(FadeIn(next_packet), FadeIn(next_caption))
+            else:
+                self.play(ReplacementTransform(packet, next_packet), ReplacementTransform(caption, next_caption))
+            packet, caption = next_packet, next_caption
+            if len(captured["labels"]) == 1:
+                note = Text(_("Only the VC label is left: the transport label was popped (PHP)."),
+                            font_size=20, color=YELLOW_C).to_edge(DOWN)
+                self.play(FadeIn(note))
+                self.wait(1)
+                self.play(FadeOut(note))
+            else:
+                self.wait(1)
+        self.play(FadeOut(packet), FadeOut(caption))
+
+        # The busiest (T-label, VC-label) pairs of the whole capture
+        heading = Text(_("Busiest label pairs"), font_size=26).next_to(overview, DOWN, buff=0.5)
+        rows = VGroup(*[
+            Text(_("T-label {t}, VC-label {vc}: {frames} frames").format(
+                t=stack["t_label"] if stack["t_label"] is not None else "-", vc=stack["vc_label"],
+                frames=stack["frames"]), font_size=20)
+            for stack in summary["top_stacks"][:CAPTURE_STACKS]
+        ]).arrange(DOWN, buff=0.2, aligned_edge=LEFT).next_to(heading, DOWN, buff=0.3)
+        self.play(Write(heading))
+        self.play(FadeIn(rows, shift=UP * 0.2))
+        self.wait(3)
+
+# To run this scene:
+# manim -pql l2vpn_capture_scene.py CapturedPseudowireScene
@@ -7,10 +7,8 @@ from manim import (
     Dot,
     Create,
     Write,
-    FadeIn,
     FadeOut,
     MoveAlongPath,
-    LaggedStart,
     Arrow,
     UP,
     DOWN,
@@ -20,9 +18,11 @@ from manim import (
     WHITE,
     BLUE, # For signaling lines
     YELLOW_C, # For highlighting text
+    GREEN_C, # For the established tunnel
     config,
     Ellipse, # For provider cloud
     ShowPassingFlash,
+    Indicate,
 )
 
 # Project specific imports
@@ -31,6 +31,8 @@ from l2vpn_elements import (
     PROVIDER_COLOR,
     LABEL_COLOR,
 )
+from l2vpn_i18n import _
+from l2vpn_animations import GroupReveal
 
 # Configure default font size for slides if needed
 config.font_size = 32 # Slightly larger default for this conceptual scene
@@ -42,7 +44,7 @@ class L2VPNControlPlaneScene(Scene):
     """
     def construct(self):
         # Title
-        title = Text("L2 VPN Control Plane (Simplified)", font_size=44).to_edge(UP)
+        title = Text(_("L2 VPN Control Plane (Simplified)"), font_size=44).to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
@@ -57,15 +59,15 @@ class L2VPNControlPlaneScene(Scene):
         # Optional Provider Core (dimmed cloud)
         provider_core_cloud = Ellipse(width=4.5, height=2.0, color=PROVIDER_COLOR, fill_opacity=0.1)
         provider_core_cloud.move_to(ORIGIN + UP * 0.5)
-        provider_core_label = Text("Provider Core", font_size=20, color=PROVIDER_COLOR).move_to(provider_core_cloud.get_center())
+        provider_core_label = Text(_("Provider Core"), font_size=20, color=PROVIDER_COLOR).move_to(provider_core_cloud.get_center())
         core_group = VGroup(provider_core_cloud, provider_core_label).set_opacity(0.5)
 
 
         self.play(
-            LaggedStart(
-                Create(pe1),
-                Create(pe2),
-                FadeIn(core_group),
+            GroupReveal(
+                pe1,
+                pe2,
+                (core_group, "fade"),
                 lag_ratio=0.4
             )
         )
@@ -73,14 +75,14 @@ class L2VPNControlPlaneScene(Scene):
 
         # Explanatory Text (Part 1)
         text_intro_1 = Text(
-            "Before data can flow, Provider Edge (PE) routers must exchange information.",
+            _("Before data can flow, Provider Edge (PE) routers must exchange information."),
             font_size=28
         ).next_to(title, DOWN, buff=0.5)
         self.play(Write(text_intro_1))
         self.wait(0.5)
 
         text_intro_2 = Text(
-            "This is done via a Control Plane protocol (e.g., LDP, BGP).",
+            _("This is done via a Control Plane protocol (e.g., LDP, BGP)."),
             font_size=28
         ).next_to(text_intro_1, DOWN, buff=0.3)
         self.play(Write(text_intro_2))
@@ -115,14 +117,14 @@ class L2VPNControlPlaneScene(Scene):
 
 
         # Explanatory Text (Part 2)
-        text_agreement_intro = Text("They agree on:", font_size=28).next_to(text_intro_2, DOWN, buff=0.7)
+        text_agreement_intro = Text(_("They agree on:"), font_size=28).next_to(text_intro_2, DOWN, buff=0.7)
         text_agreement_intro.align_to(text_intro_1, LEFT)
         self.play(Write(text_agreement_intro))
         self.wait(0.3)
 
         bullet_points_text = [
-            "VC Labels (to identify the L2 VPN).",
-            "How to reach each other (establishing the MPLS tunnel).",
+            _("VC Labels (to identify the L2 VPN)."),
+            _("How to reach each other (establishing the MPLS tunnel)."),
         ]
         
         bullets = VGroup()
@@ -134,12 +136,12 @@ class L2VPNControlPlaneScene(Scene):
         
         bullets.arrange(DOWN, aligned_edge=LEFT, buff=0.25).next_to(text_agreement_intro, DOWN, buff=0.3, aligned_edge=LEFT)
 
-        self.play(LaggedStart(*[FadeIn(bullet, shift=RIGHT*0.3) for bullet in bullets], lag_ratio=0.5))
+        self.play(GroupReveal(*bullets, style="fade", shift=RIGHT*0.3, lag_ratio=0.5))
         self.wait(1)
 
         # Final Text
         text_pseudowire = Text(
-            "This sets up the 'pseudowire' or L2 VPN tunnel.",
+            _("This sets up the 'pseudowire' or L2 VPN tunnel."),
             font_size=28, color=YELLOW_C
         ).next_to(bullets, DOWN, buff=0.5)
         self.play(Write(text_pseudowire))
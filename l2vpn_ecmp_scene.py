@@ -0,0 +1,154 @@
+import numpy as np
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    VMobject,
+    Line,
+    Dot,
+    Create,
+    Write,
+    FadeIn,
+    FadeOut,
+    MoveAlongPath,
+    LaggedStart,
+    UP,
+    DOWN,
+    LEFT,
+    WHITE,
+    GREY_BROWN,
+    YELLOW_C,
+    TEAL_C,
+    GOLD_C,
+    RED_C,
+    MAROON_C,
+    PURPLE_C,
+    ORANGE,
+    linear,
+    config,
+)
+
+# Project specific imports
+from l2vpn_elements import (
+    create_router,
+    CUSTOMER_COLOR,
+    PROVIDER_COLOR,
+    PACKET_COLOR,
+)
+from l2vpn_i18n import _
+from l2vpn_ecmp import DEFAULT_METRIC, EcmpRoutes, build_graph, flow_hash
+
+# Configure default font size for slides if needed
+config.font_size = 28
+
+ECMP_ROWS, ECMP_COLS = 3, 4
+VISIBLE_FLOWS = 8
+COUNTED_FLOWS = 20000
+FLOW_COLORS = (PACKET_COLOR, TEAL_C, GOLD_C, RED_C, MAROON_C, PURPLE_C, ORANGE, CUSTOMER_COLOR)
+
+
+def create_ecmp_core(rows: int = ECMP_ROWS, cols: int = ECMP_COLS):
+    """
+    A rows x cols grid of P routers with PE1 at the top-left corner and PE2
+    at the bottom-right one, so every monotone path through the grid is an
+    equal-cost shortest path.
+
+    Returns:
+        (graph, PE1 node, PE2 node)
+    """
+    node = np.arange(rows * cols).reshape(rows, cols)
+    pe1, pe2 = rows * cols, rows * cols + 1
+    edges = np.concatenate([
+        np.stack([node[:, :-1].ravel(), node[:, 1:].ravel()], axis=1),
+        np.stack([node[:-1, :].ravel(), node[1:, :].ravel()], axis=1),
+        [(pe1, node[0, 0]), (node[-1, -1], pe2)],
+    ])
+    row, col = np.divmod(np.arange(rows * cols), cols)
+    positions = np.concatenate([np.stack([col, -row], axis=1), [(-1, 0), (cols, -(rows - 1))]])
+    return build_graph(positions, edges, np.full(len(edges), DEFAULT_METRIC)), pe1, pe2
+
+
+class ECMPSplitScene(Scene):
+    """
+    Equal-cost multi-path: flows between two PEs are hashed onto the many
+    shortest paths of a meshed core and split at every P router.
+    """
+    def construct(self):
+        title = Text(_("ECMP: Flows Split over Equal-Cost Paths"), font_size=40).to_edge(UP)
+        self.play(Write(title))
+
+        graph, pe1, pe2 = create_ecmp_core()
+        routes = EcmpRoutes(graph)
+        centers = [
+            np.array([x * 2.0, y * 1.5, 0.0]) + LEFT * 3.0 + UP * 1.0 for x, y in graph.positions.tolist()
+        ]
+        routers = VGroup(*[
+            create_router(f"P{node + 1}", PROVIDER_COLOR).scale(0.45).move_to(centers[node])
+            for node in range(pe1)
+        ])
+        pes = VGroup(
+            create_router("PE1", PROVIDER_COLOR).scale(0.55).move_to(centers[pe1]),
+            create_router("PE2", PROVIDER_COLOR).scale(0.55).move_to(centers[pe2]),
+        )
+        links = VGroup(*[
+            Line(centers[a], centers[b], color=WHITE, stroke_width=2) for a, b in graph.edges.tolist()
+        ])
+        links.set_z_index(-1)
+        self.play(Create(links), FadeIn(routers), FadeIn(pes))
+
+        paths = routes.path_count(pe1, pe2)
+        caption = Text(
+            _("Every link has metric {metric}: {paths} equal-cost paths from PE1 to PE2.").format(
+                metric=DEFAULT_METRIC, paths=paths),
+            font_size=24,
+        ).next_to(title, DOWN, buff=0.2)
+        self.play(Write(caption))
+        self.play(*[links[link].animate.set_stroke(color=YELLOW_C, width=4)
+                    for link in routes.path_links(pe1, pe2).tolist()])
+        self.wait(1)
+
+        hash_text = Text(
+            _("At every P router, a hash of the flow (MACs, VC label) picks one next hop."),
+            font_size=22,
+        ).to_edge(DOWN, buff=0.4)
+        self.play(FadeOut(caption), FadeIn(hash_text))
+
+        # Only the visible flows become mobjects; the walk itself is one array operation
+        flow_ids = np.arange(VISIBLE_FLOWS)
+        hashes = flow_hash(0x02005E000001 + flow_ids, 0x02005E001001 + flow_ids * 7, vc_label=300)
+        node_paths = routes.walk(np.full(VISIBLE_FLOWS, pe1), pe2, hashes)
+        dots, moves = VGroup(), []
+        for flow, color in zip(node_paths.tolist(), FLOW_COLORS):
+            track = VMobject().set_points_as_corners([centers[node] for node in flow if node >= 0])
+            dot = Dot(centers[pe1], color=color, radius=0.1)
+            dots.add(dot)
+            moves.append(MoveAlongPath(dot, track, rate_func=linear))
+        self.play(FadeIn(dots))
+        self.play(LaggedStart(*moves, lag_ratio=0.15), run_time=5)
+        self.wait(1)
+        self.play(FadeOut(dots))
+
+        # Many more flows: link width shows the share of flows that crossed it
+        flow_ids = np.arange(COUNTED_FLOWS)
+        hashes = flow_hash(0x02005E000001 + flow_ids, 0x02005E100001 + flow_ids * 7, vc_label=300)
+        node_paths = routes.walk(np.full(COUNTED_FLOWS, pe1), pe2, hashes)
+        edge_of = {(a, b): index for index, (a, b) in enumerate(graph.edges.tolist())}
+        hops = np.stack([node_paths[:, :-1].ravel(), node_paths[:, 1:].ravel()], axis=1)
+        hops = np.sort(hops[(hops >= 0).all(axis=1)], axis=1)
+        pairs, counts = np.unique(hops, axis=0, return_counts=True)
+        share = {edge_of[a, b]: count / COUNTED_FLOWS for (a, b), count in zip(pairs.tolist(), counts.tolist())}
+        share_text = Text(
+            _("{flows} flows: every router splits its flows evenly over its next hops.").format(flows=COUNTED_FLOWS),
+            font_size=22,
+        ).to_edge(DOWN, buff=0.4)
+        self.play(
+            FadeOut(hash_text), FadeIn(share_text),
+            *[links[link].animate.set_stroke(color=PACKET_COLOR, width=2 + 14 * fraction)
+              for link, fraction in share.items()],
+            *[links[link].animate.set_stroke(color=GREY_BROWN, width=2)
+              for link in range(len(links)) if link not in share],
+        )
+        self.wait(3)
+
+# To run this scene:
+# manim -pql l2vpn_ecmp_scene.py ECMPSplitScene
@@ -1,9 +1,6 @@
 from manim import (
     Scene,
-    Text,
-    Square,
     Circle,
-    Rectangle,
     VGroup,
     Create,
     FadeIn,
@@ -16,6 +13,10 @@ from manim import (
     ORIGIN,
 )
 
+# Project specific imports
+from l2vpn_labels import create_label
+from l2vpn_shapes import shared_rectangle, shared_square
+
 # Color Definitions
 CUSTOMER_COLOR = ManimColor("#007bff")  # A nice blue, similar to BLUE_C
 PROVIDER_COLOR = ManimColor("#28a745")  # A standard green, similar to GREEN_C
@@ -34,8 +35,8 @@ def create_router(label_text: str, color: ManimColor) -> VGroup:
     Returns:
         A VGroup representing the router.
     """
-    router_shape = Square(side_length=1.0, color=color, fill_color=color, fill_opacity=0.2)
-    router_label = Text(label_text, color=ManimColor("#FFFFFF"), font_size=24).move_to(router_shape.get_center())
+    router_shape = shared_square(1.0, color, fill_opacity=0.2)
+    router_label = create_label(label_text, 24, ManimColor("#FFFFFF")).move_to(router_shape.get_center())
     return VGroup(router_shape, router_label)
 
 # Packet Representation
@@ -49,8 +50,8 @@ def create_packet_representation(initial_text: str = "Packet") -> VGroup:
     Returns:
         A VGroup representing the packet.
     """
-    packet_shape = Rectangle(width=2.0, height=0.5, color=PACKET_COLOR, fill_color=PACKET_COLOR, fill_opacity=0.3)
-    packet_label = Text(initial_text, color=ManimColor("#000000"), font_size=20).move_to(packet_shape.get_center())
+    packet_shape = shared_rectangle(2.0, 0.5, PACKET_COLOR, fill_opacity=0.3)
+    packet_label = create_label(initial_text, 20, ManimColor("#000000")).move_to(packet_shape.get_center())
     return VGroup(packet_shape, packet_label)
 
 # Example Usage (can be removed or commented out later)
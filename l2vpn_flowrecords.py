@@ -0,0 +1,255 @@
+"""
+Per-link, per-time-bin load from large flow-record exports.
+
+A flow record says that `bytes` crossed `link` between `start` and `end`
+(seconds). Records are read in chunks and spread uniformly over the time bins
+they overlap, all vectorized:
+
+    one-bin flows     a single np.bincount into (link, bin)
+    longer flows      partial first and last bins by bincount, and the full
+                      bins in between as +rate/-rate steps in a difference
+                      matrix that one cumulative sum resolves at the end
+
+so memory is one chunk plus two (links x bins) matrices, whatever the number
+of records. The bin matrix grows in both directions as records arrive, so
+records need not be sorted.
+
+Two input formats:
+
+    CSV        header start,end,link,bytes; link is a name such as PE1:P1
+    columnar   a directory with start.npy, end.npy, link.npy (integer codes),
+               bytes.npy and links.json (code -> name), memory-mapped
+
+    python l2vpn_flowrecords.py synthesize flows/ --records 20000000
+    python l2vpn_flowrecords.py aggregate flows/ --bin 60 -o load.npz
+    L2VPN_LINK_LOAD=load.npz manim -pql l2vpn_utilization_scene.py LinkUtilizationScene
+"""
+import argparse
+import itertools
+import json
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_CHUNK = 1 << 20
+DEFAULT_BIN_SECONDS = 60.0
+DEFAULT_CAPACITY_BPS = 10e9
+CSV_DTYPE = np.dtype([("start", "f8"), ("end", "f8"), ("link", "U32"), ("bytes", "f8")])
+COLUMNS = ("start", "end", "link", "bytes")
+# The links of create_l2vpn_topology, in drawing order
+TOPOLOGY_LINKS = ("CE-A1:PE1", "PE1:P1", "P1:P2", "P2:PE2", "PE2:CE-B1")
+
+
+class LinkLoad(NamedTuple):
+    bin_seconds: float
+    origin: float  # start time of bin 0
+    link_names: list
+    bytes: np.ndarray  # (n_links, n_bins) float64 bytes per bin
+
+    def utilization(self, capacity_bps=DEFAULT_CAPACITY_BPS) -> np.ndarray:
+        """Average utilization per link and bin; `capacity_bps` is one value or one per link."""
+        capacity = np.asarray(capacity_bps, dtype=np.float64)
+        if capacity.ndim:
+            capacity = capacity[:, None]  # one capacity per link
+        return self.bytes * 8 / (self.bin_seconds * capacity)
+
+
+def read_chunks(path, chunk: int = DEFAULT_CHUNK):
+    """
+    Yields (start, end, link codes, bytes, link names) chunks of a CSV file or
+    columnar directory. Link codes index the names list, which grows as new
+    names appear and is shared by all chunks.
+    """
+    path = Path(path)
+    if path.is_dir():
+        names = json.loads((path / "links.json").read_text(encoding="utf-8"))
+        columns = [np.load(path / f"{column}.npy", mmap_mode="r") for column in COLUMNS]
+        for first in range(0, len(columns[0]), chunk):
+            start, end, link, size = (np.asarray(column[first:first + chunk]) for column in columns)
+            yield start, end, link.astype(np.int64), size.astype(np.float64), names
+        return
+    names, codes = [], {}
+    with open(path, encoding="utf-8") as records:
+        header = next(records).strip().split(",")
+        if header != list(COLUMNS):
+            raise ValueError(f"{path}: expected the header {','.join(COLUMNS)}, got {','.join(header)}")
+        while True:
+            lines = list(itertools.islice(records, chunk))
+            if not lines:
+                return
+            rows = np.atleast_1d(np.loadtxt(lines, delimiter=",", dtype=CSV_DTYPE))
+            chunk_names, inverse = np.unique(rows["link"], return_inverse=True)
+            for name in chunk_names.tolist():
+                if name not in codes:
+                    codes[name] = len(names)
+                    names.append(name)
+            mapping = np.array([codes[name] for name in chunk_names.tolist()], dtype=np.int64)
+            yield rows["start"], rows["end"], mapping[inverse], rows["bytes"], names
+
+
+class LoadAccumulator:
+    """Spreads chunks of flow records over (link, bin) cells; see the module docstring."""
+    def __init__(self, bin_seconds: float = DEFAULT_BIN_SECONDS):
+        self.bin_seconds = bin_seconds
+        self.first_bin = None  # absolute bin index of column 0
+        self.direct = np.zeros((0, 0))
+        self.steps = np.zeros((0, 1))  # one extra column for steps that end after the last bin
+        self.records = 0
+
+    def _fit(self, n_links: int, low: int, high: int):
+        """Grows both matrices to cover links < n_links and absolute bins low..high."""
+        if self.first_bin is None:
+            self.first_bin = low
+        rows, columns = self.direct.shape
+        left = max(self.first_bin - low, 0)
+        right = max(high - (self.first_bin + columns - 1), 0)
+        more_rows = max(n_links - rows, 0)
+        if left or right or more_rows:
+            self.direct = np.pad(self.direct, ((0, more_rows), (left, right)))
+            self.steps = np.pad(self.steps, ((0, more_rows), (left, right)))
+            self.first_bin -= left
+
+    def add(self, start: np.ndarray, end: np.ndarray, link: np.ndarray, size: np.ndarray, n_links: int):
+        if not len(start):
+            return
+        width = self.bin_seconds
+        end = np.maximum(end, start)
+        first = np.floor(start / width).astype(np.int64)
+        # A flow ending exactly on a bin edge does not touch the next bin.
+        last = np.maximum(np.ceil(end / width).astype(np.int64) - 1, first)
+        self._fit(n_links, int(first.min()), int(last.max()))
+        n_bins = self.direct.shape[1]
+        first -= self.first_bin
+        last -= self.first_bin
+        self.records += len(start)
+
+        single = first == last
+        cells = self.direct.size
+        self.direct += np.bincount(link[single] * n_bins + first[single], size[single], cells).reshape(self.direct.shape)
+
+        spread = ~single
+        if spread.any():
+            link, first, last = link[spread], first[spread], last[spread]
+            start, end = start[spread], end[spread]
+            rate = size[spread] / (end - start)
+            bin_start = (first + self.first_bin) * width
+            head = rate * (bin_start + width - start)
+            tail = rate * (end - (last + self.first_bin) * width)
+            self.direct += (np.bincount(link * n_bins + first, head, cells)
+                            + np.bincount(link * n_bins + last, tail, cells)).reshape(self.direct.shape)
+            # Full bins first+1 .. last-1 receive rate * width each.
+            inner = last - first > 1
+            step_columns = n_bins + 1
+            step_cells = self.steps.size
+            per_bin = rate[inner] * width
+            self.steps += (np.bincount(link[inner] * step_columns + first[inner] + 1, per_bin, step_cells)
+                           - np.bincount(link[inner] * step_columns + last[inner], per_bin, step_cells)
+                           ).reshape(self.steps.shape)
+
+    def result(self, names) -> LinkLoad:
+        loads = self.direct + np.cumsum(self.steps, axis=1)[:, :-1]
+        loads = np.pad(loads, ((0, len(names) - loads.shape[0]), (0, 0)))
+        origin = (self.first_bin or 0) * self.bin_seconds
+        return LinkLoad(self.bin_seconds, origin, list(names), loads)
+
+
+def aggregate(path, bin_seconds: float = DEFAULT_BIN_SECONDS, chunk: int = DEFAULT_CHUNK) -> LinkLoad:
+    """
+    Reads a flow-record file chunk by chunk into per-link, per-bin bytes.
+
+    Args:
+        path: CSV file or columnar directory (see the module docstring).
+        bin_seconds: Width of a time bin.
+        chunk: Records per chunk.
+
+    Returns:
+        A LinkLoad.
+    """
+    accumulator = LoadAccumulator(bin_seconds)
+    names = []
+    for start, end, link, size, names in read_chunks(path, chunk):
+        accumulator.add(start, end, link, size, len(names))
+    return accumulator.result(names)
+
+
+def save_load(path, load: LinkLoad):
+    np.savez_compressed(path, bin_seconds=load.bin_seconds, origin=load.origin,
+                        link_names=np.array(load.link_names), bytes=load.bytes)
+
+
+def load_load(path) -> LinkLoad:
+    with np.load(path) as data:
+        return LinkLoad(float(data["bin_seconds"]), float(data["origin"]), data["link_names"].tolist(), data["bytes"])
+
+
+def synthetic_records(n_records: int, links=TOPOLOGY_LINKS, duration: float = 86400.0,
+                      seed: int = 0) -> tuple:
+    """
+    A day of flow records with a daily cycle: busier links carry more flows,
+    flow sizes are heavy-tailed and most flows last seconds to minutes.
+
+    Returns:
+        (start, end, link codes, bytes) arrays.
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.linspace(1.0, 2.0, len(links))
+    weights /= weights.sum()
+    link = rng.choice(len(links), size=n_records, p=weights).astype(np.int16)
+    # Warping uniform start times concentrates flows around midday
+    phase = rng.random(n_records)
+    start = np.sort(duration * (phase + 0.15 * np.sin(2 * np.pi * phase) / (2 * np.pi)))
+    length = rng.lognormal(2.5, 1.2, size=n_records)
+    size = rng.pareto(1.2, size=n_records) * 2e5 + 64
+    return start, np.minimum(start + length, duration), link, size
+
+
+def write_columnar(directory, start, end, link, size, links):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for column, values in zip(COLUMNS, (start, end, link, size)):
+        np.save(directory / f"{column}.npy", values)
+    (directory / "links.json").write_text(json.dumps(list(links)), encoding="utf-8")
+
+
+def write_csv(path, start, end, link, size, links):
+    names = np.array(links)[link]
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(",".join(COLUMNS) + "\n")
+        for first in range(0, len(start), DEFAULT_CHUNK):
+            rows = slice(first, first + DEFAULT_CHUNK)
+            out.writelines(f"{s:.3f},{e:.3f},{name},{b:.0f}\n"
+                           for s, e, name, b in zip(start[rows].tolist(), end[rows].tolist(),
+                                                    names[rows].tolist(), size[rows].tolist()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate flow records into per-link utilization.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    synthesize = commands.add_parser("synthesize", help="write a synthetic day of flow records")
+    synthesize.add_argument("output", help="a .csv file, or a directory for the columnar format")
+    synthesize.add_argument("--records", type=int, default=1000000)
+    synthesize.add_argument("--seed", type=int, default=0)
+    aggregate_parser = commands.add_parser("aggregate", help="per-link, per-bin load of a flow-record file")
+    aggregate_parser.add_argument("input")
+    aggregate_parser.add_argument("-o", "--output", required=True, help=".npz file for the scene")
+    aggregate_parser.add_argument("--bin", type=float, default=DEFAULT_BIN_SECONDS, help="bin width in seconds")
+    aggregate_parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="records per chunk")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.command == "synthesize":
+        records = synthetic_records(args.records, seed=args.seed)
+        if args.output.endswith(".csv"):
+            write_csv(args.output, *records, TOPOLOGY_LINKS)
+        else:
+            write_columnar(args.output, *records, TOPOLOGY_LINKS)
+        print(f"{args.records} records written to {args.output} in {time.perf_counter() - started:.1f}s")
+    else:
+        load = aggregate(args.input, args.bin, args.chunk)
+        save_load(args.output, load)
+        peak = load.utilization().max(axis=1)
+        print(f"{len(load.link_names)} links x {load.bytes.shape[1]} bins in {time.perf_counter() - started:.1f}s")
+        for name, link_peak in zip(load.link_names, peak):
+            print(f"  {name}: peak {link_peak:.1%}")
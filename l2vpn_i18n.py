@@ -0,0 +1,134 @@
+"""
+Translation catalogs for the on-screen text of the scenes.
+
+Scenes wrap every explanatory string in _() where the Text is built:
+    title = Text(_("Packet Flow: Site A to PE1"), font_size=40)
+Storyboards (storyboards/*.yaml) contribute their title and captions.
+
+Catalogs live in locales/<code>.json and map each English source string to
+its translation. Missing or empty entries fall back to English, so a partly
+translated catalog still renders. Router names and label abbreviations
+(PE1, CE-A1, T-L1, VC-L, CW, ...) are deliberately left untranslated.
+
+The active locale comes from the L2VPN_LOCALE environment variable
+(default "en") or from set_locale().
+
+To refresh locales/messages.json and merge new strings into every catalog:
+    python l2vpn_i18n.py extract
+"""
+import ast
+import json
+import os
+import sys
+from pathlib import Path
+
+SOURCE_LOCALE = "en"
+LOCALE_DIR = Path(__file__).resolve().parent / "locales"
+TEMPLATE_FILE = LOCALE_DIR / "messages.json"
+
+_catalogs = {SOURCE_LOCALE: {}}
+_locale = os.environ.get("L2VPN_LOCALE", SOURCE_LOCALE)
+
+
+def available_locales() -> list:
+    """Returns the source locale followed by every locale that has a catalog."""
+    codes = sorted(path.stem for path in LOCALE_DIR.glob("*.json") if path != TEMPLATE_FILE)
+    return [SOURCE_LOCALE] + [code for code in codes if code != SOURCE_LOCALE]
+
+
+def load_catalog(code: str) -> dict:
+    """
+    Loads (and caches) the catalog of one locale.
+
+    Args:
+        code: Locale code, e.g. "de" or "pt_BR".
+
+    Returns:
+        A dict mapping English source strings to translations.
+    """
+    if code not in _catalogs:
+        path = LOCALE_DIR / f"{code}.json"
+        if not path.exists():
+            raise ValueError(f"No catalog for locale {code!r} in {LOCALE_DIR}")
+        with open(path, encoding="utf-8") as catalog:
+            _catalogs[code] = json.load(catalog)
+    return _catalogs[code]
+
+
+def set_locale(code: str):
+    """Switches the locale used by _() for every Text built from now on."""
+    global _locale
+    load_catalog(code)
+    _locale = code
+
+
+def get_locale() -> str:
+    return _locale
+
+
+def _(message: str) -> str:
+    """Translates `message` into the active locale, falling back to English."""
+    return load_catalog(_locale).get(message) or message
+
+
+def extract_messages(paths) -> list:
+    """
+    Collects the string literals passed to _() in the given source files,
+    and the titles and captions of the given storyboard files.
+
+    Returns:
+        The messages in first-seen order, without duplicates.
+    """
+    messages = {}
+    for path in paths:
+        if Path(path).suffix != ".py":
+            from l2vpn_storyboard import storyboard_messages
+            for message in storyboard_messages(path):
+                messages.setdefault(message, None)
+            continue
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+        found = [
+            node.args[0] for node in ast.walk(tree)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "_"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ]
+        for literal in sorted(found, key=lambda node: (node.lineno, node.col_offset)):
+            messages.setdefault(literal.value, None)
+    return list(messages)
+
+
+def update_catalogs(paths) -> list:
+    """
+    Rewrites locales/messages.json from the sources and merges it into every
+    existing catalog: new strings are added untranslated, translations of
+    strings that are no longer used are dropped.
+
+    Returns:
+        The extracted messages.
+    """
+    messages = extract_messages(paths)
+    LOCALE_DIR.mkdir(exist_ok=True)
+    _write_catalog(TEMPLATE_FILE, {message: "" for message in messages})
+    for code in available_locales()[1:]:
+        catalog = load_catalog(code)
+        _write_catalog(LOCALE_DIR / f"{code}.json", {message: catalog.get(message, "") for message in messages})
+    return messages
+
+
+def _write_catalog(path, catalog):
+    with open(path, "w", encoding="utf-8") as out:
+        json.dump(catalog, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["extract"]:
+        sys.exit("usage: python l2vpn_i18n.py extract")
+    from l2vpn_storyboard import storyboard_paths
+    sources = sorted(Path(__file__).resolve().parent.glob("*.py")) + storyboard_paths()
+    found = update_catalogs(sources)
+    print(f"{len(found)} messages, locales: {', '.join(available_locales())}")
@@ -26,6 +26,7 @@ from l2vpn_elements import (
     PROVIDER_COLOR,
     LABEL_COLOR,
 )
+from l2vpn_i18n import _
 
 # Configure default font size for slides if needed
 config.font_size = 36
@@ -38,22 +39,22 @@ class L2VPNIntroScene1(Scene):
     """
     def construct(self):
         # Title
-        title = Text("What is an L2 VPN?", font_size=48)
+        title = Text(_("What is an L2 VPN?"), font_size=48)
         title.to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
         # Bullet points
         bullet_points_text = [
-            "Connects geographically separate customer Layer 2 networks.",
-            "Uses a Service Provider's Layer 3 (MPLS) backbone.",
-            "Makes multiple sites appear as if they are on the same LAN.",
+            _("Connects geographically separate customer Layer 2 networks."),
+            _("Uses a Service Provider's Layer 3 (MPLS) backbone."),
+            _("Makes multiple sites appear as if they are on the same LAN."),
         ]
 
         bullets = VGroup()
         for i, point_text in enumerate(bullet_points_text):
             dot = Dot(radius=0.05).next_to(ORIGIN, LEFT, buff=0)
-            text = Text(point_text, font_size=32, PURE_BLACK=LABEL_COLOR).next_to(dot, RIGHT, buff=0.2) # Pure black for text
+            text = Text(point_text, font_size=32, color=LABEL_COLOR).next_to(dot, RIGHT, buff=0.2)
             bullet_item = VGroup(dot, text).scale(0.8) # Scale down for better fit
             bullets.add(bullet_item)
         
@@ -73,22 +74,22 @@ class L2VPNIntroScene2(Scene):
     """
     def construct(self):
         # Title
-        title = Text("Why use L2 VPNs?", font_size=48)
+        title = Text(_("Why use L2 VPNs?"), font_size=48)
         title.to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
         # Benefits bullet points
         benefits_text = [
-            "Simplicity for the customer (extends L2 domain easily).",
-            "Provider manages the complexity of the core network.",
-            "Cost-effective way to connect sites.",
+            _("Simplicity for the customer (extends L2 domain easily)."),
+            _("Provider manages the complexity of the core network."),
+            _("Cost-effective way to connect sites."),
         ]
 
         benefits_bullets = VGroup()
         for i, point_text in enumerate(benefits_text):
             dot = Dot(radius=0.05).next_to(ORIGIN, LEFT, buff=0)
-            text = Text(point_text, font_size=32, PURE_BLACK=LABEL_COLOR).next_to(dot, RIGHT, buff=0.2)
+            text = Text(point_text, font_size=32, color=LABEL_COLOR).next_to(dot, RIGHT, buff=0.2)
             benefit_item = VGroup(dot, text).scale(0.8)
             benefits_bullets.add(benefit_item)
         
@@ -103,17 +104,17 @@ class L2VPNIntroScene2(Scene):
         # Diagram elements
         # Customer Site A
         site_a_router = create_router("CE A", CUSTOMER_COLOR).scale(0.7)
-        site_a_label = Text("Customer Site A", font_size=24).next_to(site_a_router, DOWN, buff=0.2)
+        site_a_label = Text(_("Customer Site A"), font_size=24).next_to(site_a_router, DOWN, buff=0.2)
         site_a_group = VGroup(site_a_router, site_a_label).shift(LEFT * 4 + DOWN * 1.5)
 
         # Customer Site B
         site_b_router = create_router("CE B", CUSTOMER_COLOR).scale(0.7)
-        site_b_label = Text("Customer Site B", font_size=24).next_to(site_b_router, DOWN, buff=0.2)
+        site_b_label = Text(_("Customer Site B"), font_size=24).next_to(site_b_router, DOWN, buff=0.2)
         site_b_group = VGroup(site_b_router, site_b_label).shift(RIGHT * 4 + DOWN * 1.5)
 
         # Provider Cloud
         provider_cloud_shape = Ellipse(width=4.5, height=2.5, color=PROVIDER_COLOR, fill_color=PROVIDER_COLOR, fill_opacity=0.3)
-        provider_cloud_label = Text("Service Provider Network (MPLS)", font_size=24).move_to(provider_cloud_shape.get_center())
+        provider_cloud_label = Text(_("Service Provider Network (MPLS)"), font_size=24).move_to(provider_cloud_shape.get_center())
         provider_cloud_group = VGroup(provider_cloud_shape, provider_cloud_label).shift(UP * 1.0) # Shifted up slightly
 
         # Position diagram elements relative to text or screen center
@@ -0,0 +1,360 @@
+"""
+Label atlas: small repeated labels ("CW", "VC-L", "T-L1", "Eth Hdr", router
+names) drawn from pre-rasterized textures instead of Bézier glyph outlines.
+
+A Text label is one path per glyph, interpolated and filled curve by curve in
+every frame. In atlas mode, create_label() returns an AtlasLabel instead: a
+VMobject whose points are just its quad (four corners), so positioning,
+grouping, Transform, FadeIn and colors work as for any VMobject while an
+animation touches four points rather than hundreds. AtlasCamera draws it as
+an image quad:
+
+    atlas       one shared A8 (coverage only) surface, packed in shelves; an
+                entry is rasterized once per text, font size and scale step
+                (steps of 2^(1/4), always at or above the on-screen size, so the
+                texture is only ever sampled down) at the camera's resolution
+    drawing     the entry is mapped onto the label's quad by an affine matrix and
+                used as a mask for the label's fill color and opacity, so color
+                and opacity animations need no new rasterization
+    vectors     labels taller than ATLAS_MAX_PIXELS on screen (zoomed or scaled
+                up) are drawn from the glyph outlines of the cached template Text,
+                through the same matrix, so large text stays sharp
+
+Create and Write reveal an AtlasLabel with a left-to-right wipe; a Transform
+between two AtlasLabels cross-fades their textures over the moving quad.
+
+The mode is opt-in per render. Scenes derived from LabelScene use AtlasCamera
+when L2VPN_LABEL_MODE=atlas, and create_label() only returns AtlasLabels while
+such a scene is being constructed; everywhere else (other scenes, the OpenGL
+renderer, the frame tools) labels stay Text.
+
+    L2VPN_LABEL_MODE=atlas manim -pql l2vpn_flow_scenes.py PacketFlowScene_PE1_Encapsulation
+    python l2vpn_labels.py -q l                                  # vector vs atlas on the flow scenes
+    python l2vpn_labels.py PacketFlowScene_PE2_Decapsulation -q m --repeat 3
+"""
+import argparse
+import math
+import os
+import time
+from typing import NamedTuple
+
+import cairo
+import numpy as np
+from manim import DL, UR, Camera, Scene, Text, VMobject, WHITE, config, tempconfig
+
+LABEL_MODES = ("vector", "atlas")
+ATLAS_MAX_FONT_SIZE = 24  # only labels up to this font size go to the atlas
+ATLAS_MAX_PIXELS = 64  # on-screen label height above which glyph outlines are drawn
+ATLAS_WIDTH = 1024
+ATLAS_PAD = 1  # transparent pixels around every entry, so sampling never bleeds
+SCALE_STEPS_PER_OCTAVE = 4
+
+_templates = {}
+_atlas_labels = False
+
+
+def label_mode() -> str:
+    """The label mode requested by L2VPN_LABEL_MODE: "vector" (default) or "atlas"."""
+    mode = os.environ.get("L2VPN_LABEL_MODE", "vector")
+    if mode not in LABEL_MODES:
+        raise ValueError(f"L2VPN_LABEL_MODE must be one of {', '.join(LABEL_MODES)}, not {mode!r}")
+    return mode
+
+
+def label_template(text: str, font_size: float, font: str = "") -> Text:
+    """The white Text of a label, centered on the origin, shared by all its AtlasLabels (never modify it)."""
+    key = (text, font_size, font)
+    template = _templates.get(key)
+    if template is None:
+        template = _templates[key] = Text(text, font_size=font_size, font=font, color=WHITE).move_to([0, 0, 0])
+    return template
+
+
+def _bounds(template: Text) -> tuple:
+    """(left, right, bottom, top) of a template."""
+    (left, bottom, _), (right, top, _) = template.get_corner(DL), template.get_corner(UR)
+    return left, right, bottom, top
+
+
+def _trace(ctx: cairo.Context, template: Text):
+    """Adds the glyph outlines of a template to the current path, as Camera.set_cairo_context_path does."""
+    for glyph in template.family_members_with_points():
+        for subpath in glyph.gen_subpaths_from_points_2d(glyph.points):
+            ctx.new_sub_path()
+            ctx.move_to(*subpath[0][:2])
+            for _p0, p1, p2, p3 in glyph.gen_cubic_bezier_tuples_from_points(subpath):
+                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+            if glyph.consider_points_equals_2d(subpath[0], subpath[-1]):
+                ctx.close_path()
+
+
+class AtlasEntry(NamedTuple):
+    x: int  # position and size in the atlas, padding included
+    y: int
+    width: int
+    height: int
+    density: float  # texture pixels per scene unit of the template
+    left: float  # template point of the entry's top-left texture pixel
+    top: float
+
+
+class LabelAtlas:
+    """
+    Shelf-packed coverage textures of label templates in one A8 surface that
+    doubles its height when full.
+    """
+    def __init__(self, width: int = ATLAS_WIDTH, height: int = 256):
+        self.width = width
+        self.stride = cairo.ImageSurface.format_stride_for_width(cairo.FORMAT_A8, width)
+        self.pixels = np.zeros((height, self.stride), dtype=np.uint8)
+        self.entries = {}
+        self.shelf_y = self.shelf_height = self.cursor_x = 0
+        self._pattern = None
+
+    def entry(self, key: tuple, scale: float, density: float):
+        """
+        The entry of a template shown at `scale` times its size on a camera
+        with `density` pixels per unit, rasterized on first use.
+
+        Returns:
+            An AtlasEntry, or None when the texture would not fit the atlas width.
+        """
+        step = math.ceil(SCALE_STEPS_PER_OCTAVE * math.log2(max(scale, 1e-3)) - 1e-9)
+        entry_key = (key, step, round(density, 3))
+        if entry_key in self.entries:
+            return self.entries[entry_key]
+        raster_density = density * 2 ** (step / SCALE_STEPS_PER_OCTAVE)
+        texture, left, top = self._rasterize(label_template(*key), raster_density)
+        entry = self.entries[entry_key] = self._place(texture, raster_density, left, top)
+        return entry
+
+    def _rasterize(self, template: Text, density: float) -> tuple:
+        left, right, bottom, top = _bounds(template)
+        width = math.ceil((right - left) * density) + 2 * ATLAS_PAD
+        height = math.ceil((top - bottom) * density) + 2 * ATLAS_PAD
+        stride = cairo.ImageSurface.format_stride_for_width(cairo.FORMAT_A8, width)
+        texture = np.zeros((height, stride), dtype=np.uint8)
+        surface = cairo.ImageSurface.create_for_data(texture, cairo.FORMAT_A8, width, height, stride)
+        ctx = cairo.Context(surface)
+        origin_left, origin_top = left - ATLAS_PAD / density, top + ATLAS_PAD / density
+        ctx.set_matrix(cairo.Matrix(density, 0, 0, -density, -origin_left * density, origin_top * density))
+        _trace(ctx, template)
+        ctx.set_source_rgba(1, 1, 1, 1)
+        ctx.fill()
+        surface.flush()
+        return texture[:, :width], origin_left, origin_top
+
+    def _place(self, texture: np.ndarray, density: float, left: float, top: float):
+        height, width = texture.shape
+        if width > self.width:
+            return None
+        if self.cursor_x + width > self.width:
+            self.shelf_y += self.shelf_height
+            self.cursor_x = self.shelf_height = 0
+        while self.shelf_y + height > len(self.pixels):
+            self.pixels = np.concatenate([self.pixels, np.zeros_like(self.pixels)])
+            self._pattern = None
+        x, y = self.cursor_x, self.shelf_y
+        self.pixels[y:y + height, x:x + width] = texture
+        self.cursor_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        if self._pattern is not None:
+            self._pattern.get_surface().mark_dirty()
+        return AtlasEntry(x, y, width, height, density, left, top)
+
+    def pattern(self) -> cairo.SurfacePattern:
+        """The atlas as a mask pattern (recreated when the atlas grows)."""
+        if self._pattern is None:
+            surface = cairo.ImageSurface.create_for_data(
+                self.pixels, cairo.FORMAT_A8, self.width, len(self.pixels), self.stride)
+            self._pattern = cairo.SurfacePattern(surface)
+            self._pattern.set_filter(cairo.FILTER_GOOD)
+        return self._pattern
+
+
+LABEL_ATLAS = LabelAtlas()
+
+
+class AtlasLabel(VMobject):
+    """
+    A small text label drawn from the label atlas by AtlasCamera. Its points
+    are the corners of the text's bounding box (top-left, top-right, back,
+    bottom-left, back), which enclose no area, so a plain Camera draws nothing.
+    """
+    def __init__(self, text: str, font_size: float = ATLAS_MAX_FONT_SIZE, color=WHITE, font: str = "", **kwargs):
+        super().__init__(fill_color=color, fill_opacity=1.0, stroke_width=0, **kwargs)
+        self.original_text = text
+        self.key = (text, font_size, font)
+        self.reveal = (0.0, 1.0)  # shown part, left to right (Create, Write)
+        self.fade_key, self.fade = None, 0.0  # texture cross-faded to during a Transform
+        left, right, bottom, top = _bounds(label_template(*self.key))
+        self.set_points_as_corners([[left, top, 0], [right, top, 0], [left, top, 0], [left, bottom, 0], [left, top, 0]])
+        LABEL_ATLAS.entry(self.key, 1.0, config.pixel_width / config.frame_width)
+
+    def corners(self) -> tuple:
+        """Top-left, top-right and bottom-left corners of the quad."""
+        per_curve = self.n_points_per_curve
+        return self.points[0], self.points[per_curve - 1], self.points[3 * per_curve - 1]
+
+    def draw_state(self) -> tuple:
+        """What AtlasCamera draws besides points and colors (render_dirty tracks changes with it)."""
+        return self.key, self.reveal, self.fade_key, self.fade
+
+    def pointwise_become_partial(self, vmobject, a: float, b: float):
+        self.set_points(vmobject.points.copy())
+        self.reveal = (a, b)
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha: float):
+        super().interpolate_color(mobject1, mobject2, alpha)
+        if isinstance(mobject1, AtlasLabel) and isinstance(mobject2, AtlasLabel):
+            (a1, b1), (a2, b2) = mobject1.reveal, mobject2.reveal
+            self.reveal = (a1 + (a2 - a1) * alpha, b1 + (b2 - b1) * alpha)
+            if alpha >= 1 or mobject1.key == mobject2.key:
+                self.key, self.fade_key, self.fade = (mobject2.key if alpha >= 1 else mobject1.key), None, 0.0
+            else:
+                self.key, self.fade_key, self.fade = mobject1.key, mobject2.key, alpha
+
+
+class AtlasCamera(Camera):
+    """A Cairo camera that draws AtlasLabels from the label atlas."""
+    def display_vectorized(self, vmobject, ctx):
+        if isinstance(vmobject, AtlasLabel):
+            self.display_atlas_label(vmobject, ctx)
+            return self
+        return super().display_vectorized(vmobject, ctx)
+
+    def display_atlas_label(self, label: AtlasLabel, ctx: cairo.Context):
+        rgba = label.get_fill_rgbas()[0]
+        start, end = label.reveal
+        if rgba[3] <= 0 or end <= start:
+            return
+        top_left, top_right, bottom_left = label.corners()
+        layers = [(label.key, 1.0)] if label.fade_key is None else [
+            (label.key, 1.0 - label.fade), (label.fade_key, label.fade)]
+        density = self.pixel_width / self.frame_width
+        for key, weight in layers:
+            left, right, bottom, top = _bounds(label_template(*key))
+            width, height = right - left, top - bottom
+            across = (top_right - top_left)[:2] / width
+            down = (top_left - bottom_left)[:2] / height
+            scale = max(np.hypot(*across), np.hypot(*down))
+            if scale * height * density < 0.5:
+                continue  # collapsed, e.g. scaled to nothing
+            ctx.save()
+            # Template coordinates to scene coordinates
+            ctx.transform(cairo.Matrix(
+                across[0], across[1], down[0], down[1],
+                top_left[0] - left * across[0] - top * down[0], top_left[1] - left * across[1] - top * down[1]))
+            ctx.new_path()  # the camera leaves the last drawn path behind (fill_preserve)
+            if (start, end) != (0.0, 1.0):
+                ctx.rectangle(left + start * width, bottom - height, (end - start) * width, 3 * height)
+                ctx.clip()
+            ctx.set_source_rgba(*rgba[2::-1], rgba[3] * weight)  # reversed, as Camera does for its surface
+            entry = None
+            if scale * height * density <= ATLAS_MAX_PIXELS:
+                entry = LABEL_ATLAS.entry(key, scale, density)
+            if entry is None:
+                ctx.new_path()
+                _trace(ctx, label_template(*key))
+                ctx.fill()
+            else:
+                # Atlas pixels to template coordinates
+                ctx.transform(cairo.Matrix(1 / entry.density, 0, 0, -1 / entry.density, entry.left, entry.top))
+                ctx.translate(-entry.x, -entry.y)
+                ctx.new_path()
+                ctx.rectangle(entry.x, entry.y, entry.width, entry.height)
+                ctx.clip()
+                ctx.mask(LABEL_ATLAS.pattern())
+            ctx.restore()
+
+
+def set_atlas_labels(enabled: bool):
+    global _atlas_labels
+    _atlas_labels = enabled
+
+
+def create_label(text: str, font_size: float, color=WHITE):
+    """
+    A small label: an AtlasLabel while an atlas-mode LabelScene is being
+    constructed (and font_size <= ATLAS_MAX_FONT_SIZE), otherwise a Text.
+    """
+    if _atlas_labels and font_size <= ATLAS_MAX_FONT_SIZE:
+        return AtlasLabel(text, font_size=font_size, color=color)
+    return Text(text, font_size=font_size, color=color)
+
+
+class LabelScene(Scene):
+    """
+    A Scene whose small labels come from the label atlas when
+    L2VPN_LABEL_MODE=atlas (with the Cairo renderer).
+    """
+    def __init__(self, renderer=None, camera_class=None, **kwargs):
+        if camera_class is None:
+            camera_class = AtlasCamera if label_mode() == "atlas" else Camera
+        super().__init__(renderer=renderer, camera_class=camera_class, **kwargs)
+
+    def setup(self):
+        super().setup()
+        # The renderer decides: an injected renderer (render_frames, ...) brings its own camera
+        set_atlas_labels(isinstance(getattr(self.renderer, "camera", None), AtlasCamera))
+
+    def tear_down(self):
+        set_atlas_labels(False)
+        super().tear_down()
+
+
+def benchmark_scene(scene_class: type, camera_class: type, quality: str) -> tuple:
+    """
+    Renders a scene without encoding.
+
+    Returns:
+        (rasterized frames, total seconds, seconds spent rasterizing frames)
+    """
+    # The render tools import the scene modules, which import this one
+    from render_common import quality_settings
+    from render_frames import ArrayRenderer
+
+    settings = {
+        **quality_settings(quality),
+        "disable_caching": True,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "progress_bar": "none",
+    }
+    counts = {"frames": 0, "seconds": 0.0}
+    with tempconfig(settings):
+        renderer = ArrayRenderer(lambda scene, pixels: None, camera_class=camera_class)
+        update_frame = renderer.update_frame
+
+        def timed_update_frame(*args, **kwargs):
+            started = time.perf_counter()
+            update_frame(*args, **kwargs)
+            counts["seconds"] += time.perf_counter() - started
+            counts["frames"] += 1
+
+        renderer.update_frame = timed_update_frame
+        started = time.perf_counter()
+        scene_class(renderer=renderer).render()
+        return counts["frames"], time.perf_counter() - started, counts["seconds"]
+
+
+if __name__ == "__main__":
+    from render_common import load_scene_class, scene_classes
+
+    parser = argparse.ArgumentParser(description="Benchmark vector and atlas labels on the flow scenes.")
+    parser.add_argument("scenes", nargs="*", help="scene names in l2vpn_flow_scenes; default: all of them")
+    parser.add_argument("-q", "--quality", default="l", help="manim quality flag (l, m, h, p, k)")
+    parser.add_argument("--repeat", type=int, default=1, help="renders per mode; the fastest counts")
+    args = parser.parse_args()
+
+    classes = [load_scene_class("l2vpn_flow_scenes", name) for name in args.scenes] or scene_classes("l2vpn_flow_scenes")
+    print(f"{'scene':40s} {'mode':6s} {'frames':>6s} {'total s':>8s} {'raster s':>8s} {'ms/frame':>8s}")
+    for scene_class in classes:
+        for mode, camera_class in (("vector", Camera), ("atlas", AtlasCamera)):
+            frames, total, raster = min(
+                (benchmark_scene(scene_class, camera_class, args.quality) for _ in range(args.repeat)),
+                key=lambda result: result[1],
+            )
+            print(f"{scene_class.__name__:40s} {mode:6s} {frames:6d} {total:8.2f} {raster:8.2f} "
+                  f"{1000 * raster / max(frames, 1):8.2f}")
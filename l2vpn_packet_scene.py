@@ -28,6 +28,7 @@ from l2vpn_elements import (
     PACKET_COLOR, # General packet color, can be base for customer frame
     LABEL_COLOR,  # For MPLS labels
 )
+from l2vpn_i18n import _
 
 # Configure default font size for slides if needed
 config.font_size = 28 # Adjusted for potentially more text on screen
@@ -38,7 +39,7 @@ class L2VPNPacketStructureScene(Scene):
     """
     def construct(self):
         # Title
-        title = Text("L2 VPN Packet Structure", font_size=48).to_edge(UP)
+        title = Text(_("L2 VPN Packet Structure"), font_size=48).to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
@@ -48,8 +49,8 @@ class L2VPNPacketStructureScene(Scene):
         # --- 1. Customer Ethernet Frame ---
         # Define segments and their labels
         frame_segments_data = [
-            ("Dest MAC", 1.5), ("Src MAC", 1.5), ("VLAN (opt)", 1.0),
-            ("EtherType", 1.0), ("Payload", 2.5)
+            (_("Dest MAC"), 1.5), (_("Src MAC"), 1.5), (_("VLAN (opt)"), 1.0),
+            ("EtherType", 1.0), (_("Payload"), 2.5)
         ]
         
         customer_frame_parts = VGroup()
@@ -68,7 +69,7 @@ class L2VPNPacketStructureScene(Scene):
         
         # Brace for Customer Ethernet Frame
         brace_customer_frame = Brace(customer_frame_parts, direction=DOWN, buff=0.2)
-        label_customer_frame = brace_customer_frame.get_text("Customer Ethernet Frame", font_size=24)
+        label_customer_frame = brace_customer_frame.get_text(_("Customer Ethernet Frame"), font_size=24)
         self.play(Create(brace_customer_frame), Write(label_customer_frame))
         self.wait(1)
 
@@ -85,7 +86,7 @@ class L2VPNPacketStructureScene(Scene):
         # Position to the left of the customer frame
         control_word.next_to(customer_frame_parts, LEFT, buff=0)
         
-        cw_annotation_text = Text("Control Word (Optional: sequencing, OAM)", font_size=20)
+        cw_annotation_text = Text(_("Control Word (Optional: sequencing, OAM)"), font_size=20)
         cw_annotation_text.next_to(control_word, UP, buff=0.3)
 
         self.play(
@@ -101,12 +102,12 @@ class L2VPNPacketStructureScene(Scene):
         # --- 3. VC Label (Inner Label) ---
         vc_label_width = 1.0
         vc_label_rect = Rectangle(width=vc_label_width, height=0.8, color=LABEL_COLOR, fill_color=LABEL_COLOR, fill_opacity=0.6)
-        vc_label_text = Text("VC Label", font_size=18).move_to(vc_label_rect.get_center())
+        vc_label_text = Text(_("VC Label"), font_size=18).move_to(vc_label_rect.get_center())
         vc_label = VGroup(vc_label_rect, vc_label_text)
 
         vc_label.next_to(current_packet_visual, LEFT, buff=0) # Current packet visual now includes CW
         
-        vc_annotation_text = Text("VC Label (Identifies L2 VPN service)", font_size=20)
+        vc_annotation_text = Text(_("VC Label (Identifies L2 VPN service)"), font_size=20)
         vc_annotation_text.next_to(vc_label, UP, buff=0.3)
 
         self.play(
@@ -126,7 +127,7 @@ class L2VPNPacketStructureScene(Scene):
 
         transport_label.next_to(current_packet_visual, LEFT, buff=0)
 
-        t_annotation_text = Text("Transport Label (Provider core transit)", font_size=20)
+        t_annotation_text = Text(_("Transport Label (Provider core transit)"), font_size=20)
         t_annotation_text.next_to(transport_label, UP, buff=0.3)
         
         self.play(
@@ -169,7 +170,7 @@ class L2VPNPacketStructureScene(Scene):
         # Ensure the group for the brace is correctly formed from the items in current_packet_visual
         mpls_brace_group = VGroup(current_packet_visual.submobjects[0], current_packet_visual.submobjects[1])
         brace_mpls = Brace(mpls_brace_group, direction=UP, buff=0.2)
-        label_mpls = brace_mpls.get_text("MPLS Labels", font_size=24)
+        label_mpls = brace_mpls.get_text(_("MPLS Labels"), font_size=24)
         self.play(Create(brace_mpls), Write(label_mpls))
         self.wait(1)
         current_braces_labels.add(brace_mpls, label_mpls)
@@ -182,12 +183,12 @@ class L2VPNPacketStructureScene(Scene):
             width=provider_hdr_width, height=0.8, 
             color=PROVIDER_COLOR, fill_color=PROVIDER_COLOR, fill_opacity=0.4
         )
-        provider_header_text = Text("Provider L3/L2 Hdr", font_size=16).move_to(provider_header_rect.get_center())
+        provider_header_text = Text(_("Provider L3/L2 Hdr"), font_size=16).move_to(provider_header_rect.get_center())
         provider_header = VGroup(provider_header_rect, provider_header_text)
         
         provider_header.next_to(current_packet_visual, LEFT, buff=0)
 
-        prov_annotation_text = Text("Provider Network Header (e.g., MPLS, IP)", font_size=20)
+        prov_annotation_text = Text(_("Provider Network Header (e.g., MPLS, IP)"), font_size=20)
         prov_annotation_text.next_to(provider_header, UP, buff=0.3)
 
         self.play(
@@ -227,7 +228,7 @@ class L2VPNPacketStructureScene(Scene):
 
 
         brace_provider_hdr = Brace(provider_header, direction=UP, buff=0.2)
-        label_provider_hdr = brace_provider_hdr.get_text("Provider Encapsulation", font_size=24)
+        label_provider_hdr = brace_provider_hdr.get_text(_("Provider Encapsulation"), font_size=24)
         
         # Ensure annotations are not overlapping braces
         self.play(
@@ -0,0 +1,437 @@
+"""
+Streaming pcap/pcapng reader that decodes MPLS pseudowire label stacks.
+
+Captures are memory-mapped, never read whole: the record walk yields batches
+of (timestamp, offset, captured length), and every batch is decoded in NumPy
+from a fixed window at the start of each frame:
+
+    outer Ethernet      up to two VLAN tags (0x8100, 0x88a8) are skipped
+    MPLS label stack    EtherType 0x8847/0x8848; label, TC, S and TTL of up to
+                        MAX_LABELS entries
+    control word        RFC 4385, starting with a 0 nibble after the bottom of
+                        stack; inner MACs starting with a 0 nibble (00:1b:21,
+                        02:00:5e, ...) look the same, so by default ("auto") a
+                        0 nibble is a control word only when the frame parses as
+                        Ethernet with one and not without one, or parses both
+                        ways and its first 16 bits are zero (flags, fragment and
+                        length of an RFC 4448 control word; a MAC seldom starts
+                        00:00); "always" and "never" are for captures whose
+                        pseudowire configuration is known
+    inner Ethernet      destination, source and EtherType of the customer frame;
+                        a first nibble of 4 or 6 means IP over MPLS instead
+
+Decoded stacks map onto the packet segments of create_full_l2vpn_packet
+(segment_texts), so scenes can show the real T-label and VC-label values.
+summarize() walks multi-GB captures with bounded memory: per-batch arrays
+plus a capped table of the most frequent (T-label, VC-label) pairs.
+
+Supported: classic pcap (µs and ns, either byte order) and pcapng (SHB, IDB,
+EPB, SPB; other blocks are skipped), Ethernet link type only.
+
+    python l2vpn_pcap.py capture.pcapng               # summary
+    python l2vpn_pcap.py capture.pcap --show 10       # first 10 pseudowire packets
+"""
+import argparse
+import mmap
+import struct
+from collections import Counter
+from typing import NamedTuple
+
+import numpy as np
+
+LINKTYPE_ETHERNET = 1
+ETHERTYPE_VLAN = (0x8100, 0x88A8)
+ETHERTYPE_MPLS = (0x8847, 0x8848)
+MAX_LABELS = 8
+WINDOW = 14 + 8 + 4 * MAX_LABELS + 4 + 14  # outer Ethernet, 2 VLAN tags, labels, CW, inner Ethernet
+DEFAULT_BATCH = 65536
+DEFAULT_MAX_STACKS = 100000
+CONTROL_WORD_MODES = ("auto", "always", "never")
+ETHERTYPE_MIN = 0x0600  # smaller values are 802.3 lengths
+
+PCAP_MAGIC = {
+    b"\xd4\xc3\xb2\xa1": ("<", 1e-6),
+    b"\xa1\xb2\xc3\xd4": (">", 1e-6),
+    b"\x4d\x3c\xb2\xa1": ("<", 1e-9),
+    b"\xa1\xb2\x3c\x4d": (">", 1e-9),
+}
+PCAPNG_SHB = 0x0A0D0D0A
+PCAPNG_IDB, PCAPNG_SPB, PCAPNG_EPB = 1, 3, 6
+
+# Payload kinds after the label stack
+NOT_MPLS, ETHERNET_PW, IP_OVER_MPLS, TRUNCATED = range(4)
+
+
+class RecordBatch(NamedTuple):
+    timestamps: np.ndarray  # (n,) float64 seconds
+    offsets: np.ndarray  # (n,) int64 frame start in the file
+    lengths: np.ndarray  # (n,) int32 captured bytes
+    wire_lengths: np.ndarray  # (n,) int32 original bytes
+
+
+class DecodedBatch(NamedTuple):
+    timestamps: np.ndarray
+    wire_lengths: np.ndarray
+    kind: np.ndarray  # (n,) int8, NOT_MPLS / ETHERNET_PW / IP_OVER_MPLS / TRUNCATED
+    depth: np.ndarray  # (n,) int8 label stack depth
+    labels: np.ndarray  # (n, MAX_LABELS) int32, -1 past the bottom of stack
+    tc: np.ndarray  # (n, MAX_LABELS) int8
+    ttl: np.ndarray  # (n, MAX_LABELS) int16
+    control_word: np.ndarray  # (n,) bool
+    inner_dst: np.ndarray  # (n,) uint64 MAC, 0 unless ETHERNET_PW
+    inner_src: np.ndarray  # (n,) uint64
+    inner_ethertype: np.ndarray  # (n,) int32
+
+
+class CaptureReader:
+    """
+    Memory-maps one capture and yields its Ethernet records in batches.
+
+        with CaptureReader("core.pcapng") as capture:
+            for batch in capture.batches():
+                decoded = capture.decode(batch)
+    """
+    def __init__(self, path):
+        self.path = path
+        self.skipped_records = 0  # non-Ethernet interfaces and unknown blocks
+
+    def __enter__(self):
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = np.frombuffer(self._map, dtype=np.uint8)
+        magic = self._map[:4]
+        if magic in PCAP_MAGIC:
+            self.format = "pcap"
+        elif len(magic) == 4 and struct.unpack("<I", magic)[0] == PCAPNG_SHB:
+            self.format = "pcapng"
+        else:
+            self.__exit__(None, None, None)
+            raise ValueError(f"{self.path}: not a pcap or pcapng file")
+        return self
+
+    def __exit__(self, *exc_info):
+        self.data = None  # the view must go before the map can close
+        self._map.close()
+        self._file.close()
+        return False
+
+    # --- Record walk ---
+
+    def records(self):
+        """Yields (timestamp, offset, captured length, wire length) of every Ethernet frame."""
+        if self.format == "pcap":
+            yield from self._pcap_records()
+        else:
+            yield from self._pcapng_records()
+
+    def _pcap_records(self):
+        buffer = self._map
+        order, unit = PCAP_MAGIC[buffer[:4]]
+        linktype = struct.unpack_from(order + "I", buffer, 20)[0] & 0x0FFFFFFF
+        header = struct.Struct(order + "IIII")
+        position, end = 24, len(buffer)
+        ethernet = linktype == LINKTYPE_ETHERNET
+        while position + 16 <= end:
+            seconds, fraction, captured, wire = header.unpack_from(buffer, position)
+            position += 16
+            if ethernet:
+                yield seconds + fraction * unit, position, min(captured, end - position), wire
+            else:
+                self.skipped_records += 1
+            position += captured
+
+    def _pcapng_records(self):
+        buffer = self._map
+        position, end = 0, len(buffer)
+        order = "<"
+        interfaces = []  # (linktype, seconds per tick, snaplen)
+        while position + 12 <= end:
+            block_type = struct.unpack_from(order + "I", buffer, position)[0]
+            if block_type == PCAPNG_SHB:
+                order = "<" if struct.unpack_from("<I", buffer, position + 8)[0] == 0x1A2B3C4D else ">"
+                interfaces = []
+            block_length = struct.unpack_from(order + "I", buffer, position + 4)[0]
+            if block_length < 12:
+                raise ValueError(f"{self.path}: corrupt pcapng block at byte {position}")
+            body = position + 8
+            if block_type == PCAPNG_IDB:
+                linktype, _reserved, snaplen = struct.unpack_from(order + "HHI", buffer, body)
+                interfaces.append((linktype, self._tick(buffer, order, body + 8, position + block_length - 4), snaplen))
+            elif block_type == PCAPNG_EPB:
+                interface, high, low, captured, wire = struct.unpack_from(order + "IIIII", buffer, body)
+                linktype, tick, _snaplen = interfaces[interface]
+                if linktype == LINKTYPE_ETHERNET:
+                    yield ((high << 32) | low) * tick, body + 20, captured, wire
+                else:
+                    self.skipped_records += 1
+            elif block_type == PCAPNG_SPB:
+                wire = struct.unpack_from(order + "I", buffer, body)[0]
+                linktype, _tick, snaplen = interfaces[0]
+                if linktype == LINKTYPE_ETHERNET:
+                    yield 0.0, body + 4, min(wire, snaplen or wire, block_length - 16), wire
+                else:
+                    self.skipped_records += 1
+            elif block_type != PCAPNG_SHB:
+                self.skipped_records += 1
+            position += block_length
+
+    @staticmethod
+    def _tick(buffer, order, position, end) -> float:
+        """Seconds per timestamp unit from the if_tsresol option (default µs)."""
+        while position + 4 <= end:
+            code, length = struct.unpack_from(order + "HH", buffer, position)
+            if code == 0:
+                break
+            if code == 9 and length >= 1:
+                resolution = buffer[position + 4]
+                return 2.0 ** -(resolution & 0x7F) if resolution & 0x80 else 10.0 ** -resolution
+            position += 4 + (length + 3) // 4 * 4
+        return 1e-6
+
+    def batches(self, size: int = DEFAULT_BATCH):
+        """Groups records() into RecordBatches of up to `size` frames."""
+        timestamps, offsets, lengths, wire_lengths = [], [], [], []
+        for timestamp, offset, length, wire in self.records():
+            timestamps.append(timestamp)
+            offsets.append(offset)
+            lengths.append(length)
+            wire_lengths.append(wire)
+            if len(offsets) == size:
+                yield _record_batch(timestamps, offsets, lengths, wire_lengths)
+                timestamps, offsets, lengths, wire_lengths = [], [], [], []
+        if offsets:
+            yield _record_batch(timestamps, offsets, lengths, wire_lengths)
+
+    # --- Decoding ---
+
+    def decode(self, batch: RecordBatch, control_word: str = "auto") -> DecodedBatch:
+        """
+        Decodes the headers of every frame of `batch` at once.
+
+        Args:
+            control_word: "auto" (detect per frame), "always" or "never".
+        """
+        if control_word not in CONTROL_WORD_MODES:
+            raise ValueError(f"control_word must be one of {', '.join(CONTROL_WORD_MODES)}, not {control_word!r}")
+        n = len(batch.offsets)
+        columns = np.arange(WINDOW)
+        index = batch.offsets[:, None] + columns
+        window = self.data[np.minimum(index, len(self.data) - 1)].astype(np.int64)
+        window[columns[None, :] >= batch.lengths[:, None]] = 0  # bytes past the captured length
+        rows = np.arange(n)
+
+        def u16(position):
+            position = np.minimum(position, WINDOW - 2)
+            return (window[rows, position] << 8) | window[rows, position + 1]
+
+        def u32(position):
+            return (u16(position) << 16) | u16(position + 2)
+
+        def u48(position):
+            return (u16(position) << 32) | u32(position + 2)
+
+        position = np.full(n, 12)
+        ethertype = u16(position)
+        for _tag in range(2):
+            tagged = np.isin(ethertype, ETHERTYPE_VLAN)
+            position = position + 4 * tagged
+            ethertype = u16(position)
+        is_mpls = np.isin(ethertype, ETHERTYPE_MPLS)
+        position = position + 2
+
+        labels = np.full((n, MAX_LABELS), -1, dtype=np.int32)
+        tc = np.zeros((n, MAX_LABELS), dtype=np.int8)
+        ttl = np.zeros((n, MAX_LABELS), dtype=np.int16)
+        depth = np.zeros(n, dtype=np.int8)
+        active = is_mpls & (position + 4 <= batch.lengths)
+        for level in range(MAX_LABELS):
+            entry = u32(position)
+            labels[active, level] = entry[active] >> 12
+            tc[active, level] = (entry[active] >> 9) & 0x7
+            ttl[active, level] = entry[active] & 0xFF
+            depth += active
+            position = position + 4 * active
+            active &= ((entry >> 8) & 1) == 0
+            active &= position + 4 <= batch.lengths
+
+        first_nibble = window[rows, np.minimum(position, WINDOW - 1)] >> 4
+        complete = is_mpls & (depth > 0) & (labels[rows, np.maximum(depth - 1, 0)] >= 0) & ~active
+        bottom_ok = complete & (position < batch.lengths)
+        if control_word == "always":
+            has_cw = bottom_ok
+        elif control_word == "never":
+            has_cw = np.zeros(n, dtype=bool)
+        else:
+            ethernet_with_cw = u16(position + 16) >= ETHERTYPE_MIN
+            ethernet_without_cw = u16(position + 12) >= ETHERTYPE_MIN
+            has_cw = bottom_ok & (first_nibble == 0) & ethernet_with_cw & (~ethernet_without_cw | (u16(position) == 0))
+        inner = position + 4 * has_cw
+        ip = bottom_ok & ~has_cw & np.isin(first_nibble, (4, 6))
+        ethernet_pw = bottom_ok & ~ip & (inner + 14 <= batch.lengths)
+        kind = np.where(is_mpls, TRUNCATED, NOT_MPLS).astype(np.int8)
+        kind[ip] = IP_OVER_MPLS
+        kind[ethernet_pw] = ETHERNET_PW
+        return DecodedBatch(
+            timestamps=batch.timestamps,
+            wire_lengths=batch.wire_lengths,
+            kind=kind,
+            depth=depth,
+            labels=labels,
+            tc=tc,
+            ttl=ttl,
+            control_word=has_cw & ethernet_pw,
+            inner_dst=np.where(ethernet_pw, u48(inner), 0).astype(np.uint64),
+            inner_src=np.where(ethernet_pw, u48(inner + 6), 0).astype(np.uint64),
+            inner_ethertype=np.where(ethernet_pw, u16(inner + 12), 0).astype(np.int32),
+        )
+
+
+def _record_batch(timestamps, offsets, lengths, wire_lengths) -> RecordBatch:
+    return RecordBatch(
+        np.array(timestamps, dtype=np.float64),
+        np.array(offsets, dtype=np.int64),
+        np.array(lengths, dtype=np.int32),
+        np.array(wire_lengths, dtype=np.int32),
+    )
+
+
+def pseudowire_packets(path, limit: int = None, control_word: str = "auto"):
+    """
+    Yields one dict per Ethernet-over-MPLS frame of a capture, in order:
+    timestamp, labels (outermost first), control_word, inner_src, inner_dst,
+    inner_ethertype and length. `control_word` is passed to CaptureReader.decode().
+    """
+    produced = 0
+    with CaptureReader(path) as capture:
+        for batch in capture.batches():
+            decoded = capture.decode(batch, control_word)
+            for row in np.flatnonzero(decoded.kind == ETHERNET_PW).tolist():
+                yield {
+                    "timestamp": float(decoded.timestamps[row]),
+                    "labels": decoded.labels[row, :decoded.depth[row]].tolist(),
+                    "control_word": bool(decoded.control_word[row]),
+                    "inner_src": int(decoded.inner_src[row]),
+                    "inner_dst": int(decoded.inner_dst[row]),
+                    "inner_ethertype": int(decoded.inner_ethertype[row]),
+                    "length": int(decoded.wire_lengths[row]),
+                }
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+
+
+def segment_texts(packet: dict) -> dict:
+    """
+    Keyword arguments for create_full_l2vpn_packet that show a decoded packet:
+    the outermost label as the transport label (none after PHP, when only the
+    VC label is left), the bottom label as the VC label, and the control word
+    only when present.
+    """
+    labels = packet["labels"]
+    return {
+        "t_label_text": f"T-L {labels[0]}" if len(labels) > 1 else None,
+        "vc_label_text": f"VC-L {labels[-1]}",
+        "control_word": packet["control_word"],
+    }
+
+
+def summarize(path, max_stacks: int = DEFAULT_MAX_STACKS, batch_size: int = DEFAULT_BATCH,
+              control_word: str = "auto") -> dict:
+    """
+    Summarizes a capture of any size with bounded memory.
+
+    The (T-label, VC-label) table keeps at most `max_stacks` pairs; when it
+    overflows, the least frequent half is dropped (and counted), so the
+    heavy hitters survive. `control_word` is passed to CaptureReader.decode().
+    """
+    frames = bytes_on_wire = 0
+    kinds = np.zeros(4, dtype=np.int64)
+    depths = np.zeros(MAX_LABELS + 1, dtype=np.int64)
+    control_words = 0
+    ethertypes = Counter()
+    stacks = Counter()
+    dropped = 0
+    first = last = None
+    with CaptureReader(path) as capture:
+        for batch in capture.batches(batch_size):
+            decoded = capture.decode(batch, control_word)
+            frames += len(batch.offsets)
+            bytes_on_wire += int(batch.wire_lengths.sum())
+            kinds += np.bincount(decoded.kind, minlength=4)
+            depths += np.bincount(decoded.depth, minlength=MAX_LABELS + 1)
+            first = float(batch.timestamps[0]) if first is None else first
+            last = float(batch.timestamps[-1])
+            pw = decoded.kind == ETHERNET_PW
+            control_words += int(decoded.control_word.sum())
+            values, counts = np.unique(decoded.inner_ethertype[pw], return_counts=True)
+            ethertypes.update(dict(zip(values.tolist(), counts.tolist())))
+            top = np.where(decoded.depth[pw] > 1, decoded.labels[pw, 0], -1).astype(np.int64)
+            bottom = decoded.labels[pw][np.arange(int(pw.sum())), decoded.depth[pw] - 1].astype(np.int64)
+            keys, counts = np.unique((top + 1) << 20 | bottom, return_counts=True)
+            stacks.update(dict(zip(keys.tolist(), counts.tolist())))
+            if len(stacks) > max_stacks:
+                kept = stacks.most_common(max_stacks // 2)
+                dropped += sum(stacks.values()) - sum(count for _key, count in kept)
+                stacks = Counter(dict(kept))
+        skipped = capture.skipped_records
+    return {
+        "frames": frames,
+        "bytes": bytes_on_wire,
+        "duration": (last - first) if frames else 0.0,
+        "not_mpls": int(kinds[NOT_MPLS]),
+        "ethernet_pw": int(kinds[ETHERNET_PW]),
+        "ip_over_mpls": int(kinds[IP_OVER_MPLS]),
+        "truncated": int(kinds[TRUNCATED]),
+        "label_depths": {depth: int(count) for depth, count in enumerate(depths) if count and depth},
+        "control_words": control_words,
+        "inner_ethertypes": {f"0x{ethertype:04x}": count for ethertype, count in ethertypes.most_common()},
+        "top_stacks": [
+            {"t_label": (key >> 20) - 1 if key >> 20 else None, "vc_label": key & 0xFFFFF, "frames": count}
+            for key, count in stacks.most_common(20)
+        ],
+        "stack_frames_dropped": dropped,
+        "skipped_records": skipped,
+    }
+
+
+# --- Writing small captures (demos and fixtures) ---
+
+def pseudowire_frame(labels, control_word: bool = True, inner_dst: int = 0x02005E000002,
+                     inner_src: int = 0x02005E000001, payload: bytes = b"\x00" * 46,
+                     outer_dst: int = 0x02000000000B, outer_src: int = 0x02000000000A, ttl: int = 64) -> bytes:
+    """Builds an Ethernet/MPLS/(CW)/Ethernet frame with the given label stack, outermost first."""
+    frame = outer_dst.to_bytes(6, "big") + outer_src.to_bytes(6, "big") + struct.pack(">H", ETHERTYPE_MPLS[0])
+    for level, label in enumerate(labels):
+        bottom = 1 if level == len(labels) - 1 else 0
+        frame += struct.pack(">I", (label << 12) | (bottom << 8) | ttl)
+    if control_word:
+        frame += b"\x00\x00\x00\x00"
+    return frame + inner_dst.to_bytes(6, "big") + inner_src.to_bytes(6, "big") + struct.pack(">H", 0x0800) + payload
+
+
+def write_pcap(path, frames, start: float = 0.0, interval: float = 0.001):
+    """Writes `frames` (bytes) to a classic little-endian µs pcap file."""
+    with open(path, "wb") as out:
+        out.write(struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, LINKTYPE_ETHERNET))
+        for index, frame in enumerate(frames):
+            timestamp = start + index * interval
+            seconds = int(timestamp)
+            out.write(struct.pack("<IIII", seconds, int(round((timestamp - seconds) * 1e6)), len(frame), len(frame)))
+            out.write(frame)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize MPLS pseudowire traffic in a pcap/pcapng capture.")
+    parser.add_argument("capture")
+    parser.add_argument("--show", type=int, default=0, help="also print the first N pseudowire packets")
+    parser.add_argument("--max-stacks", type=int, default=DEFAULT_MAX_STACKS)
+    parser.add_argument("--control-word", choices=CONTROL_WORD_MODES, default="auto",
+                        help="whether pseudowire frames carry a control word (default: detect)")
+    args = parser.parse_args()
+
+    summary = summarize(args.capture, args.max_stacks, control_word=args.control_word)
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+    for packet in pseudowire_packets(args.capture, args.show, args.control_word) if args.show else ():
+        print(packet["timestamp"], packet["labels"], "CW" if packet["control_word"] else "no CW",
+              f"{packet['inner_src']:012x} -> {packet['inner_dst']:012x}", packet["length"])
@@ -0,0 +1,198 @@
+"""
+Router and packet-segment shapes with shared, copy-on-write point arrays.
+
+A Square or Rectangle builds its points from scratch (corners, handles, two
+stretches), and every .copy() duplicates them. The shapes here are copies of
+one cached prototype per size and style, and all copies point at the
+prototype's read-only point array until one of them is changed:
+
+    construction    a deep copy of the prototype: no point generation, and the
+                    points array is not copied (only the small style arrays are)
+    .copy()         the copy shares the array too
+    writes          the shared array is a SharedPoints, whose augmented assignment
+                    (points += v, points -= v, ...) returns a new private array
+                    instead of writing into it; that is how Mobject.shift and
+                    apply_points_function_about_point (scale, rotate, stretch,
+                    flip, apply_matrix, ...) change every family member, so
+                    transforming the shape or any group around it leaves the
+                    other copies alone
+    set_points      a read-only (shared) array is taken over as is, so Create and
+                    Transform hand the shared array back when they finish
+
+Code that writes into .points by item assignment must call own_points() first
+(in manim 0.18 only Wiggle does, and no scene here uses it). With the OpenGL
+renderer, whose mobjects keep points elsewhere, the factories return plain
+Squares and Rectangles.
+
+    python l2vpn_shapes.py --routers 2000 --copies 5     # allocations: shared vs plain shapes
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from manim import ManimColor, Rectangle, Square, config
+from manim.constants import RendererType
+
+_prototypes = {}
+
+
+class SharedPoints(np.ndarray):
+    """
+    A read-only points array shared between shapes. In-place arithmetic on it
+    returns a new plain array instead of raising; ufunc results and copies are
+    plain arrays too, so nothing derived from it is shared by accident.
+    """
+    def _augmented(self, ufunc, other):
+        array = self.view(np.ndarray)
+        if array.flags.writeable:
+            return ufunc(array, other, out=array)
+        return ufunc(array, other)
+
+    def __iadd__(self, other):
+        return self._augmented(np.add, other)
+
+    def __isub__(self, other):
+        return self._augmented(np.subtract, other)
+
+    def __imul__(self, other):
+        return self._augmented(np.multiply, other)
+
+    def __itruediv__(self, other):
+        return self._augmented(np.true_divide, other)
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        array = array.view(np.ndarray)
+        return array[()] if return_scalar else array
+
+    def copy(self, order="C"):
+        return np.array(self, order=order)
+
+
+class SharedPointsMixin:
+    """
+    Copy-on-write points for a VMobject subclass (Cairo renderer). The array
+    stays in the instance __dict__ under "points", where the render tools
+    (render_pipeline snapshots, render_memory accounting) look for it.
+    """
+    @property
+    def points(self):
+        return self.__dict__["points"]
+
+    @points.setter
+    def points(self, value):
+        self.__dict__["points"] = value
+
+    def points_shared(self) -> bool:
+        return not self.points.flags.writeable
+
+    def share_points(self):
+        """Makes the current points read-only, so copies share them."""
+        self.points = np.array(self.points, dtype=np.float64).view(SharedPoints)
+        self.points.flags.writeable = False
+        return self
+
+    def own_points(self):
+        """Replaces shared points with a private, writable copy."""
+        if self.points_shared():
+            self.points = np.array(self.points)
+        return self
+
+    def set_points(self, points):
+        if isinstance(points, np.ndarray) and not points.flags.writeable:
+            self.points = points
+            return self
+        return super().set_points(points)
+
+    def __deepcopy__(self, clone_from_id):
+        if self.points_shared():
+            clone_from_id[id(self.points)] = self.points  # deepcopy hands the same array back
+        return super().__deepcopy__(clone_from_id)
+
+
+class SharedSquare(SharedPointsMixin, Square):
+    pass
+
+
+class SharedRectangle(SharedPointsMixin, Rectangle):
+    pass
+
+
+def _from_prototype(key: tuple, build):
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = _prototypes[key] = build().share_points()
+    return prototype.copy()
+
+
+def _style_key(color, fill_color, fill_opacity: float) -> tuple:
+    fill_color = color if fill_color is None else fill_color
+    return ManimColor(color).to_hex(), ManimColor(fill_color).to_hex(), float(fill_opacity)
+
+
+def shared_square(side_length: float, color, fill_color=None, fill_opacity: float = 0.0) -> Square:
+    """
+    A Square(side_length=..., color=..., fill_color=..., fill_opacity=...)
+    sharing its points with every other square of the same size and style.
+    """
+    fill_color = color if fill_color is None else fill_color
+    if config.renderer == RendererType.OPENGL:
+        return Square(side_length=side_length, color=color, fill_color=fill_color, fill_opacity=fill_opacity)
+    return _from_prototype(
+        ("square", float(side_length), *_style_key(color, fill_color, fill_opacity)),
+        lambda: SharedSquare(side_length=side_length, color=color, fill_color=fill_color, fill_opacity=fill_opacity),
+    )
+
+
+def shared_rectangle(width: float, height: float, color, fill_color=None, fill_opacity: float = 0.0) -> Rectangle:
+    """
+    A Rectangle(width=..., height=..., color=..., fill_color=..., fill_opacity=...)
+    sharing its points with every other rectangle of the same size and style.
+    """
+    fill_color = color if fill_color is None else fill_color
+    if config.renderer == RendererType.OPENGL:
+        return Rectangle(width=width, height=height, color=color, fill_color=fill_color, fill_opacity=fill_opacity)
+    return _from_prototype(
+        ("rectangle", float(width), float(height), *_style_key(color, fill_color, fill_opacity)),
+        lambda: SharedRectangle(width=width, height=height, color=color, fill_color=fill_color,
+                                fill_opacity=fill_opacity),
+    )
+
+
+def _measure(build, copies: int) -> tuple:
+    """Peak traced memory (bytes) and seconds of build() plus `copies` copies of its result."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    shapes = build()
+    kept = [[shape.copy() for shape in shapes] for _ in range(copies)]
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak, elapsed
+
+
+if __name__ == "__main__":
+    from l2vpn_elements import LABEL_COLOR, PROVIDER_COLOR
+
+    parser = argparse.ArgumentParser(description="Compare shared and plain router/segment shapes.")
+    parser.add_argument("--routers", type=int, default=1000)
+    parser.add_argument("--copies", type=int, default=3, help="copies of every shape, as variant jobs make")
+    args = parser.parse_args()
+
+    def plain():
+        return [shape for _ in range(args.routers) for shape in (
+            Square(side_length=1.0, color=PROVIDER_COLOR, fill_color=PROVIDER_COLOR, fill_opacity=0.2),
+            Rectangle(width=0.8, height=0.5, color=LABEL_COLOR, fill_color=LABEL_COLOR, fill_opacity=0.7),
+        )]
+
+    def shared():
+        return [shape for _ in range(args.routers) for shape in (
+            shared_square(1.0, PROVIDER_COLOR, fill_opacity=0.2),
+            shared_rectangle(0.8, 0.5, LABEL_COLOR, fill_opacity=0.7),
+        )]
+
+    for name, build in (("plain", plain), ("shared", shared)):
+        peak, elapsed = _measure(build, args.copies)
+        print(f"{name:7s} {2 * args.routers} shapes + {args.copies} copies each: "
+              f"{elapsed:.2f}s, peak {peak / 2**20:.1f} MiB")
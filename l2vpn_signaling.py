@@ -0,0 +1,515 @@
+"""
+Event-driven simulation of pseudowire signaling across many PEs.
+
+Pseudowires (one per PE pair of every VPN) are set up with one of two
+control planes:
+
+    ldp   targeted LDP, one session per PE pair (RFC 4447): Hello both ways,
+          Initialization from the active (higher) PE, Initialization and
+          KeepAlive back, KeepAlive, then one Label Mapping per pseudowire
+          from each side.
+    bgp   BGP signaling through route reflectors (RFC 4761 style): every PE
+          opens one session per reflector and sends one Update per VPN
+          carrying a label block; reflectors send it on to the other members,
+          which derive their remote VC label from the block.
+
+Every PE and reflector processes its messages serially (a fixed service time
+per message received and per message sent), so fan-out at a reflector or a
+busy full-mesh PE shows up as queueing delay. Messages travel the shortest
+path across a ring of P routers with chords. Periodic Hellos and KeepAlives
+after setup are not modeled.
+
+The scheduler is a heap of deliveries; labels live in flat NumPy arrays
+(local and remote VC label per pseudowire end, and a per-PE VC label table
+stored as one array with per-PE offsets). A 500-PE LDP full mesh (124,750
+pseudowires, about a million messages) runs in a few seconds.
+
+The result is aggregated into a SignalingTrace: messages per link and per
+time bucket, messages per kind, and pseudowires up over time, which
+L2VPNSignalingHeatmapScene (l2vpn_signaling_scene.py) animates as a heatmap
+on the core links.
+
+    python l2vpn_signaling.py --pes 500 --mode ldp --out media/signaling_ldp.npz
+    L2VPN_SIGNALING_TRACE=media/signaling_ldp.npz manim -pql l2vpn_signaling_scene.py L2VPNSignalingHeatmapScene
+    python l2vpn_signaling.py --pes 500 --vpns 200 --members 4 40 --mode bgp
+"""
+import argparse
+import heapq
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+MIN_LABEL = 16  # 0-15 are reserved MPLS label values
+
+MODES = ("ldp", "bgp")
+HELLO, INIT, KEEPALIVE, LABEL_MAPPING, OPEN, UPDATE = range(6)
+MESSAGE_KINDS = ("hello", "init", "keepalive", "label_mapping", "open", "update")
+
+DEFAULT_HOP_LATENCY = 0.5e-3
+DEFAULT_SERVICE_TIME = 20e-6  # per message received, at a PE
+DEFAULT_SEND_TIME = 5e-6  # per message sent
+DEFAULT_REFLECTOR_SERVICE_TIME = 5e-6
+DEFAULT_START_SPREAD = 0.05  # sessions start at random times in [0, spread)
+
+
+class SignalingTopology:
+    """
+    PEs and route reflectors attached to a ring of P routers with chords.
+
+    Node ids: PEs are 0..n_pes-1, P routers follow, then reflectors. Links are
+    numbered PE access links first, then core links, then reflector links.
+    Endpoint ids (used for messages) are 0..n_pes-1 for PEs and n_pes + r for
+    reflector r.
+    """
+    def __init__(self, n_pes: int, n_ps: int = None, n_reflectors: int = 2):
+        self.n_pes = n_pes
+        self.n_ps = n_ps = n_ps or max(4, min(16, n_pes // 25))
+        self.n_reflectors = n_reflectors
+        self.pe_attach = np.arange(n_pes) % n_ps
+        self.reflector_attach = (np.arange(n_reflectors) * n_ps) // max(n_reflectors, 1)
+
+        edges = {(i, (i + 1) % n_ps) for i in range(n_ps)}
+        if n_ps >= 6:
+            edges |= {(i, (i + n_ps // 2) % n_ps) for i in range(n_ps)}
+        self.core_edges = sorted({tuple(sorted(edge)) for edge in edges})
+        self.n_core_links = len(self.core_edges)
+        self.n_links = n_pes + self.n_core_links + n_reflectors
+
+        p_node = n_pes
+        self.link_nodes = np.array(
+            [(pe, p_node + attach) for pe, attach in enumerate(self.pe_attach)]
+            + [(p_node + a, p_node + b) for a, b in self.core_edges]
+            + [(p_node + n_ps + r, p_node + attach) for r, attach in enumerate(self.reflector_attach)],
+            dtype=np.int32,
+        ).reshape(-1, 2)
+        self._core_paths()
+
+    def _core_paths(self):
+        """Shortest core paths for every ordered P pair, as CSR link lists."""
+        n_ps = self.n_ps
+        neighbors = [[] for _ in range(n_ps)]
+        for index, (a, b) in enumerate(self.core_edges):
+            link = self.n_pes + index
+            neighbors[a].append((b, link))
+            neighbors[b].append((a, link))
+        offsets, links = [0], []
+        hops = np.zeros((n_ps, n_ps), dtype=np.int32)
+        for source in range(n_ps):
+            parent = {source: None}
+            frontier = [source]
+            while frontier:
+                following = []
+                for node in frontier:
+                    for neighbor, link in sorted(neighbors[node]):
+                        if neighbor not in parent:
+                            parent[neighbor] = (node, link)
+                            following.append(neighbor)
+                frontier = following
+            for target in range(n_ps):
+                path, node = [], target
+                while parent[node] is not None:
+                    node, link = parent[node]
+                    path.append(link)
+                links += path[::-1]
+                offsets.append(len(links))
+                hops[source, target] = len(path)
+        self.path_offsets = np.array(offsets, dtype=np.int64)
+        self.path_links = np.array(links, dtype=np.int32)
+        self.core_hops = hops
+
+    def endpoint_attach(self) -> np.ndarray:
+        """P router of every message endpoint (PEs, then reflectors)."""
+        return np.concatenate([self.pe_attach, self.reflector_attach])
+
+    def endpoint_access_link(self) -> np.ndarray:
+        return np.concatenate([
+            np.arange(self.n_pes),
+            self.n_pes + self.n_core_links + np.arange(self.n_reflectors),
+        ])
+
+    def latency(self, hop_latency: float) -> np.ndarray:
+        """Endpoint x endpoint one-way delay: two access hops plus the core path."""
+        attach = self.endpoint_attach()
+        return (2 + self.core_hops[attach[:, None], attach[None, :]]) * hop_latency
+
+
+class PseudowireDemand(NamedTuple):
+    vpn_members: list  # per VPN, a sorted int array of member PEs
+    pw_pes: np.ndarray  # (n_pw, 2) int32, lower PE first
+    pw_vpn: np.ndarray  # (n_pw,) int32
+
+
+def build_demand(vpn_members) -> PseudowireDemand:
+    """One pseudowire per PE pair of every VPN."""
+    members = [np.unique(np.asarray(pes, dtype=np.int32)) for pes in vpn_members]
+    pairs, vpns = [], []
+    for vpn, pes in enumerate(members):
+        first, second = np.triu_indices(len(pes), k=1)
+        pairs.append(np.stack([pes[first], pes[second]], axis=1))
+        vpns.append(np.full(len(first), vpn, dtype=np.int32))
+    return PseudowireDemand(
+        members,
+        np.concatenate(pairs).astype(np.int32) if pairs else np.zeros((0, 2), np.int32),
+        np.concatenate(vpns) if vpns else np.zeros(0, np.int32),
+    )
+
+
+def full_mesh(n_pes: int) -> PseudowireDemand:
+    """A single VPN with every PE as a member: n(n-1)/2 pseudowires."""
+    return build_demand([np.arange(n_pes)])
+
+
+def random_vpns(n_pes: int, n_vpns: int, min_members: int, max_members: int, seed: int = 0) -> PseudowireDemand:
+    rng = np.random.default_rng(seed)
+    return build_demand([
+        rng.choice(n_pes, size=int(rng.integers(min_members, max_members + 1)), replace=False)
+        for _ in range(n_vpns)
+    ])
+
+
+class SignalingTrace(NamedTuple):
+    bucket_seconds: float
+    link_nodes: np.ndarray  # (n_links, 2) node ids, see SignalingTopology
+    n_pes: int
+    n_ps: int
+    link_messages: np.ndarray  # (n_links, n_buckets) messages crossing each link
+    kind_messages: np.ndarray  # (len(MESSAGE_KINDS), n_buckets)
+    pseudowires_up: np.ndarray  # (n_buckets,) cumulative, at the end of each bucket
+    n_pseudowires: int
+    mode: str  # "ldp" or "bgp"
+
+
+class SignalingSimulator:
+    """
+    Runs one control plane over a topology and a pseudowire demand.
+
+    After run(), `local_label` and `remote_label` ((n_pw, 2) int32, -1 while
+    unset) hold the VC labels of both ends of every pseudowire, `up_time` when
+    each came up, and lookup(pe, label) resolves a PE's VC label to its
+    pseudowire.
+    """
+    def __init__(self, topology: SignalingTopology, demand: PseudowireDemand, mode: str = "ldp",
+                 hop_latency: float = DEFAULT_HOP_LATENCY, service_time: float = DEFAULT_SERVICE_TIME,
+                 send_time: float = DEFAULT_SEND_TIME, reflector_service_time: float = DEFAULT_REFLECTOR_SERVICE_TIME,
+                 start_spread: float = DEFAULT_START_SPREAD, seed: int = 0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown signaling mode {mode!r}; expected one of {', '.join(MODES)}")
+        if mode == "bgp" and topology.n_reflectors < 1:
+            raise ValueError("BGP signaling needs at least one route reflector")
+        self.topology = topology
+        self.demand = demand
+        self.mode = mode
+        self.send_time = send_time
+        self.start_spread = start_spread
+        self.rng = np.random.default_rng(seed)
+
+        n_pes, n_pw = topology.n_pes, len(demand.pw_pes)
+        self.n_endpoints = n_pes + topology.n_reflectors
+        self.latency = topology.latency(hop_latency).tolist()
+        self.service = [service_time] * n_pes + [reflector_service_time] * topology.n_reflectors
+        self.busy = [0.0] * self.n_endpoints
+
+        self.local_label = np.full((n_pw, 2), -1, dtype=np.int32)
+        self.remote_label = np.full((n_pw, 2), -1, dtype=np.int32)
+        self.up_time = np.full(n_pw, np.inf)
+        # Per-PE VC label table: label L of PE p is entry offsets[p] + L - MIN_LABEL.
+        # BGP label blocks also reserve a label for the PE's own slot, one per VPN it is in.
+        slots = np.bincount(demand.pw_pes.ravel(), minlength=n_pes)
+        if mode == "bgp" and demand.vpn_members:
+            slots = slots + np.bincount(np.concatenate(demand.vpn_members), minlength=n_pes)
+        self.table_offsets = np.concatenate([[0], np.cumsum(slots)]).astype(np.int64)
+        self.label_table = np.full(int(self.table_offsets[-1]), -1, dtype=np.int32)
+        self.next_label = [MIN_LABEL] * n_pes
+
+        self._heap = []
+        self._openings = []  # (time, src, dst, kind, payload) sends that start sessions, merged into the run
+        self._seq = 0
+        self._sent_src, self._sent_dst, self._sent_kind, self._sent_time = [], [], [], []
+
+    # --- Scheduling ---
+
+    def _send(self, src: int, dst: int, kind: int, payload: int, at: float):
+        busy = self.busy[src]
+        leaves = (at if at > busy else busy) + self.send_time
+        self.busy[src] = leaves
+        self._sent_src.append(src)
+        self._sent_dst.append(dst)
+        self._sent_kind.append(kind)
+        self._sent_time.append(leaves)
+        self._seq += 1
+        heapq.heappush(self._heap, (leaves + self.latency[src][dst], self._seq, dst, src, kind, payload))
+
+    def _process(self, node: int, arrived: float) -> float:
+        busy = self.busy[node]
+        done = (arrived if arrived > busy else busy) + self.service[node]
+        self.busy[node] = done
+        return done
+
+    def _allocate(self, pe: int, pw: int) -> int:
+        label = self.next_label[pe]
+        self.next_label[pe] = label + 1
+        self.label_table[self.table_offsets[pe] + label - MIN_LABEL] = pw
+        self.local_label[pw, 0 if self.demand.pw_pes[pw, 0] == pe else 1] = label
+        return label
+
+    def _install(self, pe: int, pw: int, label: int, now: float):
+        side = 0 if self.demand.pw_pes[pw, 0] == pe else 1
+        if self.remote_label[pw, side] >= 0:
+            return  # the same route from a second reflector
+        self.remote_label[pw, side] = label
+        if self.remote_label[pw, 1 - side] >= 0:
+            self.up_time[pw] = now
+
+    def lookup(self, pe: int, label: int) -> int:
+        """The pseudowire that VC label `label` of PE `pe` belongs to, or -1."""
+        index = label - MIN_LABEL
+        start, end = self.table_offsets[pe], self.table_offsets[pe + 1]
+        if index < 0 or start + index >= end:
+            return -1
+        return int(self.label_table[start + index])
+
+    # --- Control planes ---
+
+    def _start_ldp(self):
+        pw_pes = self.demand.pw_pes
+        sessions, session_index = np.unique(pw_pes, axis=0, return_inverse=True)
+        order = np.argsort(session_index.ravel(), kind="stable")
+        counts = np.bincount(session_index.ravel(), minlength=len(sessions))
+        self.session_pes = sessions.tolist()
+        self.session_offsets = np.concatenate([[0], np.cumsum(counts)]).tolist()
+        self.session_pws = order.tolist()
+        for session, (low, high) in enumerate(self.session_pes):
+            start = float(self.rng.uniform(0, self.start_spread))
+            self._openings += [(start, low, high, HELLO, session), (start, high, low, HELLO, session)]
+
+    def _advertise_ldp(self, pe: int, session: int, now: float):
+        low, high = self.session_pes[session]
+        peer = high if pe == low else low
+        for pw in self.session_pws[self.session_offsets[session]:self.session_offsets[session + 1]]:
+            self._allocate(pe, pw)
+            self._send(pe, peer, LABEL_MAPPING, pw, now)
+
+    def _handle_ldp(self, node: int, src: int, kind: int, payload: int, now: float):
+        if kind == HELLO:
+            if node > src:  # the higher transport address is the active side
+                self._send(node, src, INIT, payload, now)
+        elif kind == INIT:
+            if node < src:  # passive side answers the active side's Initialization
+                self._send(node, src, INIT, payload, now)
+                self._send(node, src, KEEPALIVE, payload, now)
+        elif kind == KEEPALIVE:
+            if node > src:  # active side: session up, confirm and advertise
+                self._send(node, src, KEEPALIVE, payload, now)
+            self._advertise_ldp(node, payload, now)
+        elif kind == LABEL_MAPPING:
+            pw = payload
+            self._install(node, pw, int(self.local_label[pw, 0 if self.demand.pw_pes[pw, 0] == src else 1]), now)
+
+    def _start_bgp(self):
+        n_pes, demand = self.topology.n_pes, self.demand
+        self.member_position = np.full((len(demand.vpn_members), n_pes), -1, dtype=np.int32)
+        self.pw_matrix = []
+        self.pe_vpns = [[] for _ in range(n_pes)]
+        for vpn, members in enumerate(demand.vpn_members):
+            self.member_position[vpn, members] = np.arange(len(members))
+            for pe in members.tolist():
+                self.pe_vpns[pe].append(vpn)
+            self.pw_matrix.append(np.full((len(members), len(members)), -1, dtype=np.int32))
+        for pw, ((low, high), vpn) in enumerate(zip(demand.pw_pes.tolist(), demand.pw_vpn.tolist())):
+            first, second = self.member_position[vpn, low], self.member_position[vpn, high]
+            self.pw_matrix[vpn][first, second] = self.pw_matrix[vpn][second, first] = pw
+        self.member_lists = [members.tolist() for members in demand.vpn_members]
+        self.block_base = {}  # (vpn, origin PE) -> first label of its block
+        reflectors = range(n_pes, self.n_endpoints)
+        self.reflector_routes = {reflector: [[] for _ in demand.vpn_members] for reflector in reflectors}
+        self.reflector_peers = {reflector: set() for reflector in reflectors}
+        for pe in range(n_pes):
+            if self.pe_vpns[pe]:
+                start = float(self.rng.uniform(0, self.start_spread))
+                self._openings += [(start, pe, reflector, OPEN, 0) for reflector in reflectors]
+
+    def _reflect(self, reflector: int, vpn: int, origin: int, peer: int, now: float):
+        self._send(reflector, peer, UPDATE, vpn * self.topology.n_pes + origin, now)
+
+    def _handle_bgp(self, node: int, src: int, kind: int, payload: int, now: float):
+        n_pes = self.topology.n_pes
+        if node >= n_pes:  # route reflector
+            if kind == OPEN:
+                self._send(node, src, OPEN, 0, now)
+                self._send(node, src, KEEPALIVE, 0, now)
+            elif kind == KEEPALIVE:
+                self.reflector_peers[node].add(src)
+                for vpn in self.pe_vpns[src]:  # Adj-RIB-Out for the new peer
+                    for origin in self.reflector_routes[node][vpn]:
+                        self._reflect(node, vpn, origin, src, now)
+            elif kind == UPDATE:
+                vpn, origin = divmod(payload, n_pes)
+                self.reflector_routes[node][vpn].append(origin)
+                peers = self.reflector_peers[node]
+                for member in self.member_lists[vpn]:
+                    if member != origin and member in peers:
+                        self._reflect(node, vpn, origin, member, now)
+            return
+        if kind == KEEPALIVE:  # session with reflector `src` is up
+            self._send(node, src, KEEPALIVE, 0, now)
+            for vpn in self.pe_vpns[node]:
+                if (vpn, node) not in self.block_base:
+                    self._allocate_block(node, vpn)
+                self._send(node, src, UPDATE, vpn * n_pes + node, now)
+        elif kind == UPDATE:
+            vpn, origin = divmod(payload, n_pes)
+            if (vpn, origin) not in self.block_base:
+                return
+            position = self.member_position[vpn, node]
+            pw = int(self.pw_matrix[vpn][position, self.member_position[vpn, origin]])
+            self._install(node, pw, self.block_base[vpn, origin] + int(position), now)
+
+    def _allocate_block(self, pe: int, vpn: int):
+        """A label block with one label per member, indexed by member position."""
+        base = self.next_label[pe]
+        row = self.pw_matrix[vpn][self.member_position[vpn, pe]]
+        for position, pw in enumerate(row.tolist()):
+            if pw < 0:  # this PE's own slot in the block
+                self.next_label[pe] += 1
+                continue
+            self._allocate(pe, pw)
+        self.block_base[vpn, pe] = base
+
+    # --- Running ---
+
+    def run(self) -> float:
+        """Runs until no message is in flight; returns the time of the last delivery."""
+        if self.mode == "ldp":
+            self._start_ldp()
+            handle = self._handle_ldp
+        else:
+            self._start_bgp()
+            handle = self._handle_bgp
+        # Session openings are replayed in time order instead of being pushed up front,
+        # so the heap only holds messages in flight.
+        openings = sorted(self._openings)
+        heap, process, send = self._heap, self._process, self._send
+        next_opening = 0
+        now = 0.0
+        while heap or next_opening < len(openings):
+            if next_opening < len(openings) and (not heap or openings[next_opening][0] <= heap[0][0]):
+                at, src, dst, kind, payload = openings[next_opening]
+                next_opening += 1
+                send(src, dst, kind, payload, at)
+                continue
+            arrived, _, node, src, kind, payload = heapq.heappop(heap)
+            now = process(node, arrived)
+            handle(node, src, kind, payload, now)
+        return now
+
+    @property
+    def messages(self) -> int:
+        return len(self._sent_kind)
+
+    def trace(self, buckets: int = 60) -> SignalingTrace:
+        """Aggregates the messages sent into per-link and per-kind counts over `buckets` time buckets."""
+        topology = self.topology
+        times = np.asarray(self._sent_time)
+        end = max(float(times.max()) if len(times) else 0.0, float(self.up_time[np.isfinite(self.up_time)].max(initial=0)))
+        bucket_seconds = end / buckets if end > 0 else 1.0
+        bucket = np.minimum((times / bucket_seconds).astype(np.int64), buckets - 1)
+        src = np.asarray(self._sent_src, dtype=np.int64)
+        dst = np.asarray(self._sent_dst, dtype=np.int64)
+        kinds = np.asarray(self._sent_kind, dtype=np.int64)
+
+        link_messages = np.zeros((topology.n_links, buckets), dtype=np.int64)
+        access = topology.endpoint_access_link()
+        for ends in (src, dst):
+            flat = access[ends] * buckets + bucket
+            link_messages += np.bincount(flat, minlength=topology.n_links * buckets).reshape(topology.n_links, buckets)
+
+        attach = topology.endpoint_attach()
+        n_pairs = topology.n_ps * topology.n_ps
+        pair = attach[src] * topology.n_ps + attach[dst]
+        per_pair = np.bincount(pair * buckets + bucket, minlength=n_pairs * buckets).reshape(n_pairs, buckets)
+        lengths = np.diff(topology.path_offsets)
+        rows = np.repeat(np.arange(n_pairs), lengths)
+        np.add.at(link_messages, topology.path_links, per_pair[rows])
+
+        kind_messages = np.bincount(kinds * buckets + bucket, minlength=len(MESSAGE_KINDS) * buckets)
+        up = self.up_time[np.isfinite(self.up_time)]
+        up_bucket = np.minimum((up / bucket_seconds).astype(np.int64), buckets - 1)
+        return SignalingTrace(
+            bucket_seconds=bucket_seconds,
+            link_nodes=topology.link_nodes,
+            n_pes=topology.n_pes,
+            n_ps=topology.n_ps,
+            link_messages=link_messages.astype(np.int32),
+            kind_messages=kind_messages.reshape(len(MESSAGE_KINDS), buckets).astype(np.int32),
+            pseudowires_up=np.cumsum(np.bincount(up_bucket, minlength=buckets)).astype(np.int32),
+            n_pseudowires=len(self.up_time),
+            mode=self.mode,
+        )
+
+
+def simulate(n_pes: int = 500, mode: str = "ldp", demand: PseudowireDemand = None, n_ps: int = None,
+             n_reflectors: int = 2, buckets: int = 60, seed: int = 0, **timing) -> tuple:
+    """
+    Builds a topology, runs one control plane and aggregates the result.
+
+    Args:
+        n_pes: Number of PEs.
+        mode: "ldp" or "bgp".
+        demand: Pseudowires to set up; a full mesh of all PEs by default.
+        n_ps: Number of P routers; scales with n_pes by default.
+        n_reflectors: Route reflectors (used by "bgp").
+        buckets: Time buckets of the trace.
+        seed: Seed of the session start times.
+        **timing: hop_latency, service_time, send_time, reflector_service_time, start_spread.
+
+    Returns:
+        (simulator, trace)
+    """
+    topology = SignalingTopology(n_pes, n_ps, n_reflectors)
+    simulator = SignalingSimulator(topology, demand if demand is not None else full_mesh(n_pes), mode, seed=seed, **timing)
+    simulator.run()
+    return simulator, simulator.trace(buckets)
+
+
+def save_trace(path, trace: SignalingTrace):
+    np.savez_compressed(path, **trace._asdict())
+
+
+def load_trace(path) -> SignalingTrace:
+    with np.load(path) as data:
+        fields = {name: data[name] for name in SignalingTrace._fields if name in data}
+    for name in ("bucket_seconds",):
+        fields[name] = float(fields[name])
+    for name in ("n_pes", "n_ps", "n_pseudowires"):
+        fields[name] = int(fields[name])
+    fields["mode"] = str(fields.get("mode", "ldp"))  # traces saved before the mode was recorded are LDP
+    return SignalingTrace(**fields)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate LDP or BGP pseudowire signaling.")
+    parser.add_argument("--pes", type=int, default=500)
+    parser.add_argument("--ps", type=int, help="P routers (default: scales with --pes)")
+    parser.add_argument("--mode", choices=MODES, default="ldp")
+    parser.add_argument("--vpns", type=int, help="random VPNs instead of one full mesh")
+    parser.add_argument("--members", type=int, nargs=2, default=(4, 40), metavar=("MIN", "MAX"))
+    parser.add_argument("--reflectors", type=int, default=2)
+    parser.add_argument("--buckets", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the aggregated trace (.npz) here")
+    args = parser.parse_args()
+
+    demand = random_vpns(args.pes, args.vpns, *args.members, seed=args.seed) if args.vpns else full_mesh(args.pes)
+    started = time.perf_counter()
+    simulator, trace = simulate(args.pes, args.mode, demand, args.ps, args.reflectors, args.buckets, args.seed)
+    elapsed = time.perf_counter() - started
+    up = np.isfinite(simulator.up_time)
+    print(f"{args.mode}: {args.pes} PEs, {len(up)} pseudowires, {simulator.messages} messages in {elapsed:.2f}s "
+          f"({simulator.messages / elapsed:,.0f} msg/s)")
+    print(f"converged: {up.sum()}/{len(up)} pseudowires up, last at {simulator.up_time[up].max(initial=0):.3f}s")
+    for kind, total in zip(MESSAGE_KINDS, trace.kind_messages.sum(axis=1)):
+        if total:
+            print(f"  {kind:14s} {total}")
+    if args.out:
+        save_trace(args.out, trace)
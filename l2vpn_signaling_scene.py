@@ -0,0 +1,167 @@
+import os
+
+import numpy as np
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    Line,
+    Create,
+    Write,
+    FadeIn,
+    ValueTracker,
+    Circle,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    RED,
+    BLUE_E,
+    YELLOW_C,
+    GREY_BROWN,
+    TAU,
+    interpolate_color,
+    linear,
+    config,
+)
+
+# Project specific imports
+from l2vpn_elements import create_router, PROVIDER_COLOR
+from l2vpn_i18n import _
+from l2vpn_signaling import full_mesh, load_trace, simulate
+
+# Configure default font size for slides if needed
+config.font_size = 32
+
+# Signaling heatmap: a precomputed trace (l2vpn_signaling.py --out ...) can be
+# animated by pointing L2VPN_SIGNALING_TRACE at it; otherwise a small full mesh
+# is simulated when the scene is built.
+SIGNALING_TRACE_ENV = "L2VPN_SIGNALING_TRACE"
+HEATMAP_PES = 96
+HEATMAP_BUCKETS = 48
+HEAT_COLORS = (BLUE_E, YELLOW_C, RED)
+
+
+def heat_color(level: float):
+    """Maps a 0..1 message rate to the heatmap color scale."""
+    if level <= 0.5:
+        return interpolate_color(HEAT_COLORS[0], HEAT_COLORS[1], level * 2)
+    return interpolate_color(HEAT_COLORS[1], HEAT_COLORS[2], level * 2 - 1)
+
+
+def signaling_texts(trace) -> tuple:
+    """The title and caption of a trace: its control plane, and whether its demand is one full mesh."""
+    full = trace.n_pseudowires == trace.n_pes * (trace.n_pes - 1) // 2
+    if trace.mode == "bgp":
+        title = _("Signaling at Scale: BGP Full Mesh") if full else _("Signaling at Scale: BGP VPNs")
+        caption = _("{pes} PEs, {pws} pseudowires: each PE advertises one label block per VPN to the route reflectors.")
+    else:
+        title = _("Signaling at Scale: LDP Full Mesh") if full else _("Signaling at Scale: LDP VPNs")
+        caption = _("{pes} PEs, {pws} pseudowires: every PE pair runs its own LDP session.")
+    return title, caption.format(pes=trace.n_pes, pws=trace.n_pseudowires)
+
+
+class L2VPNSignalingHeatmapScene(Scene):
+    """
+    Pseudowire signaling at scale: targeted LDP or BGP across many PEs,
+    shown as message rates on the links instead of one dot per message.
+    """
+    def construct(self):
+        trace_path = os.environ.get(SIGNALING_TRACE_ENV)
+        if trace_path:
+            trace = load_trace(trace_path)
+        else:
+            _simulator, trace = simulate(HEATMAP_PES, "ldp", full_mesh(HEATMAP_PES), buckets=HEATMAP_BUCKETS)
+
+        title_text, caption_text = signaling_texts(trace)
+        title = Text(title_text, font_size=40).to_edge(UP)
+        self.play(Write(title))
+
+        # P routers on a ring; the PEs of each P router are drawn as one cluster
+        n_pes, n_ps = trace.n_pes, trace.n_ps
+        angles = [TAU * i / n_ps + TAU / 4 for i in range(n_ps)]
+        center = DOWN * 0.4
+        p_positions = [center + 2.0 * np.array([np.cos(a), np.sin(a), 0]) for a in angles]
+        cluster_positions = [center + 3.0 * np.array([np.cos(a), np.sin(a), 0]) for a in angles]
+        p_routers = VGroup(*[
+            create_router(f"P{i + 1}", PROVIDER_COLOR).scale(0.4).move_to(position)
+            for i, position in enumerate(p_positions)
+        ])
+        pes_per_p = np.bincount(trace.link_nodes[:n_pes, 1] - n_pes, minlength=n_ps)
+        clusters = VGroup(*[
+            VGroup(
+                Circle(radius=0.22, color=PROVIDER_COLOR, fill_opacity=0.2),
+                Text(f"{count}", font_size=16),
+            ).move_to(position)
+            for count, position in zip(pes_per_p, cluster_positions)
+        ])
+
+        # One line per core link, and one per P router for its PEs' access links
+        core_rows, core_lines = [], VGroup()
+        for row, (a, b) in enumerate(trace.link_nodes):
+            if row < n_pes or a - n_pes >= n_ps or b - n_pes >= n_ps:
+                continue
+            core_rows.append(row)
+            core_lines.add(Line(p_positions[a - n_pes], p_positions[b - n_pes], color=GREY_BROWN, stroke_width=2))
+        access_lines = VGroup(*[
+            Line(p_positions[i], cluster_positions[i], color=GREY_BROWN, stroke_width=2) for i in range(n_ps)
+        ])
+        access_messages = np.zeros((n_ps, trace.link_messages.shape[1]), dtype=np.int64)
+        np.add.at(access_messages, trace.link_nodes[:n_pes, 1] - n_pes, trace.link_messages[:n_pes])
+        rates = [(line, trace.link_messages[row]) for line, row in zip(core_lines, core_rows)]
+        rates += list(zip(access_lines, access_messages))
+        peak = max(max(int(messages.max()) for _line, messages in rates), 1)
+
+        self.play(Create(core_lines), Create(access_lines), FadeIn(p_routers), FadeIn(clusters))
+        caption = Text(caption_text, font_size=24).next_to(title, DOWN, buff=0.2)
+        self.play(Write(caption))
+
+        legend_bar = Line(LEFT * 0.8, RIGHT * 0.8, stroke_width=8).set_color(list(HEAT_COLORS))
+        legend = VGroup(
+            Text(_("few"), font_size=18), legend_bar, Text(_("many messages"), font_size=18),
+        ).arrange(RIGHT, buff=0.15).to_corner(DOWN + RIGHT, buff=0.4)
+        self.play(FadeIn(legend))
+
+        # Heatmap: one trace bucket per step of the tracker
+        n_buckets = trace.link_messages.shape[1]
+        bucket = ValueTracker(0)
+
+        def current_bucket():
+            return min(int(bucket.get_value()), n_buckets - 1)
+
+        for line, messages in rates:
+            def recolor(mob, messages=messages):
+                level = (messages[current_bucket()] / peak) ** 0.5
+                mob.set_stroke(color=heat_color(level), width=2 + 6 * level)
+            line.add_updater(recolor)
+
+        progress_label = _("Pseudowires up: {up} / {total}")
+        progress = Text(progress_label.format(up=0, total=trace.n_pseudowires), font_size=24)
+        progress.to_corner(DOWN + LEFT, buff=0.4)
+        shown = {"bucket": -1}
+
+        def update_progress(mob):
+            index = current_bucket()
+            if index != shown["bucket"]:
+                shown["bucket"] = index
+                text = progress_label.format(up=int(trace.pseudowires_up[index]), total=trace.n_pseudowires)
+                mob.become(Text(text, font_size=24).to_corner(DOWN + LEFT, buff=0.4))
+        progress.add_updater(update_progress)
+        self.add(progress)
+
+        self.play(bucket.animate.set_value(n_buckets - 1), run_time=8, rate_func=linear)
+        for line, _messages in rates:
+            line.clear_updaters()
+        progress.clear_updaters()
+        self.wait(0.5)
+
+        converged = Text(
+            _("Converged after {ms:.0f} ms of simulated time.").format(ms=trace.bucket_seconds * n_buckets * 1000),
+            font_size=26, color=YELLOW_C,
+        ).next_to(progress, UP, buff=0.3, aligned_edge=LEFT)
+        self.play(Write(converged))
+        self.wait(2)
+
+# To run this scene:
+# manim -pql l2vpn_signaling_scene.py L2VPNSignalingHeatmapScene
+# L2VPN_SIGNALING_TRACE=media/signaling_bgp.npz manim -pqh l2vpn_signaling_scene.py L2VPNSignalingHeatmapScene
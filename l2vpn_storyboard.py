@@ -0,0 +1,264 @@
+"""
+Declarative storyboards for packet-flow scenes.
+
+A storyboard (YAML or JSON, in storyboards/; YAML needs PyYAML) describes a
+flow across the create_l2vpn_topology routers without any Python;
+l2vpn_storyboard_scenes compiles every file into a Scene named after its
+`scene` key:
+
+    scene: CoreTransitStoryboard
+    title: "Core Transit: PE1 -> PE2"
+    topology:
+      active: [PE1, P1, P2, PE2]      # other routers, links and labels are dimmed
+    packet:
+      segments: [p_hdr, t_label, vc_label, cw, eth_hdr, payload]
+      texts: {t_label: T-L1}
+      at: PE1
+    steps:
+      - caption: "PE1 forwards packet based on T-L1."
+        actions:
+          - highlight: t_label
+          - move: P1
+      - caption: "P1 swaps T-L1 with T-L2."
+        actions:
+          - swap: {segment: t_label, text: T-L2, color: GREEN_C}
+
+Actions, applied in order within a step:
+
+    highlight: SEGMENT            frame a segment (until the next move or the step end)
+    move: ROUTER                  carry the packet along the links to a router further right
+    swap: {segment, text, color}  replace a label in place (color optional)
+    pop: SEGMENT                  remove a segment; the rest close up
+    push: SEGMENT or {segment, text, color}
+                                  add a segment in front of the existing ones
+    wait: SECONDS
+
+A step's caption is shown for the step only, so every step is self-contained:
+its digest (step_digests) covers the step itself and the packet state it
+starts from, never another step's caption. manim's play cache follows the
+same boundary, so editing one caption re-renders only that step.
+
+    python l2vpn_storyboard.py check                                # validate every storyboard
+    python l2vpn_storyboard.py steps storyboards/core_transit.yaml  # digests and captions
+"""
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+STORYBOARD_DIR = Path(__file__).resolve().parent / "storyboards"
+STORYBOARD_SUFFIXES = (".yaml", ".yml", ".json")
+
+# Routers of create_l2vpn_topology, left to right; link i joins routers i and i + 1.
+ROUTERS = ("CE-A1", "PE1", "P1", "P2", "PE2", "CE-B1")
+# Packet segments in wire order: default text, width (None: sized to the text) and color name.
+SEGMENTS = {
+    "p_hdr": ("P-Hdr", 1.0, "PROVIDER_COLOR"),
+    "t_label": ("T-L1", None, "BLUE_E"),
+    "vc_label": ("VC-L", None, "LABEL_COLOR"),
+    "cw": ("CW", 0.6, "GREY_BROWN"),
+    "eth_hdr": ("Eth Hdr", 1.2, "CUSTOMER_COLOR"),
+    "payload": ("Payload", 1.8, "PACKET_COLOR"),
+}
+ACTIONS = ("highlight", "move", "swap", "pop", "push", "wait")
+DEFAULT_HIGHLIGHT_COLOR = "YELLOW_C"
+DEFAULT_HOLD_SECONDS = 1.0
+
+
+def storyboard_paths(directory: Path = STORYBOARD_DIR) -> list:
+    if not directory.is_dir():
+        return []
+    return sorted(path for path in directory.iterdir() if path.suffix in STORYBOARD_SUFFIXES)
+
+
+def _fail(path, where: str, message: str):
+    raise ValueError(f"{path}: {where}: {message}")
+
+
+def _router(path, where: str, name) -> int:
+    if name not in ROUTERS:
+        _fail(path, where, f"unknown router {name!r}; expected one of {', '.join(ROUTERS)}")
+    return ROUTERS.index(name)
+
+
+def _segment(path, where: str, name) -> str:
+    if name not in SEGMENTS:
+        _fail(path, where, f"unknown segment {name!r}; expected one of {', '.join(SEGMENTS)}")
+    return name
+
+
+def _normalize_action(path, where: str, action) -> dict:
+    """Turns `- move: P1` or `- swap: {...}` into {"kind": ..., **parameters}."""
+    if not isinstance(action, dict) or len(action) != 1:
+        _fail(path, where, "an action is a mapping with exactly one key, e.g. `move: P1`")
+    (kind, value), = action.items()
+    if kind not in ACTIONS:
+        _fail(path, where, f"unknown action {kind!r}; expected one of {', '.join(ACTIONS)}")
+    if kind == "wait":
+        return {"kind": kind, "seconds": float(value)}
+    if kind == "move":
+        return {"kind": kind, "to": ROUTERS[_router(path, where, value)]}
+    if not isinstance(value, dict):
+        value = {"segment": value}
+    segment = _segment(path, where, value.get("segment"))
+    if kind == "highlight":
+        return {"kind": kind, "segment": segment, "color": value.get("color", DEFAULT_HIGHLIGHT_COLOR)}
+    if kind == "pop":
+        return {"kind": kind, "segment": segment}
+    default_text, _width, default_color = SEGMENTS[segment]
+    if kind == "swap" and "text" not in value:
+        _fail(path, where, "swap needs a text")
+    return {"kind": kind, "segment": segment, "text": str(value.get("text", default_text)),
+            "color": value.get("color", default_color if kind == "push" else None)}
+
+
+def _parse(path: Path, source):
+    """Parses JSON, or YAML through PyYAML, which only YAML storyboards need."""
+    if path.suffix == ".json":
+        return json.load(source)
+    import yaml
+
+    try:
+        return yaml.safe_load(source)
+    except yaml.YAMLError as error:
+        _fail(path, "YAML", str(error))
+
+
+def load_storyboard(path) -> dict:
+    """
+    Reads, validates and normalizes one storyboard.
+
+    Every action is checked against the packet state it meets (a popped
+    segment must be there, a move must go further right, ...), so mistakes
+    are reported with their step before anything renders.
+
+    Returns:
+        A dict with scene, title, title_font_size, topology, packet and steps,
+        all defaults filled in.
+
+    Raises:
+        ValueError: naming the file and the step of the first problem.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as source:
+        raw = _parse(path, source)
+    if not isinstance(raw, dict):
+        _fail(path, "top level", "expected a mapping")
+    scene = raw.get("scene")
+    if not isinstance(scene, str) or not scene.isidentifier():
+        _fail(path, "scene", "a Scene class name is required")
+
+    topology = raw.get("topology") or {}
+    active = [ROUTERS[_router(path, "topology.active", name)] for name in topology.get("active", ROUTERS)]
+    shift = [float(value) for value in topology.get("shift", (0.0, -0.5))]
+
+    packet = raw.get("packet") or {}
+    segments = [_segment(path, "packet.segments", name) for name in packet.get("segments", SEGMENTS)]
+    if [name for name in SEGMENTS if name in segments] != segments or not segments:
+        _fail(path, "packet.segments", f"segments must be distinct and in wire order: {', '.join(SEGMENTS)}")
+    texts = {name: str(packet.get("texts", {}).get(name, SEGMENTS[name][0])) for name in segments}
+    colors = {name: packet.get("colors", {}).get(name, SEGMENTS[name][2]) for name in segments}
+    at = ROUTERS[_router(path, "packet.at", packet.get("at", active[0]))]
+
+    steps = []
+    state = {"segments": list(segments), "at": at}
+    for number, step in enumerate(raw.get("steps") or []):
+        where = f"step {number + 1}"
+        if not isinstance(step, dict):
+            _fail(path, where, "a step is a mapping with a caption and/or actions")
+        actions = [_normalize_action(path, where, action) for action in step.get("actions") or []]
+        for action in actions:
+            segment = action.get("segment")
+            if action["kind"] in ("highlight", "swap", "pop") and segment not in state["segments"]:
+                _fail(path, where, f"{action['kind']}: the packet has no {segment} segment here")
+            if action["kind"] == "push":
+                if segment in state["segments"]:
+                    _fail(path, where, f"push: the packet already has a {segment} segment")
+                state["segments"] = [name for name in SEGMENTS if name in state["segments"] or name == segment]
+            elif action["kind"] == "pop":
+                state["segments"].remove(segment)
+                if not state["segments"]:
+                    _fail(path, where, "pop: a packet needs at least one segment")
+            elif action["kind"] == "move":
+                if ROUTERS.index(action["to"]) <= ROUTERS.index(state["at"]):
+                    _fail(path, where, f"move: {action['to']} is not to the right of {state['at']}")
+                state["at"] = action["to"]
+        caption = step.get("caption")
+        steps.append({
+            "caption": None if caption is None else str(caption),
+            "actions": actions,
+            "hold": float(step.get("hold", DEFAULT_HOLD_SECONDS)),
+        })
+
+    return {
+        "scene": scene,
+        "title": str(raw.get("title", scene)),
+        "title_font_size": int(raw.get("title_font_size", 36)),
+        "topology": {"active": active, "shift": shift},
+        "packet": {"segments": segments, "texts": texts, "colors": colors, "at": at},
+        "steps": steps,
+    }
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def step_digests(board: dict) -> list:
+    """
+    One digest per step, over the scene setup, the packet state the step
+    starts from (segments, texts, colors, position) and the step itself.
+    Captions and timings of other steps do not enter it.
+    """
+    setup = {key: board[key] for key in ("scene", "title", "title_font_size", "topology")}
+    packet = board["packet"]
+    state = {
+        "segments": [[name, packet["texts"][name], packet["colors"][name]] for name in packet["segments"]],
+        "at": packet["at"],
+    }
+    digests = []
+    for step in board["steps"]:
+        digests.append(_digest({"setup": setup, "state": state, "step": step}))
+        for action in step["actions"]:
+            names = [name for name, _text, _color in state["segments"]]
+            if action["kind"] == "move":
+                state["at"] = action["to"]
+            elif action["kind"] == "pop":
+                state["segments"].pop(names.index(action["segment"]))
+            elif action["kind"] == "swap":
+                entry = state["segments"][names.index(action["segment"])]
+                entry[1] = action["text"]
+                entry[2] = action["color"] or entry[2]
+            elif action["kind"] == "push":
+                order = list(SEGMENTS)
+                index = sum(order.index(name) < order.index(action["segment"]) for name in names)
+                state["segments"].insert(index, [action["segment"], action["text"], action["color"]])
+    return digests
+
+
+def storyboard_messages(path) -> list:
+    """The translatable strings of a storyboard: its title and captions."""
+    board = load_storyboard(path)
+    return [board["title"]] + [step["caption"] for step in board["steps"] if step["caption"]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate storyboards and show their step digests.")
+    parser.add_argument("command", choices=("check", "steps"))
+    parser.add_argument("paths", nargs="*", help="storyboard files; default: every file in storyboards/")
+    args = parser.parse_args()
+
+    problems = 0
+    for path in [Path(path) for path in args.paths] or storyboard_paths():
+        try:
+            board = load_storyboard(path)
+        except ValueError as error:
+            print(error)
+            problems += 1
+            continue
+        print(f"{path}: {board['scene']}, {len(board['steps'])} steps")
+        if args.command == "steps":
+            for number, (digest, step) in enumerate(zip(step_digests(board), board["steps"])):
+                print(f"  {number + 1:3d}  {digest[:12]}  {step['caption'] or ''}")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,227 @@
+import manim
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    Line,
+    Create,
+    Write,
+    FadeIn,
+    FadeOut,
+    MoveAlongPath,
+    ReplacementTransform,
+    SurroundingRectangle,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    WHITE,
+    YELLOW_C,
+    config,
+)
+
+# Project specific imports
+import l2vpn_elements
+from l2vpn_flow_scenes import _label_segment_width, create_l2vpn_topology, create_packet_segment
+from l2vpn_i18n import _
+from l2vpn_storyboard import ROUTERS, SEGMENTS, load_storyboard, step_digests, storyboard_paths
+
+# Configure default font size for slides if needed
+config.font_size = 28
+
+PACKET_SCALE = 0.8
+DIMMED_OPACITY = 0.3
+# Segment texts that are translated like in the hand-written flow scenes
+TRANSLATED_SEGMENT_TEXTS = ("Eth Hdr", "Payload")
+
+
+def storyboard_color(name: str):
+    """Resolves a color name: the project colors first, then manim's."""
+    color = getattr(l2vpn_elements, name, None) or getattr(manim, name, None)
+    if color is None:
+        raise ValueError(f"unknown color {name!r}")
+    return color
+
+
+def create_storyboard_segment(segment: str, text: str, color_name: str):
+    """A packet segment at packet scale, sized like create_full_l2vpn_packet sizes it."""
+    width = SEGMENTS[segment][1] or _label_segment_width(text)
+    label = _(text) if text in TRANSLATED_SEGMENT_TEXTS else text
+    return create_packet_segment(label, width, 0.5, storyboard_color(color_name)).scale(PACKET_SCALE)
+
+
+class StoryboardScene(Scene):
+    """
+    Plays a storyboard (see l2vpn_storyboard). Every step is its own section,
+    named after its digest.
+    """
+    storyboard = None  # set by compile_storyboard
+
+    def construct(self):
+        board = self.storyboard
+        if board is None:
+            raise ValueError("StoryboardScene only plays compiled storyboards, e.g. CoreTransitStoryboard")
+        self.title = Text(_(board["title"]), font_size=board["title_font_size"]).to_edge(UP)
+        self.play(Write(self.title))
+        self.setup_topology(board["topology"])
+        self.setup_packet(board["packet"])
+
+        self.highlight = None
+        for number, (digest, step) in enumerate(zip(step_digests(board), board["steps"])):
+            self.next_section(f"step_{number + 1:02d}_{digest[:12]}")
+            caption = None
+            if step["caption"]:
+                caption = Text(_(step["caption"]), font_size=24).next_to(self.title, DOWN, buff=0.2)
+                self.play(Write(caption))
+            for action in step["actions"]:
+                getattr(self, f"play_{action['kind']}")(action)
+            self.wait(step["hold"])
+            self.clear_highlight()
+            if caption is not None:
+                self.play(FadeOut(caption))
+        self.wait(2)
+
+    # --- Setup ---
+
+    def setup_topology(self, topology):
+        self.topology = create_l2vpn_topology().scale(0.9).shift(RIGHT * topology["shift"][0] + UP * topology["shift"][1])
+        routers, links, labels = self.topology
+        active = {ROUTERS.index(name) for name in topology["active"]}
+        active_links = {i for i in range(len(links)) if i in active and i + 1 in active}
+        # Site labels belong to their CE, the provider label to the P routers
+        label_owners = ({0}, {len(ROUTERS) - 1}, {2, 3})
+        active_labels = {i for i, owners in enumerate(label_owners) if owners & active}
+
+        shown = [
+            Create(VGroup(*[routers[i] for i in sorted(active)])),
+            Create(VGroup(*[links[i] for i in sorted(active_links)])) if active_links else None,
+            Write(VGroup(*[labels[i] for i in sorted(active_labels)])) if active_labels else None,
+        ]
+        dimmed = VGroup(
+            *[routers[i] for i in range(len(routers)) if i not in active],
+            *[links[i] for i in range(len(links)) if i not in active_links],
+            *[labels[i] for i in range(len(labels)) if i not in active_labels],
+        )
+        if len(dimmed):
+            shown.append(FadeIn(dimmed.set_opacity(DIMMED_OPACITY)))
+        self.play(*[animation for animation in shown if animation is not None])
+        self.wait(0.5)
+
+    def setup_packet(self, packet):
+        self.segment_names = list(packet["segments"])
+        self.packet = VGroup(*[
+            create_storyboard_segment(name, packet["texts"][name], packet["colors"][name])
+            for name in self.segment_names
+        ]).arrange(RIGHT, buff=0)
+        self.packet.next_to(self.topology[0][ROUTERS.index(packet["at"])], RIGHT, buff=0.1)
+        self.at = ROUTERS.index(packet["at"])
+        self.play(FadeIn(self.packet))
+
+    # --- Actions ---
+
+    def clear_highlight(self, animations=None):
+        """Fades the current highlight out, within `animations` when given."""
+        if self.highlight is None:
+            return
+        if animations is None:
+            self.play(FadeOut(self.highlight))
+        else:
+            animations.append(FadeOut(self.highlight))
+        self.highlight = None
+
+    def segment(self, name):
+        return self.packet[self.segment_names.index(name)]
+
+    def play_highlight(self, action):
+        self.clear_highlight()
+        self.highlight = SurroundingRectangle(self.segment(action["segment"]),
+                                              color=storyboard_color(action["color"]), buff=0.05)
+        self.play(Create(self.highlight))
+
+    def play_move(self, action):
+        routers, links, _labels = self.topology
+        target = ROUTERS.index(action["to"])
+        path = [links[i] for i in range(self.at, target)]
+        packet = self.packet
+        end = routers[target].get_left() - LEFT * packet.width / 2 - LEFT * 0.1
+        animations = [MoveAlongPath(packet, Line(packet.get_center(), end))]
+        animations += [link.animate.set_color(YELLOW_C) for link in path]
+        self.clear_highlight(animations)
+        self.play(*animations, run_time=2 * len(path))
+        self.play(*[link.animate.set_color(WHITE) for link in path])
+        self.at = target
+
+    def play_swap(self, action):
+        index = self.segment_names.index(action["segment"])
+        old = self.packet[index]
+        color = action["color"] or SEGMENTS[action["segment"]][2]
+        new = create_packet_segment(action["text"], old[0].width / PACKET_SCALE, old[0].height / PACKET_SCALE,
+                                    storyboard_color(color)).scale(PACKET_SCALE).move_to(old.get_center())
+        self.play(FadeOut(old[1]))
+        self.play(ReplacementTransform(old[0], new[0]), FadeIn(new[1]))
+        # Swap the label through the Mobject API so both renderers see the new family
+        self.packet.remove(old)
+        self.packet.insert(index, new)
+        self.add(self.packet)
+
+    def play_pop(self, action):
+        index = self.segment_names.index(action["segment"])
+        removed = self.packet[index]
+        center = self.packet.get_center()
+        self.packet.remove(removed)
+        self.segment_names.pop(index)
+        closed = self.packet.copy().arrange(RIGHT, buff=0).move_to(center)
+        self.play(
+            FadeOut(removed, shift=DOWN * 0.5),
+            *[part.animate.move_to(place.get_center()) for part, place in zip(self.packet, closed)],
+            run_time=1.5,
+        )
+
+    def play_push(self, action):
+        order = list(SEGMENTS)
+        index = sum(order.index(name) < order.index(action["segment"]) for name in self.segment_names)
+        added = create_storyboard_segment(action["segment"], action["text"], action["color"])
+        parts = list(self.packet)
+        # The packet grows to the left, as encapsulation prepends headers
+        layout = VGroup(*[part.copy() for part in parts[:index]], added,
+                        *[part.copy() for part in parts[index:]]).arrange(RIGHT, buff=0)
+        layout.align_to(self.packet, RIGHT).align_to(self.packet, DOWN)
+        places = [layout[i] for i in range(len(layout)) if i != index]
+        self.play(
+            FadeIn(added, shift=RIGHT * 0.5),
+            *[part.animate.move_to(place.get_center()) for part, place in zip(parts, places)],
+        )
+        self.remove(added)
+        self.packet.insert(index, added)
+        self.segment_names.insert(index, action["segment"])
+        self.add(self.packet)
+
+    def play_wait(self, action):
+        self.wait(action["seconds"])
+
+
+def compile_storyboard(path) -> type:
+    """Builds the Scene class of one storyboard file."""
+    board = load_storyboard(path)
+    for name in [board["packet"]["colors"][segment] for segment in board["packet"]["segments"]] + [
+        action["color"] for step in board["steps"] for action in step["actions"] if action.get("color")
+    ]:
+        storyboard_color(name)  # fail at import, not halfway through a render
+    return type(board["scene"], (StoryboardScene,), {
+        "storyboard": board,
+        "__module__": __name__,
+        "__doc__": f"Compiled from {path}.",
+    })
+
+
+def _register_storyboards():
+    """Every storyboard becomes a module-level Scene, so manim and the render tools find it by name."""
+    for path in storyboard_paths():
+        scene_class = compile_storyboard(path)
+        globals()[scene_class.__name__] = scene_class
+
+
+_register_storyboards()
+
+# To run a storyboard:
+# manim -pql l2vpn_storyboard_scenes.py CoreTransitStoryboard
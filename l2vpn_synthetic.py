@@ -0,0 +1,311 @@
+"""
+Randomized, seed-deterministic L2 VPN diagrams for dataset generation.
+
+Every sample is a valid topology (CEs on PEs, PEs joined through a chain of P
+routers) plus the label stack of a packet on one of the core links, with
+random T-L/VC-L values, optional control word and PHP or non-PHP popping.
+Samples are built from create_router, create_packet_segment and the color
+constants, rendered in memory (render_frames) and streamed to sharded .npz
+files by a process pool.
+
+Sample i depends only on (seed, i), so output is identical whatever the
+number of processes, and finished shards are skipped when a job is re-run.
+
+    python l2vpn_synthetic.py --out data/l2vpn --samples 1000000 --seed 7
+    python l2vpn_synthetic.py --out data/clips --samples 20000 --clip-frames 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import (
+    VGroup,
+    Line,
+    Dot,
+    Text,
+    UP,
+    DOWN,
+    RIGHT,
+    WHITE,
+    YELLOW_C,
+    BLUE_E,
+    GREY_BROWN,
+)
+
+from l2vpn_elements import (
+    create_router,
+    CUSTOMER_COLOR,
+    PROVIDER_COLOR,
+    PACKET_COLOR,
+    LABEL_COLOR,
+)
+from l2vpn_flow_scenes import create_packet_segment
+from render_frames import FrameRenderer, element_boxes
+from render_pipeline import capture_into
+
+MIN_LABEL = 16  # 0-15 are reserved MPLS label values
+MAX_LABEL = 2 ** 20 - 1
+
+ROUTER_SCALE = 0.6
+CORE_Y = 0.8
+PACKET_Y = -2.6
+
+
+# --- Sample specification ---
+
+def sample_spec(rng: np.random.Generator) -> dict:
+    """
+    Draws the random parameters of one sample.
+
+    Returns:
+        A JSON-serializable dict describing topology, label stack and packet position.
+    """
+    n_p = int(rng.integers(0, 5))
+    n_pe = int(rng.integers(2, 5))
+    ces_per_pe = [int(rng.integers(1, 3)) for _ in range(n_pe)]
+    # Extra PEs hang off a P router, or off PE1 when the core has none.
+    extra_pe_attach = [int(rng.integers(0, max(n_p, 1))) for _ in range(n_pe - 2)]
+    n_hops = n_p + 1
+    hop = int(rng.integers(0, n_hops))
+    php = bool(rng.integers(0, 2))
+    return {
+        "n_p": n_p,
+        "n_pe": n_pe,
+        "ces_per_pe": ces_per_pe,
+        "extra_pe_attach": extra_pe_attach,
+        "hop": hop,
+        "php": php,
+        "control_word": bool(rng.integers(0, 2)),
+        # One transport label per core link, swapped at every P router.
+        "t_labels": [int(v) for v in rng.integers(MIN_LABEL, MAX_LABEL + 1, size=n_hops)],
+        "vc_label": int(rng.integers(MIN_LABEL, MAX_LABEL + 1)),
+        # With PHP the penultimate router pops the transport label on the last link.
+        "has_t_label": not (php and hop == n_hops - 1),
+    }
+
+
+# --- Building mobjects ---
+
+class ElementCache:
+    """
+    Per-process cache of Text-bearing elements. Pango layout dominates the cost
+    of a sample, so routers, fixed segments and digit glyphs are built once and
+    copied afterwards; label values are composed from cached digits.
+    """
+    def __init__(self):
+        self._routers = {}
+        self._segments = {}
+        self._glyphs = {}
+
+    def router(self, label_text, color):
+        key = (label_text, color.to_hex())
+        if key not in self._routers:
+            self._routers[key] = create_router(label_text, color).scale(ROUTER_SCALE)
+        return self._routers[key].copy()
+
+    def segment(self, label_text, width, color):
+        key = (label_text, width, color.to_hex())
+        if key not in self._segments:
+            self._segments[key] = create_packet_segment(label_text, width, 0.5, color)
+        return self._segments[key].copy()
+
+    def number(self, value, font_size=14):
+        glyphs = VGroup()
+        for char in str(value):
+            key = (char, font_size)
+            if key not in self._glyphs:
+                self._glyphs[key] = Text(char, font_size=font_size, color=WHITE)
+            glyphs.add(self._glyphs[key].copy())
+        return glyphs.arrange(RIGHT, buff=0.02)
+
+    def label_segment(self, name, value, width, color):
+        """A segment reading e.g. "T-L" over "1027", built from cached parts."""
+        segment = self.segment(name, width, color)
+        rect, label = segment
+        label.scale(0.8).move_to(rect.get_center()).shift(UP * 0.1 * rect.height)
+        digits = self.number(value).next_to(label, DOWN, buff=0.04)
+        if digits.width > rect.width * 0.9:
+            digits.scale_to_fit_width(rect.width * 0.9)
+        segment.add(digits)
+        return segment
+
+
+def build_sample(spec: dict, cache: ElementCache) -> tuple:
+    """
+    Builds the diagram for one spec.
+
+    Returns:
+        (topology, packet, marker_link, elements): the static topology VGroup,
+        the label stack VGroup, the (start, end) points of the link the packet
+        is on, and (label, mobject) pairs for bounding boxes.
+    """
+    elements = []
+    n_p = spec["n_p"]
+
+    # Core chain PE1 - P1 ... Pn - PE2, evenly spaced.
+    xs = np.linspace(-4.5, 4.5, n_p + 2)
+    core = [cache.router("PE1", PROVIDER_COLOR)]
+    core += [cache.router(f"P{i + 1}", PROVIDER_COLOR) for i in range(n_p)]
+    core += [cache.router("PE2", PROVIDER_COLOR)]
+    for router, x in zip(core, xs):
+        router.move_to([x, CORE_Y, 0])
+    pes = [core[0], core[-1]]
+    links = [(a, b) for a, b in zip(core, core[1:])]
+
+    # Extra PEs hang above (PE3) or below (PE4) the P router, or PE1, they attach to.
+    for index, attach in enumerate(spec["extra_pe_attach"]):
+        anchor = core[1 + attach] if n_p else core[0]
+        pe = cache.router(f"PE{index + 3}", PROVIDER_COLOR)
+        pe.move_to(anchor.get_center() + (UP if index == 0 else DOWN) * 1.5)
+        pes.append(pe)
+        links.append((anchor, pe))
+
+    # CEs: left of PE1, right of PE2, and further out from the extra PEs.
+    ces = []
+    for pe_index, (pe, n_ce) in enumerate(zip(pes, spec["ces_per_pe"])):
+        site = chr(ord("A") + pe_index)
+        for ce_index in range(n_ce):
+            ce = cache.router(f"CE-{site}{ce_index + 1}", CUSTOMER_COLOR)
+            spread = (ce_index - (n_ce - 1) / 2) * 1.0
+            if pe_index == 0:
+                ce.move_to(pe.get_center() + np.array([-1.7, spread, 0]))
+            elif pe_index == 1:
+                ce.move_to(pe.get_center() + np.array([1.7, spread, 0]))
+            else:
+                outward = UP if pe.get_center()[1] > CORE_Y else DOWN
+                ce.move_to(pe.get_center() + outward * 1.1 + RIGHT * spread * 1.4)
+            ces.append(ce)
+            links.append((pe, ce))
+
+    active_a, active_b = core[spec["hop"]], core[spec["hop"] + 1]
+    lines = VGroup(*[
+        Line(a.get_center(), b.get_center(), stroke_width=2,
+             color=YELLOW_C if a is active_a and b is active_b else WHITE)
+        for a, b in links
+    ])
+    routers = VGroup(*core, *pes[2:], *ces)
+    for router in routers:
+        elements.append((f"router:{router[1].original_text}", router))
+    topology = VGroup(lines, routers)
+
+    # Label stack of the packet on the active core link.
+    parts = [("P-Hdr", cache.segment("P-Hdr", 1.0, PROVIDER_COLOR))]
+    if spec["has_t_label"]:
+        t_value = spec["t_labels"][spec["hop"]]
+        parts.append(("T-L", cache.label_segment("T-L", t_value, 1.0, BLUE_E)))
+    parts.append(("VC-L", cache.label_segment("VC-L", spec["vc_label"], 1.0, LABEL_COLOR)))
+    if spec["control_word"]:
+        parts.append(("CW", cache.segment("CW", 0.6, GREY_BROWN)))
+    parts.append(("Eth Hdr", cache.segment("Eth Hdr", 1.2, CUSTOMER_COLOR)))
+    parts.append(("Payload", cache.segment("Payload", 1.8, PACKET_COLOR)))
+    packet = VGroup(*[segment for _, segment in parts]).arrange(RIGHT, buff=0)
+    packet.scale(0.9).move_to([0, PACKET_Y, 0])
+    for name, segment in parts:
+        elements.append((f"segment:{name}", segment))
+
+    return topology, packet, (active_a.get_center(), active_b.get_center()), elements
+
+
+# --- Sharded, parallel output ---
+
+_worker = {}
+
+
+def _init_worker(pixel_width, pixel_height):
+    _worker["renderer"] = FrameRenderer(pixel_width, pixel_height)
+    _worker["cache"] = ElementCache()
+
+
+def _render_sample(spec, clip_frames, images, boxes_out):
+    renderer, cache = _worker["renderer"], _worker["cache"]
+    camera = renderer.camera
+    topology, packet, (start, end), elements = build_sample(spec, cache)
+    frame = renderer.render(VGroup(topology, packet), elements)
+    if not clip_frames:
+        images[...] = frame.pixels[..., :3]
+        boxes_out.append((frame.boxes, frame.labels))
+        return
+    # Clips: the diagram is rasterized once, each frame only redraws the moving packet marker.
+    background = frame.pixels.copy()
+    marker = Dot(radius=0.09, color=PACKET_COLOR)
+    target = camera.pixel_array
+    for index, alpha in enumerate(np.linspace(0, 1, clip_frames)):
+        marker.move_to(start + alpha * (end - start))
+        np.copyto(target, background)
+        capture_into(camera, camera.get_mobjects_to_display([marker]), target)
+        images[index] = target[..., :3]
+        marker_boxes, marker_labels = element_boxes(camera, [("packet", marker)])
+        boxes_out.append((np.concatenate([frame.boxes, marker_boxes]), frame.labels + marker_labels))
+
+
+def _write_shard(job):
+    out_dir, shard_index, first, count, seed, pixel_width, pixel_height, clip_frames = job
+    path = Path(out_dir) / f"shard-{shard_index:05d}.npz"
+    if path.exists():
+        return shard_index, count, True
+    frames_per_sample = max(clip_frames, 1)
+    shape = (count, frames_per_sample, pixel_height, pixel_width, 3) if clip_frames else (count, pixel_height, pixel_width, 3)
+    images = np.empty(shape, dtype=np.uint8)
+    records = []
+    specs = []
+    for offset in range(count):
+        sample_index = first + offset
+        spec = sample_spec(np.random.default_rng([seed, sample_index]))
+        spec["index"] = sample_index
+        specs.append(json.dumps(spec))
+        _render_sample(spec, clip_frames, images[offset], records)
+
+    box_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    box_offsets[1:] = np.cumsum([len(labels) for _, labels in records])
+    boxes = np.concatenate([b for b, _ in records]) if records else np.zeros((0, 4), np.float32)
+    labels = np.array([label for _, record_labels in records for label in record_labels])
+
+    # Write-then-rename, so an interrupted job never leaves a truncated shard behind.
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez(tmp_path, images=images, boxes=boxes, box_offsets=box_offsets, box_labels=labels, specs=np.array(specs))
+    os.replace(tmp_path, path)
+    return shard_index, count, False
+
+
+def generate(out_dir, samples: int, seed: int = 0, shard_size: int = 1000, pixel_width: int = 320,
+             pixel_height: int = 180, clip_frames: int = 0, processes: int = None):
+    """
+    Generates `samples` labeled samples into sharded .npz files under `out_dir`.
+
+    Each shard holds images (N, H, W, 3) or (N, T, H, W, 3) for clips, boxes
+    (M, 4) with box_offsets (one record per image/frame) and box_labels, and
+    the JSON spec of every sample.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (str(out_dir), shard_index, first, min(shard_size, samples - first), seed, pixel_width, pixel_height, clip_frames)
+        for shard_index, first in enumerate(range(0, samples, shard_size))
+    ]
+    (out_dir / "manifest.json").write_text(json.dumps({
+        "samples": samples, "seed": seed, "shard_size": shard_size, "shards": len(jobs),
+        "pixel_width": pixel_width, "pixel_height": pixel_height, "clip_frames": clip_frames,
+    }, indent=2))
+    done = 0
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(pixel_width, pixel_height)) as pool:
+        for shard_index, count, skipped in pool.imap_unordered(_write_shard, jobs):
+            done += count
+            print(f"shard {shard_index:05d} {'skipped' if skipped else 'written'} ({done}/{samples})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate random labeled L2 VPN diagrams.")
+    parser.add_argument("--out", required=True, help="output directory for shards")
+    parser.add_argument("--samples", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=1000)
+    parser.add_argument("--size", default="320x180", help="WIDTHxHEIGHT in pixels")
+    parser.add_argument("--clip-frames", type=int, default=0, help="frames per sample; 0 renders stills")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    generate(args.out, args.samples, args.seed, args.shard_size, width, height, args.clip_frames, args.processes)
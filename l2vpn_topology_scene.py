@@ -7,7 +7,6 @@ from manim import (
     Write,
     FadeIn,
     FadeOut,
-    LaggedStart,
     SurroundingRectangle,
     UP,
     DOWN,
@@ -28,6 +27,8 @@ from l2vpn_elements import (
     PACKET_COLOR, # Though not explicitly used, good to have if expanding
     LABEL_COLOR,
 )
+from l2vpn_i18n import _
+from l2vpn_animations import GroupReveal
 
 # Configure default font size for slides if needed
 config.font_size = 36
@@ -38,14 +39,14 @@ class L2VPNTopologyScene(Scene):
     """
     def construct(self):
         # --- Part 1: Introduce Components ---
-        title_components = Text("L2 VPN Topology Components", font_size=48).to_edge(UP)
+        title_components = Text(_("L2 VPN Topology Components"), font_size=48).to_edge(UP)
         self.play(Write(title_components))
         self.wait(0.5)
 
         # CE Router
         ce_router_example = create_router("CE1", CUSTOMER_COLOR).scale(0.8)
-        ce_label = Text("CE: Customer Edge Router", font_size=28).next_to(ce_router_example, RIGHT, buff=0.5)
-        ce_desc = Text("At customer premise, connects to provider.", font_size=24, color=LABEL_COLOR).next_to(ce_label, DOWN, buff=0.2, aligned_edge=LEFT)
+        ce_label = Text(_("CE: Customer Edge Router"), font_size=28).next_to(ce_router_example, RIGHT, buff=0.5)
+        ce_desc = Text(_("At customer premise, connects to provider."), font_size=24, color=LABEL_COLOR).next_to(ce_label, DOWN, buff=0.2, aligned_edge=LEFT)
         ce_group = VGroup(ce_router_example, ce_label, ce_desc).move_to(ORIGIN + UP * 1.5)
 
         self.play(Create(ce_router_example))
@@ -55,12 +56,12 @@ class L2VPNTopologyScene(Scene):
 
         # PE Router
         pe_router_example = create_router("PE1", PROVIDER_COLOR).scale(0.8)
-        pe_label = Text("PE: Provider Edge Router", font_size=28).next_to(pe_router_example, RIGHT, buff=0.5)
-        pe_desc = Text("At provider network edge, L2 VPN functions happen here.", font_size=24, color=LABEL_COLOR).next_to(pe_label, DOWN, buff=0.2, aligned_edge=LEFT)
+        pe_label = Text(_("PE: Provider Edge Router"), font_size=28).next_to(pe_router_example, RIGHT, buff=0.5)
+        pe_desc = Text(_("At provider network edge, L2 VPN functions happen here."), font_size=24, color=LABEL_COLOR).next_to(pe_label, DOWN, buff=0.2, aligned_edge=LEFT)
         pe_group = VGroup(pe_router_example, pe_label, pe_desc).move_to(ORIGIN - UP * 0.5)
         
         # Adjust description to fit
-        pe_desc_line2 = Text("(encapsulation/decapsulation)", font_size=20, color=LABEL_COLOR).next_to(pe_desc, DOWN, buff=0.1, aligned_edge=LEFT)
+        pe_desc_line2 = Text(_("(encapsulation/decapsulation)"), font_size=20, color=LABEL_COLOR).next_to(pe_desc, DOWN, buff=0.1, aligned_edge=LEFT)
         pe_desc_full = VGroup(pe_desc, pe_desc_line2)
 
 
@@ -71,8 +72,8 @@ class L2VPNTopologyScene(Scene):
         
         # P Router
         p_router_example = create_router("P", PROVIDER_COLOR).scale(0.8)
-        p_label = Text("P: Provider Router", font_size=28).next_to(p_router_example, RIGHT, buff=0.5)
-        p_desc = Text("Core provider router, MPLS switching, unaware of customer VPNs.", font_size=24, color=LABEL_COLOR).next_to(p_label, DOWN, buff=0.2, aligned_edge=LEFT)
+        p_label = Text(_("P: Provider Router"), font_size=28).next_to(p_router_example, RIGHT, buff=0.5)
+        p_desc = Text(_("Core provider router, MPLS switching, unaware of customer VPNs."), font_size=24, color=LABEL_COLOR).next_to(p_label, DOWN, buff=0.2, aligned_edge=LEFT)
         p_group = VGroup(p_router_example, p_label, p_desc).move_to(ORIGIN - UP * 2.5)
 
         self.play(Create(p_router_example))
@@ -91,7 +92,7 @@ class L2VPNTopologyScene(Scene):
         self.wait(0.5)
 
         # --- Part 2: Show Connected Topology ---
-        title_topology = Text("L2 VPN Connected Topology", font_size=48).to_edge(UP)
+        title_topology = Text(_("L2 VPN Connected Topology"), font_size=48).to_edge(UP)
         self.play(Write(title_topology))
         self.wait(0.5)
 
@@ -131,24 +132,24 @@ class L2VPNTopologyScene(Scene):
             fill_color=PROVIDER_COLOR,
             fill_opacity=0.1
         )
-        provider_network_label = Text("Provider Network", font_size=24).next_to(provider_network_rect, UP, buff=0.2)
+        provider_network_label = Text(_("Provider Network"), font_size=24).next_to(provider_network_rect, UP, buff=0.2)
         
         # Animate router appearances
         # Customer Site A elements
-        site_a_label = Text("Customer Site A", font_size=24).next_to(ce_a1, UP, buff=0.3)
+        site_a_label = Text(_("Customer Site A"), font_size=24).next_to(ce_a1, UP, buff=0.3)
         
         # Customer Site B elements
-        site_b_label = Text("Customer Site B", font_size=24).next_to(ce_b1, UP, buff=0.3)
+        site_b_label = Text(_("Customer Site B"), font_size=24).next_to(ce_b1, UP, buff=0.3)
 
         self.play(
-            LaggedStart(
-                Create(ce_a1), Write(site_a_label),
-                Create(pe_1),
-                Create(p_1),
-                Create(p_2),
-                Create(pe_2),
-                Create(ce_b1), Write(site_b_label),
-                Create(provider_network_rect), Write(provider_network_label),
+            GroupReveal(
+                ce_a1, (site_a_label, "write"),
+                pe_1,
+                p_1,
+                p_2,
+                pe_2,
+                ce_b1, (site_b_label, "write"),
+                provider_network_rect, (provider_network_label, "write"),
                 lag_ratio=0.3,
                 run_time=4
             )
@@ -0,0 +1,144 @@
+import os
+
+import numpy as np
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    Line,
+    Create,
+    Write,
+    FadeIn,
+    ValueTracker,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    WHITE,
+    linear,
+    config,
+)
+
+# Project specific imports
+from l2vpn_flow_scenes import create_l2vpn_topology
+from l2vpn_flowrecords import (
+    DEFAULT_CAPACITY_BPS,
+    TOPOLOGY_LINKS,
+    LoadAccumulator,
+    load_load,
+    synthetic_records,
+)
+from l2vpn_i18n import _
+from l2vpn_signaling_scene import HEAT_COLORS, heat_color
+
+# Configure default font size for slides if needed
+config.font_size = 28
+
+LINK_LOAD_ENV = "L2VPN_LINK_LOAD"  # .npz written by `l2vpn_flowrecords.py aggregate`
+LINK_CAPACITY_ENV = "L2VPN_LINK_CAPACITY"  # bits per second of every link
+REPLAY_SECONDS = 12
+SAMPLE_RECORDS = 200000
+SAMPLE_BIN_SECONDS = 900.0
+
+
+def sample_load():
+    """A synthetic day of flow records, aggregated like a real export."""
+    start, end, link, size = synthetic_records(SAMPLE_RECORDS)
+    accumulator = LoadAccumulator(SAMPLE_BIN_SECONDS)
+    accumulator.add(start, end, link.astype(np.int64), size, len(TOPOLOGY_LINKS))
+    return accumulator.result(TOPOLOGY_LINKS)
+
+
+def utilization_colors(utilization: np.ndarray) -> list:
+    """Stroke color and width of every (link, bin) cell, computed once before the replay."""
+    levels = np.clip(utilization, 0.0, 1.0)
+    return [[(heat_color(level), 2 + 8 * level) for level in row.tolist()] for row in levels]
+
+
+class LinkUtilizationScene(Scene):
+    """
+    Replays a day of link utilization on the packet-flow topology, colored
+    from a per-link, per-bin matrix aggregated from flow records.
+
+        python l2vpn_flowrecords.py aggregate flows/ --bin 300 -o load.npz
+        L2VPN_LINK_LOAD=load.npz manim -qh l2vpn_utilization_scene.py LinkUtilizationScene
+    """
+    def construct(self):
+        load_path = os.environ.get(LINK_LOAD_ENV)
+        if load_path:
+            load = load_load(load_path)
+            capacity = float(os.environ.get(LINK_CAPACITY_ENV, DEFAULT_CAPACITY_BPS))
+        else:
+            load = sample_load()
+            capacity = load.bytes.max() * 8 / load.bin_seconds / 0.9  # peak at 90 %
+        utilization = load.utilization(capacity)
+
+        title = Text(_("Link Utilization Replay"), font_size=40).to_edge(UP)
+        self.play(Write(title))
+        topology = create_l2vpn_topology().scale(0.9).shift(DOWN * 0.5)
+        routers, lines, labels = topology
+        self.play(Create(routers), Create(lines), Write(labels))
+
+        # Rows of the matrix in drawing order; links missing from the data stay idle
+        rows = [load.link_names.index(name) if name in load.link_names else None for name in TOPOLOGY_LINKS]
+        idle = [(heat_color(0.0), 2)] * utilization.shape[1]
+        styles = utilization_colors(utilization)
+        link_styles = [styles[row] if row is not None else idle for row in rows]
+
+        legend_bar = Line(LEFT * 0.8, RIGHT * 0.8, stroke_width=8).set_color(list(HEAT_COLORS))
+        legend = VGroup(Text("0 %", font_size=18), legend_bar, Text("100 %", font_size=18))
+        legend.arrange(RIGHT, buff=0.15).to_corner(DOWN + RIGHT, buff=0.4)
+        caption = Text(
+            _("{links} links, {bins} bins of {minutes:g} min, from flow records").format(
+                links=len(load.link_names), bins=utilization.shape[1], minutes=load.bin_seconds / 60),
+            font_size=22,
+        ).next_to(title, DOWN, buff=0.2)
+        self.play(FadeIn(legend), FadeIn(caption))
+
+        n_bins = utilization.shape[1]
+        bin_index = ValueTracker(0)
+
+        def current_bin():
+            return min(int(bin_index.get_value()), n_bins - 1)
+
+        for line, styles_of_line in zip(lines, link_styles):
+            def restyle(mob, styles_of_line=styles_of_line):
+                color, width = styles_of_line[current_bin()]
+                mob.set_stroke(color=color, width=width)
+            line.add_updater(restyle)
+
+        # Clock in bin time, rebuilt only when the bin changes
+        def clock_text(index):
+            seconds = int(load.origin + index * load.bin_seconds)
+            return Text(f"{seconds // 3600 % 24:02d}:{seconds // 60 % 60:02d}", font_size=28).to_corner(
+                DOWN + LEFT, buff=0.4)
+
+        clock = clock_text(0)
+        shown = {"bin": 0}
+
+        def update_clock(mob):
+            index = current_bin()
+            if index != shown["bin"]:
+                shown["bin"] = index
+                mob.become(clock_text(index))
+        clock.add_updater(update_clock)
+        self.add(clock)
+
+        self.play(bin_index.animate.set_value(n_bins - 1), run_time=REPLAY_SECONDS, rate_func=linear)
+        for line in lines:
+            line.clear_updaters()
+        clock.clear_updaters()
+
+        # Peak per link, in the same colors
+        peaks = VGroup(*[
+            Text(f"{utilization[row].max():.0%}" if row is not None else "-", font_size=18,
+                 color=heat_color(min(float(utilization[row].max()), 1.0)) if row is not None else WHITE)
+            .next_to(line, DOWN, buff=0.25)
+            for line, row in zip(lines, rows)
+        ])
+        peak_caption = Text(_("Peak utilization per link"), font_size=22).next_to(peaks, DOWN, buff=0.4)
+        self.play(FadeIn(peaks), Write(peak_caption))
+        self.wait(3)
+
+# To run this scene:
+# manim -pql l2vpn_utilization_scene.py LinkUtilizationScene
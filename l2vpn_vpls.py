@@ -0,0 +1,240 @@
+"""
+VPLS (multipoint L2 VPN) simulation: MAC learning, flooding and split horizon.
+
+N PEs of one VPLS instance are joined by a full mesh of pseudowires. For
+every customer frame (time, ingress PE, source MAC, destination MAC):
+
+    learning       the ingress PE learns the source MAC on its attachment
+                   circuit; a PE receiving the frame over a pseudowire learns
+                   it behind the ingress PE
+    forwarding     a known destination is switched locally or sent over one
+                   pseudowire; broadcast, multicast and unknown or aged-out
+                   destinations are flooded over every pseudowire
+    split horizon  frames received over a pseudowire only go to attachment
+                   circuits, never to other pseudowires (counted as
+                   suppressed copies)
+
+MAC addresses are mapped once to dense ids (np.unique), so every PE's MAC
+table is two flat typed arrays indexed by MAC id: the PE the MAC sits behind
+(-1 when empty) and when it was last seen, as float32 seconds since the
+first frame of the trace (relative, so a capture with epoch timestamps still
+ages to within 8 ms a day in). Lookup, learning and aging are O(1);
+periodic sweeps expire idle entries through zero-copy NumPy views of the
+same buffers. Memory is 6 bytes per PE per distinct MAC, e.g. 96 MB
+for 16 PEs and a million MACs.
+
+A million-frame trace runs in a few seconds, so capacity questions (table
+size per PE, flood share, pseudowire load) can be asked of a synthetic or
+captured trace:
+
+    python l2vpn_vpls.py --pes 16 --hosts 50000 --frames 1000000
+    python l2vpn_vpls.py --pes 32 --hosts 200000 --frames 1000000 --aging 60
+"""
+import argparse
+import time
+from array import array
+from typing import NamedTuple
+
+import numpy as np
+
+BROADCAST_MAC = 0xFFFFFFFFFFFF
+DEFAULT_AGING_SECONDS = 300.0  # the common bridge default
+DEFAULT_BUCKETS = 50
+
+# Event kinds of recorded frames
+LOCAL, UNICAST, FLOOD = range(3)
+
+
+class FrameTrace(NamedTuple):
+    time: np.ndarray  # (n,) float64 seconds, non-decreasing
+    ingress: np.ndarray  # (n,) int16 PE the frame enters the VPLS at
+    src: np.ndarray  # (n,) uint64 48-bit MAC
+    dst: np.ndarray  # (n,) uint64 48-bit MAC
+
+
+def format_mac(value: int) -> str:
+    return ":".join(f"{(int(value) >> shift) & 0xFF:02x}" for shift in range(40, -8, -8))
+
+
+def synthetic_trace(n_pes: int, n_hosts: int, n_frames: int, broadcast_share: float = 0.02,
+                    zipf: float = 1.2, rate: float = 20000.0, seed: int = 0) -> FrameTrace:
+    """
+    Random traffic between hosts spread over the PEs: destinations follow a
+    Zipf-like popularity, a share of frames is broadcast (ARP and the like).
+
+    Args:
+        n_pes: PEs in the VPLS instance.
+        n_hosts: Distinct host MACs; host h sits behind PE h % n_pes.
+        n_frames: Frames in the trace.
+        broadcast_share: Share of frames sent to the broadcast address.
+        zipf: Popularity exponent of destinations.
+        rate: Mean frames per second (Poisson arrivals).
+        seed: Seed; equal seeds give equal traces.
+    """
+    rng = np.random.default_rng(seed)
+    base = np.uint64(0x02005E000000)  # locally administered
+    popularity = 1.0 / np.arange(1, n_hosts + 1) ** zipf
+    popularity /= popularity.sum()
+    src_host = rng.integers(0, n_hosts, size=n_frames)
+    dst_host = rng.permutation(n_hosts)[rng.choice(n_hosts, size=n_frames, p=popularity)]
+    dst = base + dst_host.astype(np.uint64)
+    dst[rng.random(n_frames) < broadcast_share] = BROADCAST_MAC
+    return FrameTrace(
+        time=np.cumsum(rng.exponential(1.0 / rate, size=n_frames)),
+        ingress=(src_host % n_pes).astype(np.int16),
+        src=base + src_host.astype(np.uint64),
+        dst=dst,
+    )
+
+
+class MacTables:
+    """
+    The MAC tables of all PEs, as typed arrays indexed by dense MAC id.
+
+    `location[pe][mac]` is the PE the MAC was learned behind (`pe` itself for
+    a local attachment circuit, -1 when empty) and `seen[pe][mac]` when it was
+    last refreshed, in seconds since the start of the trace. numpy_views() exposes the same memory to NumPy.
+    """
+    def __init__(self, n_pes: int, n_macs: int):
+        self.n_pes = n_pes
+        self.n_macs = n_macs
+        self.location = [array("h", [-1]) * n_macs for _ in range(n_pes)]
+        self.seen = [array("f", [0.0]) * n_macs for _ in range(n_pes)]
+        self.entries = [0] * n_pes
+
+    def numpy_views(self, pe: int) -> tuple:
+        return np.frombuffer(self.location[pe], dtype=np.int16), np.frombuffer(self.seen[pe], dtype=np.float32)
+
+    def sweep(self, now: float, aging: float) -> int:
+        """Expires every entry idle for `aging` seconds; returns how many were removed."""
+        removed = 0
+        for pe in range(self.n_pes):
+            location, seen = self.numpy_views(pe)
+            expired = (location >= 0) & (seen <= now - aging)
+            count = int(expired.sum())
+            if count:
+                location[expired] = -1
+                self.entries[pe] -= count
+                removed += count
+        return removed
+
+
+class VplsResult(NamedTuple):
+    bucket_seconds: float
+    frames: np.ndarray  # (n_buckets, 3) LOCAL, UNICAST and FLOOD frames per bucket
+    table_entries: np.ndarray  # (n_buckets, n_pes) live MAC entries at the end of each bucket
+    pseudowire_frames: np.ndarray  # (n_pes, n_pes) frames sent from PE i to PE j
+    suppressed_copies: int  # copies split horizon kept off other pseudowires
+    events: list  # (time, ingress, src id, dst id or -1, kind, receiving PEs) of the first `record` frames
+    macs: np.ndarray  # dense MAC id -> 48-bit MAC
+
+
+def simulate(trace: FrameTrace, n_pes: int, aging: float = DEFAULT_AGING_SECONDS,
+             buckets: int = DEFAULT_BUCKETS, record: int = 0) -> VplsResult:
+    """
+    Runs `trace` through a VPLS instance of `n_pes` PEs.
+
+    Args:
+        trace: The customer frames, in time order.
+        n_pes: PEs in the instance; trace.ingress must be below it.
+        aging: MAC aging time in seconds.
+        buckets: Time buckets of the per-bucket statistics (and of aging sweeps).
+        record: Record full per-frame events for this many leading frames (for animation).
+
+    Returns:
+        A VplsResult.
+    """
+    macs, inverse = np.unique(np.concatenate([trace.src, trace.dst]), return_inverse=True)
+    n = len(trace.time)
+    dst_ids = inverse[n:].astype(np.int64)
+    flood_always = (trace.dst & np.uint64(1 << 40)) != 0  # group bit: broadcast and multicast
+    dst_ids[flood_always] = -1
+    src_ids = inverse[:n].tolist()
+    dst_ids = dst_ids.tolist()
+    start = float(trace.time[0]) if n else 0.0
+    times = (trace.time - start).tolist()  # relative: `seen` is float32
+    ingress = trace.ingress.tolist()
+
+    tables = MacTables(n_pes, len(macs))
+    location, seen, entries = tables.location, tables.seen, tables.entries
+    peers = [[pe for pe in range(n_pes) if pe != ingress_pe] for ingress_pe in range(n_pes)]
+    pw_frames = [[0] * n_pes for _ in range(n_pes)]
+    end = times[-1] if n else 0.0
+    bucket_seconds = end / buckets if end > 0 else 1.0
+    frames = np.zeros((buckets, 3), dtype=np.int64)
+    table_entries = np.zeros((buckets, n_pes), dtype=np.int64)
+    counts = [0, 0, 0]
+    events = []
+    bucket, bucket_end = 0, bucket_seconds
+    suppressed = 0
+
+    for index in range(n):
+        now = times[index]
+        while now > bucket_end and bucket < buckets - 1:
+            frames[bucket] = counts
+            table_entries[bucket] = entries
+            counts = [0, 0, 0]
+            bucket += 1
+            bucket_end += bucket_seconds
+            tables.sweep(bucket_end - bucket_seconds, aging)
+        pe, src, dst = ingress[index], src_ids[index], dst_ids[index]
+
+        here, here_seen = location[pe], seen[pe]
+        if here[src] < 0:
+            entries[pe] += 1
+        here[src] = pe
+        here_seen[src] = now
+
+        target = -1
+        if dst >= 0:
+            target = here[dst]
+            if target >= 0 and now - here_seen[dst] >= aging:
+                here[dst] = target = -1
+                entries[pe] -= 1
+        if target == pe:
+            kind, receivers = LOCAL, ()
+        elif target >= 0:
+            kind, receivers = UNICAST, (target,)
+        else:
+            kind, receivers = FLOOD, peers[pe]
+            suppressed += len(receivers) * (len(receivers) - 1)
+        counts[kind] += 1
+        sent = pw_frames[pe]
+        for receiver in receivers:
+            sent[receiver] += 1
+            remote = location[receiver]
+            if remote[src] < 0:
+                entries[receiver] += 1
+            remote[src] = pe
+            seen[receiver][src] = now
+        if index < record:
+            events.append((start + now, pe, src, dst, kind, tuple(receivers)))
+
+    frames[bucket] = counts
+    table_entries[bucket] = entries
+    return VplsResult(bucket_seconds, frames, table_entries, np.array(pw_frames), suppressed, events, macs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate VPLS MAC learning and flooding.")
+    parser.add_argument("--pes", type=int, default=16)
+    parser.add_argument("--hosts", type=int, default=50000)
+    parser.add_argument("--frames", type=int, default=1000000)
+    parser.add_argument("--broadcast-share", type=float, default=0.02)
+    parser.add_argument("--aging", type=float, default=DEFAULT_AGING_SECONDS)
+    parser.add_argument("--rate", type=float, default=20000.0, help="frames per second of the synthetic trace")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    trace = synthetic_trace(args.pes, args.hosts, args.frames, args.broadcast_share, rate=args.rate, seed=args.seed)
+    started = time.perf_counter()
+    result = simulate(trace, args.pes, args.aging)
+    elapsed = time.perf_counter() - started
+    local, unicast, flood = result.frames.sum(axis=0)
+    print(f"{args.frames} frames, {args.pes} PEs, {len(result.macs)} MACs in {elapsed:.2f}s "
+          f"({args.frames / elapsed:,.0f} frames/s)")
+    print(f"local {local}, unicast {unicast}, flooded {flood} ({flood / max(args.frames, 1):.1%}), "
+          f"split horizon suppressed {result.suppressed_copies} copies")
+    print(f"MAC entries per PE: max {result.table_entries.max()}, final mean {result.table_entries[-1].mean():.0f}")
+    pw = result.pseudowire_frames
+    print(f"busiest pseudowire: PE{pw.argmax() // args.pes + 1} -> PE{pw.argmax() % args.pes + 1}, {pw.max()} frames")
@@ -0,0 +1,214 @@
+import numpy as np
+from manim import (
+    Scene,
+    Text,
+    VGroup,
+    Line,
+    DashedLine,
+    Rectangle,
+    Create,
+    Write,
+    FadeIn,
+    FadeOut,
+    ShowPassingFlash,
+    AnimationGroup,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    UL,
+    UR,
+    DL,
+    DR,
+    ORIGIN,
+    WHITE,
+    BLUE_E,
+    GREY_BROWN,
+    YELLOW_C,
+    config,
+)
+
+# Project specific imports
+from l2vpn_elements import (
+    create_router,
+    CUSTOMER_COLOR,
+    PROVIDER_COLOR,
+    PACKET_COLOR,
+    LABEL_COLOR,
+)
+from l2vpn_i18n import _
+from l2vpn_vpls import BROADCAST_MAC, FLOOD, LOCAL, FrameTrace, simulate, synthetic_trace
+
+# Configure default font size for slides if needed
+config.font_size = 28
+
+HOSTS = ("A", "B", "C", "D")  # one host behind each PE, at sites A-D
+HOST_MAC_BASE = 0x02005E000000
+# (ingress PE, source host, destination host or None for broadcast)
+VPLS_FRAMES = [
+    (0, 0, 1),     # A -> B: nobody knows B yet, PE1 floods
+    (1, 1, 0),     # B -> A: PE2 learned A from the flood, unicast
+    (2, 2, None),  # C broadcasts (ARP): flooded to every PE
+    (3, 3, 2),     # D -> C: PE4 learned C from the broadcast
+    (0, 0, 3),     # A -> D: D's frame only reached PE3, so PE1 floods again
+]
+CONVERGENCE_HOSTS = 400
+CONVERGENCE_FRAMES = 20000
+CONVERGENCE_BUCKETS = 20
+
+
+def create_vpls_topology():
+    """Four PEs joined by a full mesh of pseudowires, each with one CE."""
+    corners = (UL, UR, DR, DL)
+    pes = VGroup(*[
+        create_router(f"PE{i + 1}", PROVIDER_COLOR).scale(0.7).move_to(corner * np.array([2.2, 1.3, 0]) + DOWN * 0.4)
+        for i, corner in enumerate(corners)
+    ])
+    ces = VGroup(*[
+        create_router(f"CE-{host}", CUSTOMER_COLOR).scale(0.6).move_to(corner * np.array([4.3, 1.3, 0]) + DOWN * 0.4)
+        for host, corner in zip(HOSTS, corners)
+    ])
+    access = VGroup(*[Line(pe.get_center(), ce.get_center(), color=WHITE, stroke_width=2) for pe, ce in zip(pes, ces)])
+    pseudowires = {}
+    for i in range(len(pes)):
+        for j in range(i + 1, len(pes)):
+            pseudowires[i, j] = DashedLine(pes[i].get_center(), pes[j].get_center(), color=BLUE_E,
+                                           stroke_width=3, dash_length=0.15)
+    for pw in pseudowires.values():
+        pw.set_z_index(-1)
+    access.set_z_index(-1)
+    return pes, ces, access, pseudowires
+
+
+def pseudowire_path(pseudowires: dict, src: int, dst: int, color):
+    """A copy of the pseudowire between two PEs, oriented from `src` to `dst`."""
+    line = pseudowires[min(src, dst), max(src, dst)]
+    path = Line(line.get_start(), line.get_end()) if src < dst else Line(line.get_end(), line.get_start())
+    return path.set_stroke(color=color, width=6)
+
+
+class VPLSLearningScene(Scene):
+    """
+    Multipoint L2 VPN (VPLS): PEs learn MAC addresses from the frames they
+    see, flood unknown destinations, and keep to split horizon.
+    """
+    def construct(self):
+        title = Text(_("VPLS: MAC Learning and Flooding"), font_size=40).to_edge(UP)
+        self.play(Write(title))
+
+        pes, ces, access, pseudowires = create_vpls_topology()
+        pw_lines = VGroup(*pseudowires.values())
+        self.play(Create(pes), Create(ces), Create(access))
+        self.play(Create(pw_lines))
+        mesh_text = Text(_("A full mesh of pseudowires joins the PEs of one VPLS instance."), font_size=22)
+        mesh_text.next_to(title, DOWN, buff=0.2)
+        self.play(Write(mesh_text))
+        self.wait(1)
+
+        # MAC table next to every PE, filled as the simulator learns
+        tables = VGroup()
+        for i, pe in enumerate(pes):
+            header = Text(_("MAC table"), font_size=14, color=LABEL_COLOR)
+            side = LEFT if i in (0, 3) else RIGHT
+            header.next_to(pe, DOWN if i in (2, 3) else UP, buff=0.15).shift(side * 0.1)
+            tables.add(VGroup(header))
+        self.play(FadeIn(tables))
+
+        trace = FrameTrace(
+            time=np.arange(1, len(VPLS_FRAMES) + 1, dtype=np.float64),
+            ingress=np.array([pe for pe, _src, _dst in VPLS_FRAMES], dtype=np.int16),
+            src=np.array([HOST_MAC_BASE + src for _pe, src, _dst in VPLS_FRAMES], dtype=np.uint64),
+            dst=np.array([BROADCAST_MAC if dst is None else HOST_MAC_BASE + dst for _pe, _src, dst in VPLS_FRAMES],
+                         dtype=np.uint64),
+        )
+        result = simulate(trace, len(pes), record=len(VPLS_FRAMES))
+        host_of = {mac_id: HOSTS[int(mac) - HOST_MAC_BASE] for mac_id, mac in enumerate(result.macs)
+                   if int(mac) != BROADCAST_MAC}
+        known = [set() for _pe in pes]
+
+        self.play(FadeOut(mesh_text))
+        for _time, ingress, src, dst, kind, receivers in result.events:
+            target = _("broadcast") if dst < 0 else host_of[dst]
+            if kind == FLOOD:
+                caption_text = _("Host {src} -> {dst}: unknown at PE{pe}, flooded to every other PE.")
+            elif kind == LOCAL:
+                caption_text = _("Host {src} -> {dst}: switched locally at PE{pe}.")
+            else:
+                caption_text = _("Host {src} -> {dst}: PE{pe} knows the way, one pseudowire only.")
+            caption = Text(caption_text.format(src=host_of[src], dst=target, pe=ingress + 1), font_size=22)
+            caption.next_to(title, DOWN, buff=0.2)
+            self.play(FadeIn(caption))
+
+            # The frame leaves the CE, then the flooding wave (or unicast) crosses the pseudowires
+            self.play(ShowPassingFlash(
+                Line(ces[ingress].get_center(), pes[ingress].get_center()).set_stroke(color=PACKET_COLOR, width=6),
+                time_width=0.6, run_time=0.6,
+            ))
+            color = LABEL_COLOR if kind == FLOOD else PACKET_COLOR
+            if receivers:
+                self.play(AnimationGroup(*[
+                    ShowPassingFlash(pseudowire_path(pseudowires, ingress, receiver, color), time_width=0.5)
+                    for receiver in receivers
+                ]), run_time=1)
+
+            # Learning: the source behind the ingress PE, at the ingress and at every receiver
+            new_rows = []
+            for pe, location in [(ingress, _("local"))] + [(receiver, f"PE{ingress + 1}") for receiver in receivers]:
+                if src in known[pe]:
+                    continue
+                known[pe].add(src)
+                row = Text(f"{host_of[src]} -> {location}", font_size=14)
+                table = tables[pe]
+                row.next_to(table[-1], DOWN, buff=0.05, aligned_edge=LEFT)
+                table.add(row)
+                new_rows.append(row)
+            if new_rows:
+                self.play(*[FadeIn(row, shift=DOWN * 0.1) for row in new_rows], run_time=0.6)
+            self.wait(0.5)
+            self.play(FadeOut(caption))
+
+        split_horizon = Text(
+            _("Split horizon: a PE never forwards a frame from one pseudowire to another."),
+            font_size=22, color=YELLOW_C,
+        ).next_to(title, DOWN, buff=0.2)
+        self.play(Write(split_horizon))
+        self.wait(2)
+        self.play(FadeOut(VGroup(pes, ces, access, pw_lines, tables, split_horizon)))
+
+        # Convergence over a longer trace: share of flooded frames and table size per bucket
+        long_trace = synthetic_trace(len(pes), CONVERGENCE_HOSTS, CONVERGENCE_FRAMES, rate=1000.0)
+        convergence = simulate(long_trace, len(pes), buckets=CONVERGENCE_BUCKETS)
+        flood_share = convergence.frames[:, FLOOD] / np.maximum(convergence.frames.sum(axis=1), 1)
+        table_share = convergence.table_entries.mean(axis=1) / len(convergence.macs)
+
+        chart_width, chart_height = 8.0, 3.2
+        baseline = Line(ORIGIN, RIGHT * chart_width, color=GREY_BROWN).move_to(DOWN * 1.8)
+        bar_width = chart_width / CONVERGENCE_BUCKETS
+        flood_bars = VGroup(*[
+            Rectangle(width=bar_width * 0.8, height=max(share * chart_height, 0.01),
+                      color=LABEL_COLOR, fill_color=LABEL_COLOR, fill_opacity=0.7, stroke_width=1)
+            .next_to(baseline.get_left() + RIGHT * bar_width * (i + 0.5), UP, buff=0)
+            for i, share in enumerate(flood_share)
+        ])
+        table_marks = VGroup(*[
+            Line(LEFT * bar_width * 0.4, RIGHT * bar_width * 0.4, color=PROVIDER_COLOR, stroke_width=4)
+            .move_to(baseline.get_left() + RIGHT * bar_width * (i + 0.5) + UP * share * chart_height)
+            for i, share in enumerate(table_share)
+        ])
+        chart_title = Text(
+            _("{frames} frames, {hosts} hosts: flooding fades as the tables fill").format(
+                frames=CONVERGENCE_FRAMES, hosts=CONVERGENCE_HOSTS),
+            font_size=24,
+        ).next_to(title, DOWN, buff=0.3)
+        legend = VGroup(
+            Text(_("Flooded share of frames"), font_size=18, color=LABEL_COLOR),
+            Text(_("MAC table fill"), font_size=18, color=PROVIDER_COLOR),
+        ).arrange(RIGHT, buff=0.6).next_to(baseline, DOWN, buff=0.3)
+
+        self.play(Write(chart_title), Create(baseline), FadeIn(legend))
+        self.play(Create(flood_bars), run_time=2)
+        self.play(Create(table_marks), run_time=1.5)
+        self.wait(3)
+
+# To run this scene:
+# manim -pql l2vpn_vpls_scene.py VPLSLearningScene
@@ -31,6 +31,7 @@ from l2vpn_elements import (
     LABEL_COLOR,  # For MPLS labels
     CUSTOMER_COLOR
 )
+from l2vpn_i18n import _
 
 # Configure default font size for slides if needed
 config.font_size = 36
@@ -41,17 +42,17 @@ class MPLSBasicsScene1(Scene):
     """
     def construct(self):
         # Title
-        title = Text("MPLS: Multi-Protocol Label Switching", font_size=48).to_edge(UP)
+        title = Text(_("MPLS: Multi-Protocol Label Switching"), font_size=48).to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
         # Explanatory text
         explanation_text_1 = Text(
-            "Used in provider networks to forward packets based on short labels, not IP addresses.",
+            _("Used in provider networks to forward packets based on short labels, not IP addresses."),
             font_size=28
         ).next_to(title, DOWN, buff=0.5)
         explanation_text_2 = Text(
-            "Improves forwarding speed and enables VPNs, Traffic Engineering.",
+            _("Improves forwarding speed and enables VPNs, Traffic Engineering."),
             font_size=28
         ).next_to(explanation_text_1, DOWN, buff=0.2)
         
@@ -60,17 +61,17 @@ class MPLSBasicsScene1(Scene):
         self.wait(1)
 
         # Introduce labels conceptually
-        labels_intro_title = Text("Key MPLS Labels in L2 VPNs:", font_size=32, color=YELLOW).next_to(explanation_text_2, DOWN, buff=0.7)
+        labels_intro_title = Text(_("Key MPLS Labels in L2 VPNs:"), font_size=32, color=YELLOW).next_to(explanation_text_2, DOWN, buff=0.7)
         self.play(Write(labels_intro_title))
         self.wait(0.5)
 
         # Transport Label
-        transport_label_title = Text("Transport Label (Outer Label):", font_size=28, weight="BOLD").next_to(labels_intro_title, DOWN, buff=0.4, aligned_edge=LEFT)
-        transport_label_desc = Text("Guides packet across provider core (PE to PE).", font_size=24, color=LABEL_COLOR).next_to(transport_label_title, RIGHT, buff=0.3)
+        transport_label_title = Text(_("Transport Label (Outer Label):"), font_size=28, weight="BOLD").next_to(labels_intro_title, DOWN, buff=0.4, aligned_edge=LEFT)
+        transport_label_desc = Text(_("Guides packet across provider core (PE to PE)."), font_size=24, color=LABEL_COLOR).next_to(transport_label_title, RIGHT, buff=0.3)
         
         # VC Label
-        vc_label_title = Text("VC Label (Inner/Service Label):", font_size=28, weight="BOLD").next_to(transport_label_title, DOWN, buff=0.5, aligned_edge=LEFT)
-        vc_label_desc = Text("Identifies the specific L2 VPN service for a customer.", font_size=24, color=LABEL_COLOR).next_to(vc_label_title, RIGHT, buff=0.3)
+        vc_label_title = Text(_("VC Label (Inner/Service Label):"), font_size=28, weight="BOLD").next_to(transport_label_title, DOWN, buff=0.5, aligned_edge=LEFT)
+        vc_label_desc = Text(_("Identifies the specific L2 VPN service for a customer."), font_size=24, color=LABEL_COLOR).next_to(vc_label_title, RIGHT, buff=0.3)
 
         # Visual representations for labels
         t_label_visual = Rectangle(width=1.5, height=0.6, color=PROVIDER_COLOR, fill_color=PROVIDER_COLOR, fill_opacity=0.3)
@@ -107,14 +108,14 @@ class MPLSLabelingScene(Scene):
     """
     def construct(self):
         # Title
-        title = Text("MPLS Packet Labeling", font_size=48).to_edge(UP)
+        title = Text(_("MPLS Packet Labeling"), font_size=48).to_edge(UP)
         self.play(Write(title))
         self.wait(0.5)
 
         # Customer Packet
-        customer_packet = create_packet_representation("Cust. Data").scale(0.8)
+        customer_packet = create_packet_representation(_("Cust. Data")).scale(0.8)
         customer_packet.set_color(PACKET_COLOR) # Ensure base color
-        customer_packet_label = Text("Customer L2 Frame", font_size=20).next_to(customer_packet, DOWN, buff=0.2)
+        customer_packet_label = Text(_("Customer L2 Frame"), font_size=20).next_to(customer_packet, DOWN, buff=0.2)
         customer_packet_group = VGroup(customer_packet, customer_packet_label).move_to(ORIGIN + RIGHT * 2)
         
         self.play(FadeIn(customer_packet_group, shift=UP*0.5))
@@ -133,7 +134,7 @@ class MPLSLabelingScene(Scene):
         self.wait(0.5)
 
         # Text explaining the process
-        explanation_text = Text("Labels are 'pushed' onto the packet by the Provider Edge (PE) router.", font_size=28)
+        explanation_text = Text(_("Labels are 'pushed' onto the packet by the Provider Edge (PE) router."), font_size=28)
         explanation_text.next_to(customer_packet_group, DOWN, buff=1.5, aligned_edge=ORIGIN).to_edge(DOWN, buff=0.5)
         self.play(Write(explanation_text))
         self.wait(0.5)
@@ -160,7 +161,7 @@ class MPLSLabelingScene(Scene):
         self.play(full_mpls_packet.animate.move_to(ORIGIN).scale(0.9)) # Center and slightly shrink
         
         # Show final structure text
-        final_structure_text = Text("[T-Label][VC-Label][Cust. Data]", font_size=24, color=LABEL_COLOR)
+        final_structure_text = Text(_("[T-Label][VC-Label][Cust. Data]"), font_size=24, color=LABEL_COLOR)
         final_structure_text.next_to(full_mpls_packet, DOWN, buff=0.3)
         self.play(Write(final_structure_text))
 
@@ -0,0 +1,374 @@
+"""
+Live preview server: re-renders only the scenes an edit affects.
+
+The server watches the scene modules and every local module they import. On
+a change it works out the affected Scene classes:
+
+    - a dependency such as l2vpn_elements.py changed: every scene in every
+      module that imports it, directly or indirectly;
+    - only some class bodies of a scene module changed: just those classes;
+    - module-level code of a scene module changed: all scenes of that module.
+
+Changes are compared on the AST, so comment and whitespace edits render
+nothing. The affected modules are reloaded (dependencies first) inside this
+already-warm process, the scenes are rendered at preview quality, and every
+open browser page is told over Server-Sent Events to swap in the new video.
+Unchanged play() calls still come from manim's partial-movie cache.
+
+    python preview_server.py            # then open http://localhost:8000
+    python preview_server.py --quality m --port 8080
+"""
+import argparse
+import ast
+import hashlib
+import html
+import importlib
+import json
+import queue
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from manim import tempconfig
+
+from render_common import COURSE_MODULES, REPO_DIR, quality_settings, scene_classes, scene_input_file
+
+WATCHED_MODULES = COURSE_MODULES + ("l2vpn_elements",)
+POLL_SECONDS = 0.2
+
+
+def local_imports(path: Path) -> set:
+    """Returns the repository modules imported by the module at `path`."""
+    imported = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            imported.add(node.module)
+    return {name for name in imported if (REPO_DIR / f"{name}.py").exists()}
+
+
+class ImportGraph:
+    """The import relation between the repository modules reachable from `roots`."""
+    def __init__(self, roots):
+        self.imports = {}
+        pending = list(roots)
+        while pending:
+            name = pending.pop()
+            if name not in self.imports:
+                self.imports[name] = local_imports(REPO_DIR / f"{name}.py")
+                pending.extend(self.imports[name])
+
+    def importers_of(self, module: str) -> set:
+        """`module` and every module that imports it, directly or indirectly."""
+        affected, pending = {module}, [module]
+        while pending:
+            target = pending.pop()
+            for name, imports in self.imports.items():
+                if target in imports and name not in affected:
+                    affected.add(name)
+                    pending.append(name)
+        return affected
+
+    def reload_order(self, modules) -> list:
+        """`modules` sorted so that every module comes after the modules it imports."""
+        ordered, seen = [], set()
+
+        def visit(name):
+            if name in seen:
+                return
+            seen.add(name)
+            for dependency in sorted(self.imports.get(name, ())):
+                visit(dependency)
+            if name in modules:
+                ordered.append(name)
+
+        for name in sorted(modules):
+            visit(name)
+        return ordered
+
+
+def fingerprint(path: Path):
+    """
+    Hashes a module's AST: the top-level code apart from classes, and each class separately.
+
+    Returns:
+        (module-level hash, {class name: hash})
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    module_level = hashlib.sha256()
+    classes = {}
+    for node in tree.body:
+        dumped = ast.dump(node).encode()
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = hashlib.sha256(dumped).hexdigest()
+        else:
+            module_level.update(dumped)
+    return module_level.hexdigest(), classes
+
+
+class PreviewServer:
+    """Watches the sources, renders affected scenes and notifies subscribed pages."""
+    def __init__(self, quality: str = "l"):
+        self.quality = quality
+        self.graph = ImportGraph(WATCHED_MODULES)
+        self.mtimes = {}
+        self.fingerprints = {}
+        for name in self.graph.imports:
+            path = REPO_DIR / f"{name}.py"
+            self.mtimes[name] = path.stat().st_mtime_ns
+            self.fingerprints[name] = fingerprint(path)
+        self.scenes = {}  # scene name -> {"module", "video", "version"}
+        for module in COURSE_MODULES:
+            for scene_class in scene_classes(module):
+                self.scenes[scene_class.__name__] = {"module": module, "video": None, "version": 0}
+        self.subscribers = []
+        self.lock = threading.Lock()
+        self.work = queue.Queue()
+
+    # --- change detection ---
+
+    def poll(self):
+        """Checks the sources once and queues a render for whatever changed."""
+        changed = []
+        for name in list(self.graph.imports):
+            path = REPO_DIR / f"{name}.py"
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if mtime != self.mtimes.get(name):
+                self.mtimes[name] = mtime
+                changed.append(name)
+        if not changed:
+            return
+        modules, scenes = set(), set()
+        for name in changed:
+            try:
+                new = fingerprint(REPO_DIR / f"{name}.py")
+            except SyntaxError as exc:
+                self.publish({"type": "error", "scene": None, "message": f"{name}.py: {exc}"})
+                continue
+            old = self.fingerprints.get(name)
+            self.fingerprints[name] = new
+            if new == old:
+                continue  # comments or formatting only
+            modules_hit, scenes_hit = self.affected(name, old, new)
+            modules |= modules_hit
+            scenes |= scenes_hit
+        if modules:
+            self.graph = ImportGraph(WATCHED_MODULES)  # imports may have changed too
+            self.work.put((modules, scenes))
+
+    def affected(self, module: str, old, new):
+        """Returns (modules to reload, scenes to render) for one changed module."""
+        own_scenes = {name for name, info in self.scenes.items() if info["module"] == module}
+        if old is not None and own_scenes and old[0] == new[0]:
+            # Non-scene classes in the result are ignored by render().
+            return {module}, {name for name, digest in new[1].items() if old[1].get(name) != digest}
+        importers = self.graph.importers_of(module)
+        return importers, {name for name, info in self.scenes.items() if info["module"] in importers}
+
+    # --- rendering ---
+
+    def render_loop(self):
+        while True:
+            modules, scenes = self.work.get()
+            while not self.work.empty():  # coalesce edits saved in quick succession
+                more_modules, more_scenes = self.work.get()
+                modules |= more_modules
+                scenes |= more_scenes
+            self.render(modules, scenes)
+
+    def render(self, modules, scenes):
+        try:
+            for name in self.graph.reload_order(modules):
+                if name in sys.modules:
+                    importlib.reload(sys.modules[name])
+                else:
+                    importlib.import_module(name)
+        except Exception:
+            self.publish({"type": "error", "scene": None, "message": traceback.format_exc()})
+            return
+        for module in COURSE_MODULES:  # course order, so the first scenes show up first
+            for scene_class in scene_classes(module):
+                if scene_class.__name__ in scenes:
+                    self.render_scene(scene_class)
+
+    def render_scene(self, scene_class: type):
+        name = scene_class.__name__
+        self.publish({"type": "rendering", "scene": name})
+        started = time.monotonic()
+        try:
+            with tempconfig({**quality_settings(self.quality), "input_file": scene_input_file(scene_class)}):
+                scene = scene_class()
+                scene.render()
+        except Exception:
+            self.publish({"type": "error", "scene": name, "message": traceback.format_exc()})
+            return
+        with self.lock:
+            info = self.scenes.setdefault(name, {"module": scene_class.__module__, "video": None, "version": 0})
+            info["video"] = scene.renderer.file_writer.movie_file_path
+            info["version"] += 1
+            version = info["version"]
+        self.publish({"type": "rendered", "scene": name, "version": version, "seconds": round(time.monotonic() - started, 2)})
+
+    # --- browser push ---
+
+    def subscribe(self) -> queue.Queue:
+        events = queue.Queue()
+        with self.lock:
+            self.subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events):
+        with self.lock:
+            self.subscribers.remove(events)
+
+    def publish(self, event: dict):
+        with self.lock:
+            for events in self.subscribers:
+                events.put(event)
+
+    def watch_loop(self):
+        while True:
+            self.poll()
+            time.sleep(POLL_SECONDS)
+
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>L2 VPN scene preview</title>
+<style>
+body {{ background: #111; color: #ddd; font-family: sans-serif; margin: 1em; }}
+.scene {{ display: inline-block; vertical-align: top; margin: 0 1em 1em 0; width: 480px; }}
+.scene video {{ width: 480px; background: #000; }}
+.status {{ font-size: 0.85em; color: #999; }}
+.rendering .status {{ color: #fc3; }}
+pre.error {{ color: #f66; white-space: pre-wrap; font-size: 0.75em; max-height: 12em; overflow: auto; }}
+</style></head><body>
+<h1>Scene preview</h1>
+{scenes}
+<script>
+const events = new EventSource("/events");
+events.onmessage = (message) => {{
+  const event = JSON.parse(message.data);
+  const box = event.scene && document.getElementById(event.scene);
+  if (!box) {{ if (event.type === "error") alert(event.message); return; }}
+  const status = box.querySelector(".status"), error = box.querySelector(".error");
+  box.classList.toggle("rendering", event.type === "rendering");
+  if (event.type === "rendering") status.textContent = "rendering…";
+  if (event.type === "error") {{ status.textContent = "failed"; error.textContent = event.message; }}
+  if (event.type === "rendered") {{
+    error.textContent = "";
+    status.textContent = "rendered in " + event.seconds + "s";
+    const video = box.querySelector("video");
+    video.src = "/video/" + event.scene + "?v=" + event.version;
+    video.play();
+    box.scrollIntoView({{behavior: "smooth", block: "nearest"}});
+  }}
+}};
+</script></body></html>
+"""
+
+SCENE_BOX = """<div class="scene" id="{name}"><h3>{name}</h3>
+<video controls muted {src}></video><div class="status">{status}</div><pre class="error"></pre></div>"""
+
+
+def make_handler(server: PreviewServer):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/":
+                self.send_page()
+            elif path == "/events":
+                self.send_events()
+            elif path.startswith("/video/"):
+                self.send_video(path[len("/video/"):])
+            else:
+                self.send_error(404)
+
+        def send_page(self):
+            boxes = []
+            with server.lock:
+                for name, info in server.scenes.items():
+                    src = f'src="/video/{name}?v={info["version"]}"' if info["video"] else ""
+                    boxes.append(SCENE_BOX.format(name=html.escape(name), src=src, status="" if info["video"] else "not rendered yet"))
+            body = PAGE.format(scenes="\n".join(boxes)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_events(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            events = server.subscribe()
+            try:
+                while True:
+                    try:
+                        payload = f"data: {json.dumps(events.get(timeout=15))}\n\n"
+                    except queue.Empty:
+                        payload = ": keepalive\n\n"
+                    self.wfile.write(payload.encode())
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                server.unsubscribe(events)
+
+        def send_video(self, name):
+            with server.lock:
+                info = server.scenes.get(name)
+                video = info and info["video"]
+            if not video or not Path(video).exists():
+                self.send_error(404)
+                return
+            data = Path(video).read_bytes()
+            start, end = 0, len(data) - 1
+            header = self.headers.get("Range", "")
+            if header.startswith("bytes="):
+                first, _, last = header[len("bytes="):].partition("-")
+                start = int(first) if first else max(0, len(data) - int(last))
+                end = int(last) if first and last else end
+            self.send_response(206 if header else 200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            if header:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(data[start:end + 1])
+
+    return Handler
+
+
+def serve(port: int = 8000, quality: str = "l", render_all: bool = False):
+    """Starts the watcher, the render thread and the HTTP server; blocks forever."""
+    server = PreviewServer(quality)
+    threading.Thread(target=server.render_loop, name="render", daemon=True).start()
+    threading.Thread(target=server.watch_loop, name="watch", daemon=True).start()
+    if render_all:
+        server.work.put((set(), set(server.scenes)))
+    httpd = ThreadingHTTPServer(("127.0.0.1", port), make_handler(server))
+    httpd.daemon_threads = True
+    print(f"Preview at http://127.0.0.1:{port} (watching {len(server.graph.imports)} modules)")
+    httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live preview server for the scene modules.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("-q", "--quality", default="l", help="manim quality flag (default: l)")
+    parser.add_argument("--render-all", action="store_true", help="render every scene on startup")
+    args = parser.parse_args()
+    serve(args.port, args.quality, args.render_all)
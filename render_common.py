@@ -0,0 +1,146 @@
+"""
+Shared helpers for the render tooling that drives the scene modules in this
+directory without going through the manim CLI.
+"""
+import importlib
+import inspect
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from manim import Scene, config
+from manim.constants import QUALITIES
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# The scene modules in course order.
+COURSE_MODULES = (
+    "l2vpn_intro_scenes",
+    "mpls_scenes",
+    "l2vpn_topology_scene",
+    "l2vpn_packet_scene",
+    "l2vpn_flow_scenes",
+    "l2vpn_control_plane_scene",
+    "l2vpn_summary_scene",
+)
+
+# Make the scene modules importable no matter where a tool is started from.
+if str(REPO_DIR) not in sys.path:
+    sys.path.insert(0, str(REPO_DIR))
+
+
+def module_name_from_path(module: str) -> str:
+    """
+    Normalizes "l2vpn_flow_scenes.py", "./l2vpn_flow_scenes.py" and
+    "l2vpn_flow_scenes" to the importable module name.
+    """
+    return Path(module).stem if module.endswith(".py") else module
+
+
+def load_module(module: str):
+    """Imports one of the scene modules by file or module name."""
+    return importlib.import_module(module_name_from_path(module))
+
+
+def scene_classes(module: str) -> list:
+    """
+    Returns the Scene classes defined in a module, in source order.
+
+    Args:
+        module: Module file or module name, e.g. "l2vpn_flow_scenes.py".
+
+    Returns:
+        A list of Scene subclasses. Scenes imported from other modules are skipped.
+    """
+    mod = load_module(module)
+    classes = [
+        obj for obj in vars(mod).values()
+        if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == mod.__name__
+    ]
+    # Base classes of other scenes in the module (StoryboardScene) are templates, not scenes.
+    classes = [cls for cls in classes if not any(other is not cls and issubclass(other, cls) for other in classes)]
+    return sorted(classes, key=_source_line)
+
+
+def _source_line(cls: type) -> int:
+    """Line of the class statement; generated classes (storyboards) follow, in module order."""
+    try:
+        return inspect.getsourcelines(cls)[1]
+    except (OSError, TypeError):
+        return sys.maxsize
+
+
+def load_scene_class(module: str, scene_name: str) -> type:
+    """
+    Looks up a Scene class by name.
+
+    Args:
+        module: Module file or module name, e.g. "l2vpn_flow_scenes.py".
+        scene_name: The Scene class name, e.g. "PacketFlowScene_PE2_Decapsulation".
+
+    Returns:
+        The Scene subclass.
+    """
+    mod = load_module(module)
+    scene_class = getattr(mod, scene_name, None)
+    if not (inspect.isclass(scene_class) and issubclass(scene_class, Scene)):
+        raise ValueError(f"{scene_name} is not a Scene in {mod.__name__}")
+    return scene_class
+
+
+def scene_input_file(scene_class: type) -> str:
+    """
+    Returns the source file of a Scene class. Setting config["input_file"] to it
+    makes SceneFileWriter lay out media/ exactly like the manim CLI does.
+    """
+    return inspect.getfile(scene_class)
+
+
+def quality_settings(flag: str) -> dict:
+    """
+    Maps a manim quality flag ("l", "m", "h", "p", "k") to its config values.
+
+    Returns:
+        A dict with pixel_width, pixel_height and frame_rate, suitable for tempconfig().
+    """
+    for quality in QUALITIES.values():
+        if quality["flag"] == flag:
+            return {
+                "pixel_width": quality["pixel_width"],
+                "pixel_height": quality["pixel_height"],
+                "frame_rate": quality["frame_rate"],
+            }
+    raise ValueError(f"Unknown quality flag: {flag!r}")
+
+
+def private_partial_movie_dir(scene_class: type, tag: str) -> str:
+    """
+    A partial-movie directory of its own for one of several concurrent renders
+    of a scene, seeded with hard links to the scene's shared partial movies.
+
+    manim writes its concat list under a fixed name and prunes the oldest files
+    of the partial-movie directory after every render, so concurrent renders
+    must not share one. The links keep the plays already in the shared cache
+    reusable; pruning a private directory only removes its own links. Call it
+    inside the render's tempconfig() and assign the result to
+    config.partial_movie_dir.
+
+    Args:
+        scene_class: The Scene subclass being rendered.
+        tag: What tells the concurrent renders apart, e.g. a locale or variant name.
+    """
+    module_name = Path(config["input_file"]).stem if config["input_file"] else ""
+    shared = config.get_dir("partial_movie_dir", module_name=module_name, scene_name=scene_class.__name__)
+    private = shared.with_name(f"{shared.name}.{tag}")
+    private.mkdir(parents=True, exist_ok=True)
+    if shared.is_dir():
+        for source in shared.iterdir():
+            target = private / source.name
+            if source.name == "partial_movie_file_list.txt" or target.exists():
+                continue
+            try:
+                os.link(source, target)
+            except OSError:  # another file system, or no hard links
+                shutil.copy2(source, target)
+    return str(private)
@@ -0,0 +1,279 @@
+"""
+Dirty-region rendering: only the pixels that changed since the previous frame
+are rasterized again.
+
+During a play() the stock CairoRenderer copies the static image over the
+whole frame and redraws every moving mobject in full, even when one Dot moves
+along a DashedLine or one SurroundingRectangle appears. DirtyRegionRenderer
+keeps the previous frame instead and, per frame:
+
+    changes     every displayed moving mobject gets a pixel box (points plus
+                stroke and anti-aliasing margin) and a fingerprint of what the
+                camera draws (points, colors, widths, z-index); a mobject whose
+                fingerprint changed marks its old and new box dirty, one that
+                appeared or vanished marks its box dirty
+    regions     dirty boxes are merged into a few rectangles
+    redraw      in each rectangle the static image is copied back and the
+                mobjects overlapping it are drawn again, clipped to it, in
+                display order; everything outside stays from the previous frame
+
+The first frame of a play (a new static image), frames with non-vectorized
+mobjects (images, point clouds, which the camera does not draw through cairo)
+and frames whose dirty area exceeds FULL_REDRAW_SHARE of the frame are drawn
+in full, exactly as before. Clip rectangles are pixel-aligned, so a region is
+composited from the same coverage values as a full redraw; --verify checks
+every frame against one.
+
+    python render_dirty.py l2vpn_control_plane_scene.py L2VPNControlPlaneScene -q l --baseline
+    python render_dirty.py l2vpn_flow_scenes.py PacketFlowScene_Core_Transit_Part1 -q m --verify
+"""
+import argparse
+import time
+
+import numpy as np
+from manim import VMobject, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from render_common import load_scene_class, quality_settings, scene_input_file
+from render_pipeline import capture_into
+
+FULL_REDRAW_SHARE = 0.5
+MAX_REGIONS = 16
+MERGE_GAP_PIXELS = 8  # boxes closer than this are redrawn as one region
+ANTIALIAS_PIXELS = 2
+MITER_FACTOR = 5  # cairo's default miter limit (10) times half the line width
+_STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def fingerprint(mobject) -> tuple:
+    """What the camera draws for one mobject (not its family), as a comparable tuple."""
+    state = [hash(np.ascontiguousarray(mobject.points).tobytes())]
+    for attr in _STYLE_ARRAYS:
+        value = mobject.__dict__.get(attr)
+        state.append(None if value is None else hash(np.ascontiguousarray(value).tobytes()))
+    state += [mobject.get_stroke_width(), mobject.get_stroke_width(background=True),
+              mobject.z_index, tuple(np.ravel(mobject.sheen_direction)), mobject.sheen_factor]
+    draw_state = getattr(mobject, "draw_state", None)  # e.g. AtlasLabel's texture and reveal
+    if draw_state is not None:
+        state.append(draw_state())
+    return tuple(state)
+
+
+class DirtyRegionRenderer(CairoRenderer):
+    """
+    A CairoRenderer that re-rasterizes only the changed regions of each frame.
+
+    Args:
+        verify: Also draw every frame in full and count the frames that differ.
+    """
+    def __init__(self, verify: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.verify = verify
+        self._previous = None  # id(mobject) -> (box, fingerprint) of the last frame
+        self._reference = None
+        self.stats = {"frames": 0, "full_frames": 0, "pixels_drawn": 0, "seconds": 0.0, "mismatched_frames": 0}
+
+    def update_frame(self, *args, **kwargs):
+        self._previous = None  # drawn in full from elsewhere (frozen frames, ...)
+        super().update_frame(*args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self._previous = None  # a new play: its first frame is drawn in full
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects):
+        started = _now()
+        if not moving_mobjects:
+            moving_mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        camera = self.camera
+        mobjects = camera.get_mobjects_to_display(moving_mobjects)
+        current = regions = None
+        if all(isinstance(mob, VMobject) for mob in mobjects):
+            current = {id(mob): (self.pixel_box(mob), fingerprint(mob)) for mob in mobjects}
+            if self._previous is not None:
+                regions = self.dirty_regions(current)
+        if regions is None:
+            self.update_frame(scene, moving_mobjects)
+            self.stats["full_frames"] += 1
+            self.stats["pixels_drawn"] += camera.pixel_width * camera.pixel_height
+        else:
+            self.redraw_regions(mobjects, current, regions)
+        self._previous = current
+        self.stats["frames"] += 1
+        self.stats["seconds"] += _now() - started
+        if self.verify:
+            self._verify(mobjects)
+        self.add_frame(self.get_frame())
+
+    def pixel_box(self, mobject) -> tuple:
+        """(x0, y0, x1, y1) pixels a mobject may touch, clamped to the frame; None when off screen."""
+        camera = self.camera
+        points = mobject.points
+        if len(points) == 0:
+            return None
+        scale_x = camera.pixel_width / camera.frame_width
+        scale_y = camera.pixel_height / camera.frame_height
+        stroke = max(mobject.get_stroke_width(), mobject.get_stroke_width(background=True))
+        margin = stroke * camera.cairo_line_width_multiple * MITER_FACTOR
+        low = points[:, :2].min(axis=0) - margin
+        high = points[:, :2].max(axis=0) + margin
+        left = camera.frame_center[0] - camera.frame_width / 2
+        top = camera.frame_center[1] + camera.frame_height / 2
+        x0 = int(np.floor((low[0] - left) * scale_x)) - ANTIALIAS_PIXELS
+        x1 = int(np.ceil((high[0] - left) * scale_x)) + ANTIALIAS_PIXELS
+        y0 = int(np.floor((top - high[1]) * scale_y)) - ANTIALIAS_PIXELS
+        y1 = int(np.ceil((top - low[1]) * scale_y)) + ANTIALIAS_PIXELS
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, camera.pixel_width), min(y1, camera.pixel_height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def dirty_regions(self, current: dict):
+        """
+        Merged pixel rectangles covering every change since the last frame,
+        or None when a full redraw is cheaper.
+        """
+        previous = self._previous
+        boxes = []
+        for key in current.keys() | previous.keys():
+            old, new = previous.get(key), current.get(key)
+            if old is not None and new is not None and old[1] == new[1]:
+                continue
+            boxes += [entry[0] for entry in (old, new) if entry is not None and entry[0] is not None]
+        regions = _merge_boxes(boxes)
+        if len(regions) > MAX_REGIONS:
+            regions = _merge_boxes(regions, gap=None)
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in regions)
+        if area > FULL_REDRAW_SHARE * self.camera.pixel_width * self.camera.pixel_height:
+            return None
+        return regions
+
+    def redraw_regions(self, mobjects: list, current: dict, regions: list):
+        camera = self.camera
+        pixels = camera.pixel_array
+        background = camera.background if self.static_image is None else self.static_image
+        ctx = camera.get_cairo_context(pixels)
+        for x0, y0, x1, y1 in regions:
+            pixels[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+            overlapping = [
+                mob for mob in mobjects
+                if current[id(mob)][0] is not None and _overlaps(current[id(mob)][0], (x0, y0, x1, y1))
+            ]
+            self.stats["pixels_drawn"] += (x1 - x0) * (y1 - y0)
+            if not overlapping:
+                continue
+            ctx.save()
+            matrix = ctx.get_matrix()
+            ctx.identity_matrix()
+            ctx.new_path()  # the camera leaves the last drawn path behind (fill_preserve)
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+            ctx.set_matrix(matrix)
+            ctx.clip()
+            try:
+                capture_into(camera, overlapping, pixels)
+            finally:
+                ctx.restore()
+
+    def _verify(self, mobjects: list):
+        camera = self.camera
+        if self._reference is None:
+            # One buffer for good: the camera caches a cairo context per buffer
+            self._reference = np.empty_like(camera.pixel_array)
+        np.copyto(self._reference, camera.background if self.static_image is None else self.static_image)
+        capture_into(camera, mobjects, self._reference)
+        if not np.array_equal(self._reference, camera.pixel_array):
+            self.stats["mismatched_frames"] += 1
+
+
+def _now() -> float:
+    return time.perf_counter()
+
+
+def _overlaps(a: tuple, b: tuple) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _merge_boxes(boxes: list, gap=MERGE_GAP_PIXELS) -> list:
+    """Unites boxes that overlap or lie within `gap` pixels of each other (gap=None: everything)."""
+    if not boxes:
+        return []
+    if gap is None:
+        x0s, y0s, x1s, y1s = zip(*boxes)
+        return [(min(x0s), min(y0s), max(x1s), max(y1s))]
+    merged = []
+    for box in sorted(boxes):
+        box = list(box)
+        changed = True
+        while changed:
+            changed = False
+            for other in merged:
+                if (box[0] - gap < other[2] and other[0] - gap < box[2]
+                        and box[1] - gap < other[3] and other[1] - gap < box[3]):
+                    merged.remove(other)
+                    box = [min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3])]
+                    changed = True
+                    break
+        merged.append(box)
+    return [tuple(box) for box in merged]
+
+
+class _TimedRenderer(CairoRenderer):
+    """The stock renderer, timing render() the way DirtyRegionRenderer does."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = {"frames": 0, "seconds": 0.0}
+
+    def render(self, scene, time, moving_mobjects):
+        started = _now()
+        self.update_frame(scene, moving_mobjects)
+        self.stats["seconds"] += _now() - started
+        self.stats["frames"] += 1
+        self.add_frame(self.get_frame())
+
+
+def render_dirty(scene_class: type, quality: str = "h", verify: bool = False, write_movie: bool = True,
+                 renderer_class: type = DirtyRegionRenderer):
+    """
+    Renders one Scene class through the dirty-region renderer.
+
+    Returns:
+        The renderer, whose `stats` hold frames, full_frames, pixels_drawn,
+        seconds (rasterization) and mismatched_frames (with verify).
+    """
+    settings = {**quality_settings(quality), "input_file": scene_input_file(scene_class)}
+    if not write_movie:
+        settings.update({"write_to_movie": False, "save_last_frame": False, "disable_caching": True})
+    with tempconfig(settings):
+        kwargs = {"verify": verify} if renderer_class is DirtyRegionRenderer else {}
+        renderer = renderer_class(**kwargs)
+        scene_class(renderer=renderer).render()
+    return renderer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes re-rasterizing only changed regions.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_control_plane_scene.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--verify", action="store_true", help="compare every frame with a full redraw")
+    parser.add_argument("--baseline", action="store_true", help="also time the stock renderer (no movie written)")
+    parser.add_argument("--no-movie", action="store_true", help="rasterize only, write no movie")
+    args = parser.parse_args()
+
+    for scene_name in args.scenes:
+        scene_class = load_scene_class(args.module, scene_name)
+        renderer = render_dirty(scene_class, args.quality, args.verify, write_movie=not args.no_movie)
+        stats = renderer.stats
+        frame_pixels = renderer.camera.pixel_width * renderer.camera.pixel_height
+        share = stats["pixels_drawn"] / max(stats["frames"] * frame_pixels, 1)
+        line = (f"{scene_name}: {stats['frames']} frames, {stats['full_frames']} full, "
+                f"{share:.1%} of the pixels redrawn, {stats['seconds']:.2f}s rasterizing")
+        if args.verify:
+            line += f", {stats['mismatched_frames']} frames differ from a full redraw"
+        print(line)
+        if args.baseline:
+            baseline = render_dirty(scene_class, args.quality, write_movie=False, renderer_class=_TimedRenderer)
+            print(f"{scene_name}: stock renderer {baseline.stats['seconds']:.2f}s rasterizing "
+                  f"{baseline.stats['frames']} frames")
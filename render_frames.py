@@ -0,0 +1,382 @@
+"""
+In-memory frame API for dataset generation.
+
+Renders scenes or single mobject compositions (routers from create_router,
+packets from create_full_l2vpn_packet, ...) straight into NumPy arrays, with
+optional per-element bounding boxes and labels, without writing or decoding
+any video.
+
+    renderer = FrameRenderer(320, 180)
+    frame = renderer.render(create_full_l2vpn_packet())
+    frame.pixels, frame.boxes, frame.labels
+
+    for frame in scene_frames(PacketFlowScene_PE1_Encapsulation, every_nth=4):
+        ...
+
+    with render_batch(make_sample, range(10_000)) as batch:
+        batch.pixels  # (N, H, W, 4) uint8, rasterized in place by the workers
+"""
+import multiprocessing
+import queue
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple
+
+import numpy as np
+from manim import DL, UR, Camera, Rectangle, Square, Text, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.section import DefaultSectionType, Section
+
+from render_pipeline import capture_into
+
+DEFAULT_PIXEL_WIDTH = 320
+DEFAULT_PIXEL_HEIGHT = 180
+_NO_BOXES = np.zeros((0, 4), dtype=np.float32)
+
+
+class LabeledFrame(NamedTuple):
+    pixels: np.ndarray  # (H, W, 4) uint8 RGBA
+    boxes: np.ndarray  # (N, 4) float32 pixel boxes: x0, y0, x1, y1
+    labels: list  # N labels, e.g. "router:PE1" or "segment:VC-L"
+
+
+def find_elements(mobjects) -> list:
+    """
+    Finds the labeled diagram elements built by the factories in this repo:
+    routers (Square + Text, from create_router) and packet segments
+    (Rectangle + Text, from create_packet_segment and friends).
+
+    Args:
+        mobjects: A mobject or an iterable of mobjects to search, families included.
+
+    Returns:
+        A list of (label, mobject) pairs, e.g. ("router:PE1", pe_1).
+    """
+    if not isinstance(mobjects, (list, tuple)):
+        mobjects = [mobjects]
+    found = []
+    seen = set()
+    for root in mobjects:
+        for mob in root.get_family():
+            if id(mob) in seen or len(mob.submobjects) != 2:
+                continue
+            seen.add(id(mob))
+            shape, label = mob.submobjects
+            if not isinstance(label, Text):
+                continue
+            if isinstance(shape, Square):
+                kind = "router"
+            elif isinstance(shape, Rectangle):
+                kind = "segment"
+            else:
+                continue
+            if shape.get_stroke_opacity() < 0.01 and label.get_fill_opacity() < 0.01:
+                continue  # faded out, or not faded in yet
+            found.append((f"{kind}:{label.original_text}", mob))
+    return found
+
+
+def element_boxes(camera: Camera, elements) -> tuple:
+    """
+    Converts (label, mobject) pairs to pixel-space bounding boxes for `camera`.
+
+    Returns:
+        (boxes, labels): a (N, 4) float32 array of x0, y0, x1, y1 and the N labels.
+    """
+    if not elements:
+        return _NO_BOXES, []
+    corners = np.array([
+        [*mob.get_corner(DL)[:2], *mob.get_corner(UR)[:2]] for _, mob in elements
+    ])
+    scale_x = camera.pixel_width / camera.frame_width
+    scale_y = camera.pixel_height / camera.frame_height
+    left = camera.frame_center[0] - camera.frame_width / 2
+    top = camera.frame_center[1] + camera.frame_height / 2
+    boxes = np.empty_like(corners)
+    boxes[:, 0] = (corners[:, 0] - left) * scale_x
+    boxes[:, 1] = (top - corners[:, 3]) * scale_y
+    boxes[:, 2] = (corners[:, 2] - left) * scale_x
+    boxes[:, 3] = (top - corners[:, 1]) * scale_y
+    return boxes.astype(np.float32), [label for label, _ in elements]
+
+
+class FrameRenderer:
+    """
+    Rasterizes mobject compositions into NumPy arrays with one reusable camera.
+
+    The frame width follows the pixel aspect ratio, so non-16:9 sizes are not
+    stretched; the frame height stays config.frame_height (8 units).
+    """
+    def __init__(self, pixel_width: int = DEFAULT_PIXEL_WIDTH, pixel_height: int = DEFAULT_PIXEL_HEIGHT, background_color=None):
+        self.camera = Camera(
+            pixel_width=pixel_width,
+            pixel_height=pixel_height,
+            frame_height=config.frame_height,
+            frame_width=config.frame_height * pixel_width / pixel_height,
+            background_color=background_color,
+        )
+
+    def render(self, mobject, elements=None, out: np.ndarray = None, with_boxes: bool = True) -> LabeledFrame:
+        """
+        Renders one composition.
+
+        Args:
+            mobject: The mobject (usually a VGroup) to draw.
+            elements: Optional (label, mobject) pairs to box. Defaults to find_elements(mobject).
+            out: Optional (H, W, 4) uint8 array to draw into. Defaults to the camera's
+                own buffer, which is reused by the next call: copy it to keep it.
+            with_boxes: Set to False to skip bounding boxes and labels.
+
+        Returns:
+            A LabeledFrame whose pixels are `out` (or the camera buffer), not a copy.
+        """
+        target = self.camera.pixel_array if out is None else out
+        np.copyto(target, self.camera.background)
+        capture_into(self.camera, self.camera.get_mobjects_to_display([mobject]), target)
+        if not with_boxes:
+            return LabeledFrame(target, _NO_BOXES, [])
+        if elements is None:
+            elements = find_elements(mobject)
+        boxes, labels = element_boxes(self.camera, elements)
+        return LabeledFrame(target, boxes, labels)
+
+
+# --- Whole scenes ---
+
+class NullFileWriter:
+    """A file writer that writes nothing but keeps the bookkeeping CairoRenderer relies on."""
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.renderer = renderer
+        self.sections = [Section(DefaultSectionType.NORMAL, None, "autocreated", False)]
+        self.partial_movie_files = []
+        self.subcaptions = []
+
+    def next_section(self, name, type, skip_animations):
+        self.sections.append(Section(type, None, name, skip_animations))
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def add_partial_movie_file(self, hash_animation): pass
+    def begin_animation(self, allow_write=False, file_path=None): pass
+    def end_animation(self, allow_write=False): pass
+    def write_frame(self, frame): pass
+    def add_sound(self, *args, **kwargs): pass
+    def save_final_image(self, image): pass
+    def finish(self): pass
+
+
+class ArrayRenderer(CairoRenderer):
+    """
+    A CairoRenderer that hands every `every_nth` frame to `on_frame(scene, pixels)`
+    instead of encoding it. Skipped frames are not rasterized at all.
+    """
+    def __init__(self, on_frame, every_nth: int = 1, **kwargs):
+        super().__init__(file_writer_class=NullFileWriter, **kwargs)
+        self.on_frame = on_frame
+        self.every_nth = max(1, every_nth)
+        self._frame_index = 0
+        self.scene = None
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        index = self._frame_index
+        self._frame_index += 1
+        self.time += 1 / self.camera.frame_rate
+        if index % self.every_nth == 0:
+            self.update_frame(scene, moving_mobjects)
+            self.on_frame(scene, self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration: float):
+        if self.skip_animations:
+            return
+        num_frames = int(duration / (1 / self.camera.frame_rate))
+        start = self._frame_index
+        self._frame_index += num_frames
+        self.time += num_frames / self.camera.frame_rate
+        for index in range(start, start + num_frames):
+            if index % self.every_nth == 0:
+                self.on_frame(self.scene, self.camera.pixel_array)
+
+
+class _StopScene(Exception):
+    pass
+
+
+_DONE = object()
+
+
+def scene_frames(scene_class: type, pixel_width: int = DEFAULT_PIXEL_WIDTH, pixel_height: int = DEFAULT_PIXEL_HEIGHT,
+                 frame_rate: int = 15, every_nth: int = 1, with_boxes: bool = True):
+    """
+    Runs a Scene and yields a LabeledFrame for every `every_nth` frame.
+
+    The scene runs on a helper thread that waits while the caller holds a frame,
+    so `pixels` is the camera's own buffer (zero-copy) and stays valid only
+    until the next frame is requested. Copy it to keep it.
+    """
+    handoff = queue.Queue(maxsize=1)
+    resume = threading.Semaphore(0)
+    stop = threading.Event()
+    renderer_box = {}
+
+    def on_frame(scene, pixels):
+        if with_boxes:
+            boxes, labels = element_boxes(renderer_box["renderer"].camera, find_elements(scene.mobjects))
+        else:
+            boxes, labels = _NO_BOXES, []
+        handoff.put(LabeledFrame(pixels, boxes, labels))
+        resume.acquire()
+        if stop.is_set():
+            raise _StopScene()
+
+    def run():
+        settings = {
+            "pixel_width": pixel_width,
+            "pixel_height": pixel_height,
+            "frame_rate": frame_rate,
+            "frame_width": config.frame_height * pixel_width / pixel_height,
+            "disable_caching": True,
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "progress_bar": "none",
+        }
+        try:
+            with tempconfig(settings):
+                renderer = ArrayRenderer(on_frame, every_nth=every_nth)
+                renderer_box["renderer"] = renderer
+                scene_class(renderer=renderer).render()
+        except _StopScene:
+            handoff.put(_DONE)
+        except BaseException as exc:
+            handoff.put(exc)
+        else:
+            handoff.put(_DONE)
+
+    worker = threading.Thread(target=run, name=f"frames-{scene_class.__name__}", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = handoff.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+            resume.release()
+    finally:
+        stop.set()
+        resume.release()
+        worker.join()
+
+
+# --- Batches across a process pool ---
+
+class FrameBatch:
+    """
+    The result of render_batch(). `pixels` is a (N, H, W, 4) view of a shared
+    memory block the workers drew into; it is valid until close().
+    """
+    def __init__(self, pixels, boxes, labels, shm):
+        self.pixels = pixels
+        self.boxes = boxes
+        self.labels = labels
+        self._shm = shm
+
+    def __len__(self):
+        return len(self.pixels)
+
+    def __getitem__(self, index) -> LabeledFrame:
+        return LabeledFrame(self.pixels[index], self.boxes[index], self.labels[index])
+
+    def close(self):
+        self.pixels = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_worker_state = {}
+
+
+def _init_worker(pixel_width, pixel_height, factory, with_boxes):
+    _worker_state["renderer"] = FrameRenderer(pixel_width, pixel_height)
+    _worker_state["factory"] = factory
+    _worker_state["with_boxes"] = with_boxes
+    _worker_state["blocks"] = {}
+
+
+def _attach_slots(shm_name, shape):
+    # One long-lived view per slot: Camera caches cairo contexts by id(pixel_array).
+    blocks = _worker_state["blocks"]
+    if shm_name not in blocks:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        # The parent owns the block; don't let this worker's tracker unlink it.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        blocks[shm_name] = (shm, [pixels[i] for i in range(shape[0])])
+    return blocks[shm_name][1]
+
+
+def _render_chunk(job):
+    shm_name, shape, start, params = job
+    slots = _attach_slots(shm_name, shape)
+    renderer = _worker_state["renderer"]
+    results = []
+    for offset, param in enumerate(params):
+        built = _worker_state["factory"](param)
+        mobject, elements = built if isinstance(built, tuple) else (built, None)
+        frame = renderer.render(mobject, elements, out=slots[start + offset], with_boxes=_worker_state["with_boxes"])
+        results.append((frame.boxes, frame.labels))
+    return start, results
+
+
+def render_batch(factory, params, pixel_width: int = DEFAULT_PIXEL_WIDTH, pixel_height: int = DEFAULT_PIXEL_HEIGHT,
+                 processes: int = None, chunksize: int = 64, with_boxes: bool = True) -> FrameBatch:
+    """
+    Renders factory(param) for every param across a process pool.
+
+    Args:
+        factory: A picklable top-level function returning a mobject, or a
+            (mobject, elements) pair with explicit (label, mobject) elements.
+        params: The per-frame parameters, e.g. seeds or label values.
+        pixel_width, pixel_height: Output size of every frame.
+        processes: Pool size; defaults to the CPU count.
+        chunksize: Frames per task, to amortize inter-process overhead.
+        with_boxes: Set to False to skip bounding boxes and labels.
+
+    Returns:
+        A FrameBatch backed by shared memory; close it (or use it as a context manager) when done.
+    """
+    params = list(params)
+    shape = (len(params), pixel_height, pixel_width, 4)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape))))
+    pixels = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    boxes = [None] * len(params)
+    labels = [None] * len(params)
+    jobs = [
+        (shm.name, shape, start, params[start:start + chunksize])
+        for start in range(0, len(params), chunksize)
+    ]
+    try:
+        with multiprocessing.Pool(processes, initializer=_init_worker,
+                                  initargs=(pixel_width, pixel_height, factory, with_boxes)) as pool:
+            for start, results in pool.imap_unordered(_render_chunk, jobs):
+                for offset, (frame_boxes, frame_labels) in enumerate(results):
+                    boxes[start + offset] = frame_boxes
+                    labels[start + offset] = frame_labels
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return FrameBatch(pixels, boxes, labels, shm)
@@ -0,0 +1,314 @@
+"""
+Single-pass multi-quality rendering ("ladder").
+
+construct() and all animation interpolation run once, at the highest frame
+rate on the ladder. Every frame is then rasterized once per requested quality
+and handed to that quality's own SceneFileWriter on a dedicated encoder
+thread, so the ffmpeg processes for 480p, 720p, 1080p and 4K run concurrently.
+Lower frame-rate qualities take every n-th frame, which gives exactly the
+frame times a separate `manim -ql/-qm` run would have produced.
+
+Usage:
+    python render_ladder.py l2vpn_flow_scenes.py PacketFlowScene_PE2_Decapsulation --qualities lmhk
+"""
+import argparse
+import queue
+import subprocess
+import threading
+
+import numpy as np
+from manim import Camera, config, tempconfig, __version__
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+from manim.utils.iterables import list_update
+
+from render_common import load_scene_class, quality_settings, scene_input_file
+from render_pipeline import FrameBufferPool
+
+DEFAULT_LADDER = "lmhk"  # 480p15, 720p30, 1080p60, 2160p60
+
+
+class RungFileWriter(SceneFileWriter):
+    """
+    A SceneFileWriter bound to one rung of the ladder.
+
+    The stock writer sizes the ffmpeg pipe from the global config, which is
+    shared by every rung, so the resolution and frame rate are taken from
+    `settings` instead.
+    """
+    def __init__(self, renderer, scene_name, settings):
+        self.settings = settings
+        with tempconfig(settings):
+            super().__init__(renderer, scene_name)
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        fps = self.settings["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        width = self.settings["pixel_width"]
+        height = self.settings["pixel_height"]
+
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", f"{width}x{height}",
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        ]
+        if is_webm_format():
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config["transparent"]:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        command += [file_path]
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def finish(self):
+        with tempconfig(self.settings):
+            super().finish()
+
+
+class LadderRung:
+    """
+    One output quality: its own camera, file writer and encoder thread.
+
+    Writer calls are queued in order on the encoder thread, so begin/end of a
+    partial movie always brackets exactly the frames that belong to it. Frames
+    are copied into buffers from a small pool, which also caps how far the
+    encoder may lag behind.
+    """
+    def __init__(self, flag: str, master_frame_rate: float, max_queued_frames: int = 4):
+        self.flag = flag
+        self.settings = quality_settings(flag)
+        stride = master_frame_rate / self.settings["frame_rate"]
+        if stride != int(stride):
+            raise ValueError(
+                f"Quality {flag!r} ({self.settings['frame_rate']} fps) does not divide "
+                f"the ladder frame rate ({master_frame_rate} fps)"
+            )
+        self.stride = int(stride)
+        self.camera = Camera(
+            pixel_width=self.settings["pixel_width"],
+            pixel_height=self.settings["pixel_height"],
+            frame_rate=self.settings["frame_rate"],
+        )
+        self.static_image = None
+        self.file_writer = None
+        pixel_array = self.camera.pixel_array
+        self.pool = FrameBufferPool(pixel_array.shape, pixel_array.dtype, max_queued_frames)
+        self._jobs = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._encode_loop, name=f"encoder-{flag}", daemon=True)
+        self._thread.start()
+
+    def capture(self, mobjects, use_static_image: bool, **kwargs):
+        if use_static_image and self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        self.camera.capture_mobjects(mobjects, **kwargs)
+
+    def submit(self, fn, *args, **kwargs):
+        self._put(fn, args, kwargs, None)
+
+    def submit_frame(self, num_frames: int = 1):
+        """Queues the camera's current frame, `num_frames` times."""
+        buffer = self.pool.acquire()
+        np.copyto(buffer, self.camera.pixel_array)
+        self._put(self._write_frame, (buffer, num_frames), {}, buffer)
+
+    def _write_frame(self, buffer, num_frames):
+        for _ in range(num_frames):
+            self.file_writer.write_frame(buffer)
+
+    def _put(self, fn, args, kwargs, buffer):
+        if self._error is not None:
+            if buffer is not None:
+                self.pool.release(buffer)
+            raise self._error
+        self._jobs.put((fn, args, kwargs, buffer))
+
+    def close(self):
+        self._jobs.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _encode_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args, kwargs, buffer = job
+            try:
+                if self._error is None:
+                    fn(*args, **kwargs)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                # Release even after an error, so the render thread never blocks on acquire().
+                if buffer is not None:
+                    self.pool.release(buffer)
+
+
+class LadderFileWriter:
+    """
+    Stands in for `renderer.file_writer` and fans every call out to the rungs.
+    Anything that touches an ffmpeg pipe is queued on the rung's encoder thread.
+    """
+    def __init__(self, renderer, rungs, primary):
+        self.renderer = renderer
+        self.rungs = rungs
+        self.primary = primary
+
+    def __getattr__(self, name):
+        # sections, subcaptions, movie_file_path, ... come from the primary rung
+        return getattr(self.primary.file_writer, name)
+
+    def next_section(self, *args, **kwargs):
+        for rung in self.rungs:
+            rung.file_writer.next_section(*args, **kwargs)
+
+    def add_partial_movie_file(self, hash_animation):
+        for rung in self.rungs:
+            rung.file_writer.add_partial_movie_file(hash_animation)
+
+    def is_already_cached(self, hash_invocation):
+        return all(rung.file_writer.is_already_cached(hash_invocation) for rung in self.rungs)
+
+    def add_sound(self, *args, **kwargs):
+        for rung in self.rungs:
+            rung.file_writer.add_sound(*args, **kwargs)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        for rung in self.rungs:
+            path = file_path
+            if path is None and allow_write and write_to_movie():
+                # Resolve now: num_plays will have moved on by the time the encoder runs this.
+                path = rung.file_writer.partial_movie_files[self.renderer.num_plays]
+            rung.submit(rung.file_writer.begin_animation, allow_write, file_path=path)
+
+    def end_animation(self, allow_write=False):
+        for rung in self.rungs:
+            rung.submit(rung.file_writer.end_animation, allow_write)
+
+    def finish(self):
+        for rung in self.rungs:
+            rung.close()
+        for rung in self.rungs:
+            rung.file_writer.finish()
+
+    def save_final_image(self, image):
+        self.primary.file_writer.save_final_image(image)
+
+
+class LadderRenderer(CairoRenderer):
+    """
+    A CairoRenderer that rasterizes each interpolated frame at several
+    resolutions. The highest-resolution rung acts as `self.camera`, so the
+    play() hashes and last-frame images match a plain render at that quality.
+    """
+    def __init__(self, qualities: str = DEFAULT_LADDER, max_queued_frames: int = 4, **kwargs):
+        super().__init__(**kwargs)
+        self.master_frame_rate = max(quality_settings(flag)["frame_rate"] for flag in qualities)
+        self.rungs = [LadderRung(flag, self.master_frame_rate, max_queued_frames) for flag in qualities]
+        self.primary = max(self.rungs, key=lambda rung: rung.settings["pixel_height"])
+        self.camera = self.primary.camera
+        self.camera.frame_rate = self.master_frame_rate
+        self._frame_index = 0
+
+    def init_scene(self, scene):
+        for rung in self.rungs:
+            rung.file_writer = RungFileWriter(self, scene.__class__.__name__, rung.settings)
+        self.file_writer = LadderFileWriter(self, self.rungs, self.primary)
+
+    def play(self, scene, *args, **kwargs):
+        # Every partial movie starts on a frame that all rungs keep.
+        self._frame_index = 0
+        super().play(scene, *args, **kwargs)
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        if self.skip_animations and not ignore_skipping:
+            return
+        kwargs["include_submobjects"] = include_submobjects
+        self._capture(self.rungs, scene, mobjects, **kwargs)
+
+    def _capture(self, rungs, scene, mobjects, **kwargs):
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        for rung in rungs:
+            rung.capture(mobjects, self.static_image is not None, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        for rung in self.rungs:
+            rung.static_image = None
+        if not static_mobjects:
+            return None
+        self.update_frame(scene, mobjects=static_mobjects)
+        for rung in self.rungs:
+            rung.static_image = rung.camera.pixel_array.copy()
+        self.static_image = self.primary.static_image
+        return self.static_image
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        due = [rung for rung in self.rungs if self._frame_index % rung.stride == 0]
+        self._frame_index += 1
+        self._capture(due, scene, moving_mobjects, include_submobjects=True)
+        for rung in due:
+            rung.submit_frame()
+        self.time += 1 / self.master_frame_rate
+
+    def freeze_current_frame(self, duration: float):
+        if self.skip_animations:
+            return
+        for rung in self.rungs:
+            rung.submit_frame(int(duration / (1 / rung.settings["frame_rate"])))
+        dt = 1 / self.master_frame_rate
+        self.time += int(duration / dt) * dt
+
+
+def render_ladder(scene_class: type, qualities: str = DEFAULT_LADDER, max_queued_frames: int = 4):
+    """
+    Renders one Scene class at several qualities in a single pass.
+
+    Args:
+        scene_class: The Scene subclass to render.
+        qualities: manim quality flags, e.g. "lmhk".
+        max_queued_frames: Frame buffers per rung, i.e. how far each encoder may lag behind.
+
+    Returns:
+        The rendered Scene instance.
+    """
+    top = max((quality_settings(flag) for flag in qualities), key=lambda s: s["pixel_height"])
+    master_frame_rate = max(quality_settings(flag)["frame_rate"] for flag in qualities)
+    with tempconfig({**top, "frame_rate": master_frame_rate, "input_file": scene_input_file(scene_class)}):
+        renderer = LadderRenderer(qualities, max_queued_frames=max_queued_frames)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return scene
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes at several qualities in one pass.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("--qualities", default=DEFAULT_LADDER, help="manim quality flags (default: lmhk)")
+    parser.add_argument("--max-queued-frames", type=int, default=4)
+    args = parser.parse_args()
+
+    for scene_name in args.scenes:
+        render_ladder(load_scene_class(args.module, scene_name), args.qualities, args.max_queued_frames)
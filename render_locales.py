@@ -0,0 +1,112 @@
+"""
+Renders every locale of a scene concurrently.
+
+Each locale renders in its own process with l2vpn_i18n switched to that
+locale, so only the text layout differs between processes. Glyphs are cached
+in a text directory per locale (media/texts/<locale>), which keeps concurrent
+Pango work from contending on one directory. play() calls that show no
+translated text are encoded once: the source locale (or the first requested
+one) renders first into the scene's partial-movie cache, and the other
+locales fan out afterwards, each into a partial-movie directory of its own
+seeded from that cache (manim's concat list and cache pruning are not safe
+for concurrent renders of one directory).
+
+Outputs are named <Scene>_<locale>; the source locale keeps the plain name.
+Every render appends its render_metrics record, labeled with the locale, to
+--jsonl.
+
+    python render_locales.py l2vpn_flow_scenes.py PacketFlowScene_PE2_Decapsulation -q h
+    python render_locales.py mpls_scenes.py MPLSBasicsScene1 --locales de,fr,ja
+"""
+import argparse
+import multiprocessing
+
+from manim import config, tempconfig
+
+from l2vpn_i18n import SOURCE_LOCALE, available_locales, set_locale
+from render_common import load_scene_class, private_partial_movie_dir, quality_settings, scene_input_file
+from render_metrics import DEFAULT_JSONL, metered_render
+
+
+def locale_settings(scene_class: type, locale: str, quality: str = "h") -> dict:
+    """Returns the tempconfig() values for rendering `scene_class` in `locale`."""
+    settings = {
+        **quality_settings(quality),
+        "input_file": scene_input_file(scene_class),
+        "text_dir": f"{{media_dir}}/texts/{locale}",
+    }
+    if locale != SOURCE_LOCALE:
+        settings["output_file"] = f"{scene_class.__name__}_{locale}"
+    return settings
+
+
+def render_locale(module: str, scene_name: str, locale: str, quality: str = "h", concurrent: bool = False,
+                  jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Renders one scene in one locale in this process.
+
+    Args:
+        concurrent: Other locales of the scene render at the same time, so
+            partial movies go to a directory of this locale's own.
+        jsonl, textfile: Where to record the render's metrics, see render_metrics.metered_render().
+    """
+    set_locale(locale)
+    scene_class = load_scene_class(module, scene_name)
+    with tempconfig(locale_settings(scene_class, locale, quality)):
+        if concurrent:
+            config.partial_movie_dir = private_partial_movie_dir(scene_class, locale)
+        metered_render(scene_class, quality, jsonl, textfile, locale=locale)
+    return locale
+
+
+def _render_locale_job(job):
+    module, scene_name, locale, quality, jsonl, textfile = job
+    return render_locale(module, scene_name, locale, quality, True, jsonl, textfile)
+
+
+def render_all_locales(module: str, scene_name: str, locales: list = None, quality: str = "h", processes: int = None,
+                       jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Renders one scene in every requested locale.
+
+    Args:
+        module: Module file or module name, e.g. "l2vpn_flow_scenes.py".
+        scene_name: The Scene class name.
+        locales: Locale codes; defaults to every locale with a catalog.
+        quality: A manim quality flag.
+        processes: Worker processes for the non-source locales; defaults to one per locale.
+        jsonl, textfile: Where to record the metrics of every render.
+
+    Returns:
+        The rendered locale codes, in render order.
+    """
+    locales = list(locales or available_locales())
+    if SOURCE_LOCALE in locales:
+        locales.remove(SOURCE_LOCALE)
+        locales.insert(0, SOURCE_LOCALE)
+    # The first locale primes the shared partial-movie cache the workers' directories are seeded from.
+    done = [render_locale(module, scene_name, locales[0], quality, jsonl=jsonl, textfile=textfile)] if locales else []
+    jobs = [(module, scene_name, locale, quality, jsonl, textfile) for locale in locales[1:]]
+    if not jobs:
+        return done
+    with multiprocessing.Pool(min(processes or len(jobs), len(jobs))) as pool:
+        done.extend(pool.imap_unordered(_render_locale_job, jobs))
+    return done
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every locale of a scene concurrently.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("--locales", help="comma-separated locale codes (default: all catalogs)")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per locale)")
+    parser.add_argument("--jsonl", default=DEFAULT_JSONL, help="render metrics output (default: %(default)s)")
+    parser.add_argument("--textfile", help="Prometheus textfile-collector output")
+    args = parser.parse_args()
+
+    requested = args.locales.split(",") if args.locales else None
+    for scene_name in args.scenes:
+        rendered = render_all_locales(args.module, scene_name, requested, args.quality, args.processes,
+                                      args.jsonl, args.textfile)
+        print(f"{scene_name}: {', '.join(rendered)}")
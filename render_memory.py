@@ -0,0 +1,237 @@
+"""
+Memory profiling per play() and mobject budgets per scene.
+
+After every play()/wait() of a scene the profiler records:
+
+    live_mobjects        Mobject instances alive in the process (after gc)
+    scene_mobjects       mobjects in the scene, submobjects included
+    point_bytes          bytes of point and color arrays held by the scene's mobjects
+    invisible            scene mobjects with zero fill and stroke opacity, and their bytes
+    retained             mobjects removed from the scene that are still alive, and their bytes
+    traced_current/peak  tracemalloc current and peak bytes during the play
+
+Invisible and retained mobjects are the typical leaks of long scenes:
+faded-out copies left in the scene, or removed objects still referenced from
+construct(). They are reported with the construct() variable holding them,
+where there is one.
+
+Budgets are read from a JSON file keyed by scene name, with "default" as
+the fallback, and fail the run (exit code 1) when a scene exceeds one:
+
+    {"default": {"max_scene_mobjects": 2000, "max_point_bytes": 8000000},
+     "PacketFlowScene_Core_Transit_Part2": {"max_retained_bytes": 200000}}
+
+Run without writing movies (the default) so CI only pays for construct() and interpolation:
+
+    python render_memory.py l2vpn_flow_scenes.py PacketFlowScene_Core_Transit_Part2 --budgets memory_budgets.json
+    python render_memory.py l2vpn_flow_scenes.py --all --write-budgets memory_budgets.json
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import weakref
+
+from manim import Mobject, tempconfig
+
+from render_common import load_scene_class, quality_settings, scene_classes, scene_input_file
+
+MOBJECT_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas")
+BUDGET_KEYS = {
+    "max_live_mobjects": "live_mobjects",
+    "max_scene_mobjects": "scene_mobjects",
+    "max_point_bytes": "point_bytes",
+    "max_invisible_bytes": "invisible_bytes",
+    "max_retained_bytes": "retained_bytes",
+    "max_traced_peak": "traced_peak",
+}
+BUDGET_HEADROOM = 1.2  # --write-budgets allows 20% over the measured maxima
+
+
+def array_bytes(mobject) -> int:
+    """Bytes of the point and color arrays of one mobject (not its family)."""
+    total = 0
+    for attr in MOBJECT_ARRAYS:
+        value = mobject.__dict__.get(attr)
+        if value is not None and hasattr(value, "nbytes"):
+            total += value.nbytes
+    return total
+
+
+def family_bytes(mobject) -> int:
+    return sum(array_bytes(member) for member in mobject.get_family())
+
+
+def is_invisible(mobject) -> bool:
+    """True for a leaf mobject that draws nothing: no points, or zero fill and stroke opacity."""
+    if mobject.submobjects:
+        return False
+    if len(mobject.__dict__.get("points", ())) == 0:
+        return False  # an empty container, not a faded-out shape
+    opacities = []
+    for attr in ("fill_rgbas", "stroke_rgbas", "rgbas"):
+        value = mobject.__dict__.get(attr)
+        if value is not None and len(value):
+            opacities.append(value[:, 3].max())
+    return bool(opacities) and max(opacities) == 0
+
+
+def construct_locals(scene) -> dict:
+    """Maps id(mobject) to its variable name in the running construct() of `scene`."""
+    frame = sys._getframe()
+    while frame is not None:
+        if frame.f_code.co_name == "construct" and frame.f_locals.get("self") is scene:
+            return {id(value): name for name, value in frame.f_locals.items() if isinstance(value, Mobject)}
+        frame = frame.f_back
+    return {}
+
+
+class MemoryProfiler:
+    """Records memory statistics after every play() of one scene; see the module docstring."""
+    def __init__(self, scene_class: type):
+        self.scene_name = scene_class.__name__
+        self.plays = []
+        self.warnings = []
+        self._seen = weakref.WeakValueDictionary()  # id -> top-level mobject that was in the scene
+        self._warned = set()
+
+    def attach(self, renderer):
+        play = renderer.play
+
+        def profiled_play(scene, *args, **kwargs):
+            play(scene, *args, **kwargs)
+            self.sample(scene)
+
+        renderer.play = profiled_play
+
+    def sample(self, scene):
+        index = len(self.plays)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        family = scene.get_mobject_family_members()
+        family_ids = {id(mobject) for mobject in family}
+        invisible = [mobject for mobject in family if is_invisible(mobject)]
+        for mobject in scene.mobjects:
+            self._seen[id(mobject)] = mobject
+        retained = [mobject for key, mobject in list(self._seen.items()) if key not in family_ids]
+
+        names = construct_locals(scene)
+        for mobject in retained:
+            if id(mobject) not in self._warned:
+                self._warned.add(id(mobject))
+                name = names.get(id(mobject), "<unnamed>")
+                self.warnings.append(
+                    f"{self.scene_name} play {index}: {name} ({type(mobject).__name__}, "
+                    f"{family_bytes(mobject)} bytes) was removed from the scene but is still alive"
+                )
+
+        self.plays.append({
+            "play": index,
+            "time": round(scene.renderer.time, 3),
+            "animations": [type(animation).__name__ for animation in scene.animations or []],
+            "live_mobjects": sum(1 for obj in gc.get_objects() if isinstance(obj, Mobject)),
+            "scene_mobjects": len(family),
+            "point_bytes": sum(array_bytes(mobject) for mobject in family),
+            "invisible_mobjects": len(invisible),
+            "invisible_bytes": sum(array_bytes(mobject) for mobject in invisible),
+            "retained_mobjects": len(retained),
+            "retained_bytes": sum(family_bytes(mobject) for mobject in retained),
+            "traced_current": current,
+            "traced_peak": peak,
+        })
+
+    def maxima(self) -> dict:
+        return {key: max((play[key] for play in self.plays), default=0) for key in BUDGET_KEYS.values()}
+
+    def check(self, budgets: dict) -> list:
+        """Returns one message per budget the scene exceeded, naming the first play that did."""
+        budget = {**budgets.get("default", {}), **budgets.get(self.scene_name, {})}
+        failures = []
+        for budget_key, field in BUDGET_KEYS.items():
+            limit = budget.get(budget_key)
+            if limit is None:
+                continue
+            over = next((play for play in self.plays if play[field] > limit), None)
+            if over is not None:
+                failures.append(f"{self.scene_name}: {field} {over[field]} > {limit} at play {over['play']}")
+        return failures
+
+
+def profile_scene(scene_class: type, quality: str = "l", write_movie: bool = False) -> MemoryProfiler:
+    """
+    Runs one Scene class under the profiler.
+
+    Args:
+        scene_class: The Scene subclass to profile.
+        quality: A manim quality flag; it sets the frame count, and so interpolation work.
+        write_movie: Encode the movie as well; off by default to keep CI fast.
+
+    Returns:
+        The MemoryProfiler with per-play samples and warnings.
+    """
+    profiler = MemoryProfiler(scene_class)
+    settings = {**quality_settings(quality), "input_file": scene_input_file(scene_class), "dry_run": not write_movie}
+    tracemalloc.start()
+    try:
+        with tempconfig(settings):
+            scene = scene_class()
+            profiler.attach(scene.renderer)
+            scene.render()
+    finally:
+        tracemalloc.stop()
+    return profiler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile memory per play() and enforce per-scene budgets.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="*", help="Scene class names")
+    parser.add_argument("--all", action="store_true", help="profile every Scene in the module")
+    parser.add_argument("-q", "--quality", default="l", help="manim quality flag (default: l)")
+    parser.add_argument("--write-movie", action="store_true")
+    parser.add_argument("--budgets", help="JSON budgets file to enforce")
+    parser.add_argument("--write-budgets", help="write measured maxima plus headroom to this JSON file")
+    parser.add_argument("--report", help="write per-play samples as JSON to this file")
+    args = parser.parse_args()
+
+    if args.all:
+        classes = scene_classes(args.module)
+    else:
+        classes = [load_scene_class(args.module, name) for name in args.scenes]
+    budgets = {}
+    if args.budgets:
+        with open(args.budgets, encoding="utf-8") as budget_file:
+            budgets = json.load(budget_file)
+
+    report, failures, measured = {}, [], {}
+    for scene_class in classes:
+        profiler = profile_scene(scene_class, args.quality, args.write_movie)
+        report[profiler.scene_name] = profiler.plays
+        measured[profiler.scene_name] = {
+            budget_key: int(profiler.maxima()[field] * BUDGET_HEADROOM) for budget_key, field in BUDGET_KEYS.items()
+        }
+        for warning in profiler.warnings:
+            print(f"warning: {warning}")
+        failures += profiler.check(budgets)
+        peak = profiler.maxima()
+        print(f"{profiler.scene_name}: {len(profiler.plays)} plays, "
+              f"max {peak['scene_mobjects']} scene mobjects, {peak['point_bytes']} point bytes, "
+              f"{peak['retained_bytes']} retained bytes, traced peak {peak['traced_peak']}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+    if args.write_budgets:
+        try:
+            with open(args.write_budgets, encoding="utf-8") as budget_file:
+                existing = json.load(budget_file)
+        except FileNotFoundError:
+            existing = {}
+        with open(args.write_budgets, "w", encoding="utf-8") as out:
+            json.dump({**existing, **measured}, out, indent=2)
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}")
+    sys.exit(1 if failures else 0)
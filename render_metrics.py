@@ -0,0 +1,280 @@
+"""
+Per-scene render metrics as JSON lines and a Prometheus textfile.
+
+Each rendered scene produces one record, labeled by scene class, module,
+quality, locale and variant (the last two empty outside batch renders):
+
+    wall_seconds, cpu_seconds      render process time (all threads)
+    encoder_cpu_seconds            CPU time of the ffmpeg encoder processes
+    frames_rendered                frames piped to the encoder
+    frames_cached                  frames of play() calls served from the partial-movie cache
+    plays, plays_cached
+    peak_rss_bytes                 peak resident memory while this scene rendered
+    text_cache_hits/misses         Text SVGs found in / added to the text cache
+    encoder_seconds, encoder_fps   time spent handing frames to ffmpeg, and the resulting rate
+
+Records are appended to a JSON lines file. The textfile (for node_exporter's
+textfile collector) is rewritten atomically with the latest record of every
+label set found in that JSON lines file.
+
+render_with_metrics() renders one scene on its own; the batch renderers
+(render_queue jobs, render_variants, render_locales) call metered_render()
+inside their own config and record to DEFAULT_JSONL unless told otherwise.
+
+    python render_metrics.py l2vpn_flow_scenes.py PacketFlowScene_PE1_Encapsulation -q h \\
+        --jsonl media/metrics.jsonl --textfile /var/lib/node_exporter/textfile/manim.prom
+"""
+import argparse
+import json
+import os
+import resource
+import time
+from pathlib import Path
+
+from manim import Text, config, tempconfig
+
+from render_common import load_scene_class, quality_settings, scene_input_file
+
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+DEFAULT_JSONL = "media/render_metrics.jsonl"
+LABELS = ("scene", "module", "quality", "locale", "variant")
+
+# (record field, Prometheus metric, help text)
+EXPORTED = (
+    ("wall_seconds", "manim_scene_wall_seconds", "Wall-clock render time of the scene."),
+    ("cpu_seconds", "manim_scene_cpu_seconds", "CPU time of the render process for the scene."),
+    ("encoder_cpu_seconds", "manim_scene_encoder_cpu_seconds", "CPU time of the ffmpeg encoders for the scene."),
+    ("frames_rendered", "manim_scene_frames_rendered", "Frames rasterized and piped to the encoder."),
+    ("frames_cached", "manim_scene_frames_cached", "Frames skipped because their play() was cached."),
+    ("plays", "manim_scene_plays", "play() and wait() calls in the scene."),
+    ("plays_cached", "manim_scene_plays_cached", "play() and wait() calls served from the cache."),
+    ("peak_rss_bytes", "manim_scene_peak_rss_bytes", "Peak resident set size while rendering the scene."),
+    ("text_cache_hit_ratio", "manim_scene_text_cache_hit_ratio", "Share of Text objects found in the text cache."),
+    ("encoder_fps", "manim_scene_encoder_fps", "Frames handed to the encoder per second of encoder time."),
+    ("ok", "manim_scene_last_render_ok", "1 if the last render of the scene succeeded, else 0."),
+    ("timestamp", "manim_scene_last_render_timestamp_seconds", "When the scene finished rendering."),
+)
+
+
+def _reset_peak_rss() -> bool:
+    """Resets the kernel's peak-RSS counter (VmHWM) for this process, where Linux allows it."""
+    try:
+        PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_bytes(reset_worked: bool) -> int:
+    if reset_worked:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    # Process-lifetime peak; an upper bound when the reset is unavailable.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MetricsCollector:
+    """
+    Collects the metrics of one scene render.
+
+    Use as a context manager around the render and attach() the scene's
+    renderer once it exists:
+
+        with MetricsCollector(scene_class, "h") as metrics:
+            scene = scene_class()
+            metrics.attach(scene.renderer)
+            scene.render()
+        metrics.record
+    """
+    def __init__(self, scene_class: type, quality: str, locale: str = "", variant: str = ""):
+        self.labels = {
+            "scene": scene_class.__name__,
+            "module": scene_class.__module__,
+            "quality": quality,
+            "locale": locale,
+            "variant": variant,
+        }
+        self.frames_rendered = 0
+        self.frames_cached = 0
+        self.plays = 0
+        self.plays_cached = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        self.encoder_seconds = 0.0
+        self.record = None
+        self._play_cached = False
+
+    def __enter__(self):
+        self._original_text2svg = Text._text2svg
+        collector = self
+
+        def counting_text2svg(text, color):
+            svg = Path(config.get_dir("text_dir")) / f"{text._text2hash(color)}.svg"
+            if svg.exists():
+                collector.text_hits += 1
+            else:
+                collector.text_misses += 1
+            return collector._original_text2svg(text, color)
+
+        Text._text2svg = counting_text2svg
+        self._rss_reset = _reset_peak_rss()
+        self._self_usage = resource.getrusage(resource.RUSAGE_SELF)
+        self._child_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self._started = time.monotonic()
+        return self
+
+    def attach(self, renderer):
+        """Wraps the renderer's play() and its file writer's frame and cache calls."""
+        file_writer = renderer.file_writer
+        play, write_frame = renderer.play, file_writer.write_frame
+        is_already_cached, close_movie_pipe = file_writer.is_already_cached, file_writer.close_movie_pipe
+
+        def counting_play(scene, *args, **kwargs):
+            self._play_cached = False
+            play(scene, *args, **kwargs)
+            self.plays += 1
+            if self._play_cached:
+                self.plays_cached += 1
+                self.frames_cached += int(scene.duration * config["frame_rate"])
+
+        def recording_is_already_cached(hash_invocation):
+            cached = is_already_cached(hash_invocation)
+            self._play_cached = self._play_cached or cached
+            return cached
+
+        def timed_write_frame(frame):
+            started = time.perf_counter()
+            write_frame(frame)
+            self.encoder_seconds += time.perf_counter() - started
+            self.frames_rendered += 1
+
+        def timed_close_movie_pipe():
+            started = time.perf_counter()
+            close_movie_pipe()  # waits for ffmpeg to flush the partial movie
+            self.encoder_seconds += time.perf_counter() - started
+
+        renderer.play = counting_play
+        file_writer.is_already_cached = recording_is_already_cached
+        file_writer.write_frame = timed_write_frame
+        file_writer.close_movie_pipe = timed_close_movie_pipe
+
+    def __exit__(self, *exc_info):
+        Text._text2svg = self._original_text2svg
+        wall = time.monotonic() - self._started
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        child = resource.getrusage(resource.RUSAGE_CHILDREN)
+        texts = self.text_hits + self.text_misses
+        self.record = {
+            **self.labels,
+            "timestamp": time.time(),
+            "ok": exc_info[0] is None,
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(usage.ru_utime + usage.ru_stime - self._self_usage.ru_utime - self._self_usage.ru_stime, 3),
+            "encoder_cpu_seconds": round(child.ru_utime + child.ru_stime - self._child_usage.ru_utime - self._child_usage.ru_stime, 3),
+            "frames_rendered": self.frames_rendered,
+            "frames_cached": self.frames_cached,
+            "plays": self.plays,
+            "plays_cached": self.plays_cached,
+            "peak_rss_bytes": _peak_rss_bytes(self._rss_reset),
+            "text_cache_hits": self.text_hits,
+            "text_cache_misses": self.text_misses,
+            "text_cache_hit_ratio": round(self.text_hits / texts, 4) if texts else 1.0,
+            "encoder_seconds": round(self.encoder_seconds, 3),
+            "encoder_fps": round(self.frames_rendered / self.encoder_seconds, 2) if self.encoder_seconds else 0.0,
+        }
+        return False
+
+
+def append_jsonl(path, record: dict):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as out:
+        out.write(json.dumps(record) + "\n")
+
+
+def latest_records(jsonl_path) -> list:
+    """The most recent record of every label set in a JSON lines file."""
+    latest = {}
+    with open(jsonl_path, encoding="utf-8") as lines:
+        for line in lines:
+            if line.strip():
+                record = json.loads(line)
+                latest[tuple(record.get(key, "") for key in LABELS)] = record
+    return list(latest.values())
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_textfile(path, records: list):
+    """Writes `records` in the Prometheus text exposition format, atomically."""
+    lines = []
+    for field, metric, help_text in EXPORTED:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+        for record in records:
+            labels = ",".join(f'{key}="{_escape(record.get(key, ""))}"' for key in LABELS)
+            lines.append(f"{metric}{{{labels}}} {float(record[field])}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    staging.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(staging, path)  # the collector must never read a partial file
+
+
+def metered_render(scene_class: type, quality: str, jsonl=DEFAULT_JSONL, textfile=None,
+                   locale: str = "", variant: str = "") -> dict:
+    """
+    Renders one Scene class with the current config and records its metrics.
+
+    Args:
+        scene_class: The Scene subclass to render.
+        quality: The manim quality flag the config was set up for (a label only).
+        jsonl: JSON lines file to append the record to, if any.
+        textfile: Prometheus textfile to refresh from `jsonl` (or from this record alone).
+        locale, variant: Labels of batch renders.
+
+    Returns:
+        The metrics record.
+    """
+    metrics = MetricsCollector(scene_class, quality, locale, variant)
+    try:
+        with metrics:
+            scene = scene_class()
+            metrics.attach(scene.renderer)
+            scene.render()
+    finally:
+        # Failed renders are recorded too (ok=false), so a crashing scene is visible.
+        if metrics.record is not None:
+            if jsonl:
+                append_jsonl(jsonl, metrics.record)
+            if textfile:
+                write_textfile(textfile, latest_records(jsonl) if jsonl else [metrics.record])
+    return metrics.record
+
+
+def render_with_metrics(scene_class: type, quality: str = "h", jsonl=None, textfile=None) -> dict:
+    """
+    Renders one Scene class at `quality` and records its metrics; see metered_render().
+
+    Returns:
+        The metrics record.
+    """
+    with tempconfig({**quality_settings(quality), "input_file": scene_input_file(scene_class)}):
+        return metered_render(scene_class, quality, jsonl, textfile)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes and export per-scene metrics.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--jsonl", default=DEFAULT_JSONL, help="JSON lines output (default: %(default)s)")
+    parser.add_argument("--textfile", help="Prometheus textfile-collector output")
+    args = parser.parse_args()
+
+    for scene_name in args.scenes:
+        record = render_with_metrics(load_scene_class(args.module, scene_name), args.quality, args.jsonl, args.textfile)
+        print(json.dumps(record))
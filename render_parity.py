@@ -0,0 +1,173 @@
+"""
+Cairo/OpenGL parity check for the course scenes.
+
+Every scene is rendered twice, once per renderer, each in its own process
+(manim swaps the Mobject base classes when the renderer changes, and an
+OpenGL context should not outlive its scene). The last frame of every
+play()/wait() is kept, and the two renders are compared play by play:
+
+    mean_diff    mean absolute RGB difference, 0-255
+    changed      share of pixels whose largest channel difference exceeds --pixel-threshold
+
+Anti-aliasing differs between the renderers, so small differences along
+edges are expected; a missing or misplaced mobject shows up as a large
+`changed` share. A differing number of plays is always a failure. Failing
+plays are written side by side (Cairo | OpenGL | difference) to --diff-dir.
+
+OpenGL needs a GL context: a display, or EGL for headless machines.
+
+    python render_parity.py                                   # every course scene
+    python render_parity.py l2vpn_flow_scenes.py PacketFlowScene_Core_Transit_Part1 --diff-dir media/parity
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import config, tempconfig
+
+from render_common import COURSE_MODULES, load_scene_class, quality_settings, scene_classes, scene_input_file
+
+RENDERERS = ("cairo", "opengl")
+DEFAULT_QUALITY = "l"
+DEFAULT_PIXEL_THRESHOLD = 48
+DEFAULT_MAX_MEAN_DIFF = 3.0
+DEFAULT_MAX_CHANGED = 0.01
+
+
+def capture_play_frames(module: str, scene_name: str, renderer: str, quality: str = DEFAULT_QUALITY) -> np.ndarray:
+    """
+    Renders one scene with `renderer` in this process, without writing a movie.
+
+    Must run in a fresh process: the renderer is chosen before the scene
+    module is imported, so its mobjects get the matching base classes.
+
+    Returns:
+        (plays, H, W, 3) uint8 array, the last frame of every play()/wait().
+    """
+    config.renderer = renderer
+    scene_class = load_scene_class(module, scene_name)
+    frames = []
+    settings = {
+        **quality_settings(quality),
+        "input_file": scene_input_file(scene_class),
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+    }
+    with tempconfig(settings):
+        scene = scene_class()
+        play = scene.renderer.play
+
+        def recording_play(scene, *args, **kwargs):
+            play(scene, *args, **kwargs)
+            frames.append(np.array(scene.renderer.get_frame())[:, :, :3])
+
+        scene.renderer.play = recording_play
+        scene.render()
+    return np.stack(frames) if frames else np.zeros((0, 1, 1, 3), dtype=np.uint8)
+
+
+def render_in_subprocess(module: str, scene_name: str, renderer: str, quality: str, out: Path) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, __file__, "capture", module, scene_name, "--renderer", renderer, "-q", quality, "--out", str(out)],
+    )
+
+
+def compare_frames(reference: np.ndarray, candidate: np.ndarray, pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD) -> dict:
+    """Compares two frames of the same size; see the module docstring for the metrics."""
+    diff = np.abs(reference.astype(np.int16) - candidate.astype(np.int16))
+    return {
+        "mean_diff": float(diff.mean()),
+        "changed": float((diff.max(axis=2) > pixel_threshold).mean()),
+    }
+
+
+def write_diff_image(path: Path, reference: np.ndarray, candidate: np.ndarray):
+    from PIL import Image
+
+    diff = np.abs(reference.astype(np.int16) - candidate.astype(np.int16)).astype(np.uint8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(np.concatenate([reference, candidate, diff], axis=1)).save(path)
+
+
+def check_scene(module: str, scene_name: str, quality: str = DEFAULT_QUALITY,
+                pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD, max_mean_diff: float = DEFAULT_MAX_MEAN_DIFF,
+                max_changed: float = DEFAULT_MAX_CHANGED, diff_dir=None) -> list:
+    """
+    Renders one scene with both renderers and compares them play by play.
+
+    Args:
+        module: Scene module, e.g. "l2vpn_flow_scenes.py".
+        scene_name: The Scene class name.
+        quality: A manim quality flag; both renders use the same resolution.
+        pixel_threshold: Channel difference above which a pixel counts as changed.
+        max_mean_diff: Largest mean_diff a play may have.
+        max_changed: Largest changed share a play may have.
+        diff_dir: Where to write side-by-side images of failing plays, if given.
+
+    Returns:
+        A list of failure messages, empty when the renders match.
+    """
+    with tempfile.TemporaryDirectory() as scratch:
+        outputs = {renderer: Path(scratch) / f"{renderer}.npz" for renderer in RENDERERS}
+        processes = {renderer: render_in_subprocess(module, scene_name, renderer, quality, out)
+                     for renderer, out in outputs.items()}
+        failed = [renderer for renderer, process in processes.items() if process.wait() != 0]
+        if failed:
+            return [f"{scene_name}: render failed with {', '.join(failed)}"]
+        cairo, opengl = (np.load(outputs[renderer])["frames"] for renderer in RENDERERS)
+
+    if len(cairo) != len(opengl):
+        return [f"{scene_name}: {len(cairo)} plays with cairo, {len(opengl)} with opengl"]
+    failures = []
+    for index, (reference, candidate) in enumerate(zip(cairo, opengl)):
+        result = compare_frames(reference, candidate, pixel_threshold)
+        if result["mean_diff"] > max_mean_diff or result["changed"] > max_changed:
+            failures.append(f"{scene_name} play {index}: mean_diff {result['mean_diff']:.2f}, "
+                            f"changed {result['changed']:.2%}")
+            if diff_dir:
+                write_diff_image(Path(diff_dir) / scene_name / f"play_{index:03d}.png", reference, candidate)
+    return failures
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "capture":
+        parser = argparse.ArgumentParser(description="Capture the last frame of every play with one renderer.")
+        parser.add_argument("command")
+        parser.add_argument("module")
+        parser.add_argument("scene")
+        parser.add_argument("--renderer", choices=RENDERERS, required=True)
+        parser.add_argument("-q", "--quality", default=DEFAULT_QUALITY)
+        parser.add_argument("--out", required=True)
+        args = parser.parse_args()
+        np.savez_compressed(args.out, frames=capture_play_frames(args.module, args.scene, args.renderer, args.quality))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Compare Cairo and OpenGL renders of the course scenes.")
+    parser.add_argument("module", nargs="?", help="Scene module; default: every course module")
+    parser.add_argument("scenes", nargs="*", help="Scene class names; default: every Scene in the module")
+    parser.add_argument("-q", "--quality", default=DEFAULT_QUALITY, help="manim quality flag (default: %(default)s)")
+    parser.add_argument("--pixel-threshold", type=int, default=DEFAULT_PIXEL_THRESHOLD)
+    parser.add_argument("--max-mean-diff", type=float, default=DEFAULT_MAX_MEAN_DIFF)
+    parser.add_argument("--max-changed", type=float, default=DEFAULT_MAX_CHANGED)
+    parser.add_argument("--diff-dir", help="write side-by-side images of failing plays here")
+    args = parser.parse_args()
+
+    if args.module and args.scenes:
+        targets = [(args.module, scene_name) for scene_name in args.scenes]
+    else:
+        modules = [args.module] if args.module else COURSE_MODULES
+        targets = [(module, scene_class.__name__) for module in modules for scene_class in scene_classes(module)]
+
+    failures = []
+    for module, scene_name in targets:
+        scene_failures = check_scene(module, scene_name, args.quality, args.pixel_threshold,
+                                     args.max_mean_diff, args.max_changed, args.diff_dir)
+        print(f"{scene_name}: {'ok' if not scene_failures else f'{len(scene_failures)} differing plays'}")
+        failures += scene_failures
+    for failure in failures:
+        print(f"MISMATCH: {failure}")
+    sys.exit(1 if failures else 0)
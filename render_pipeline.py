@@ -0,0 +1,256 @@
+"""
+Pipelined rasterization and encoding.
+
+The stock CairoRenderer interpolates, rasterizes and pipes each frame to ffmpeg
+one after the other on the render thread. PipelinedRenderer splits that into
+three stages:
+
+    render thread   interpolates and freezes the moving mobjects of the frame
+    raster workers  draw the frozen mobjects into a pooled frame buffer
+    encoder thread  writes finished buffers to the SceneFileWriter in order
+
+Frame buffers come from a fixed FrameBufferPool, so memory is capped and
+nothing is allocated per frame; when the pool is empty the render thread
+waits, which is what bounds how far it can run ahead of the encoder.
+
+Scenes need no changes:
+    python render_pipeline.py l2vpn_flow_scenes.py PacketFlowScene_PE1_Encapsulation -q h --workers 3
+"""
+import argparse
+import copy
+import itertools as it
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.file_ops import write_to_movie
+from manim.utils.iterables import list_update
+
+from render_common import load_scene_class, quality_settings, scene_input_file
+
+DEFAULT_MAX_BUFFER_BYTES = 256 * 1024 * 1024
+DEFAULT_RASTER_WORKERS = 2
+
+# Per-mobject arrays the camera reads while drawing. Interpolation may update
+# them in place, so a frozen mobject gets its own copies.
+_SNAPSHOT_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas")
+
+
+class FrameBufferPool:
+    """
+    A fixed set of preallocated frame buffers.
+
+    acquire() blocks until a buffer is free and release() hands it back, so the
+    pool doubles as the bound on frames in flight between pipeline stages.
+    """
+    def __init__(self, shape, dtype="uint8", count: int = 2):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.size = max(1, count)
+        self._free = queue.Queue()
+        for _ in range(self.size):
+            self._free.put(np.empty(self.shape, dtype=self.dtype))
+
+    @classmethod
+    def for_budget(cls, shape, dtype="uint8", max_bytes: int = DEFAULT_MAX_BUFFER_BYTES, min_buffers: int = 2):
+        """Sizes the pool to fit in `max_bytes`, but never below `min_buffers`."""
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        return cls(shape, dtype, max(min_buffers, max_bytes // frame_bytes))
+
+    def acquire(self) -> np.ndarray:
+        return self._free.get()
+
+    def release(self, buffer: np.ndarray):
+        self._free.put(buffer)
+
+
+def snapshot_mobject(mobject):
+    """
+    Freezes what the camera draws for a single mobject (not its family): a
+    shallow copy with its own point and color arrays, so the render thread can
+    keep interpolating the original while a raster worker draws the copy.
+    """
+    frozen = copy.copy(mobject)
+    frozen.submobjects = []
+    for attr in _SNAPSHOT_ARRAYS:
+        value = mobject.__dict__.get(attr)
+        if value is not None:
+            setattr(frozen, attr, np.array(value))
+    return frozen
+
+
+def capture_into(camera, mobjects, pixel_array):
+    """
+    Camera.capture_mobjects(), but drawing into `pixel_array` rather than into
+    camera.pixel_array. `mobjects` must already be flattened and ordered.
+    """
+    mobjects = camera.get_mobjects_to_display(mobjects, include_submobjects=False)
+    for group_type, group in it.groupby(mobjects, camera.type_or_raise):
+        camera.display_funcs[group_type](list(group), pixel_array)
+
+
+class QueuedFileWriter:
+    """
+    Stands in for `renderer.file_writer`. begin_animation/end_animation are
+    queued behind the frames already in flight, everything else is delegated.
+    """
+    def __init__(self, renderer, file_writer):
+        self.renderer = renderer
+        self.file_writer = file_writer
+
+    def __getattr__(self, name):
+        return getattr(self.file_writer, name)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if file_path is None and allow_write and write_to_movie():
+            # Resolve now: num_plays will have moved on by the time the encoder runs this.
+            file_path = self.file_writer.partial_movie_files[self.renderer.num_plays]
+        self.renderer.enqueue_call(self.file_writer.begin_animation, allow_write, file_path=file_path)
+
+    def end_animation(self, allow_write=False):
+        self.renderer.enqueue_call(self.file_writer.end_animation, allow_write)
+
+
+class PipelinedRenderer(CairoRenderer):
+    """
+    A CairoRenderer whose rasterization and encoding run on worker threads.
+
+    Cairo and the ffmpeg pipe both release the GIL while they work, so raster
+    workers and the encoder overlap with interpolation on the render thread.
+    """
+    def __init__(self, raster_workers: int = DEFAULT_RASTER_WORKERS, max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES, **kwargs):
+        super().__init__(**kwargs)
+        shape = self.camera.pixel_array.shape
+        self.pool = FrameBufferPool.for_budget(shape, self.camera.pixel_array.dtype, max_buffer_bytes, min_buffers=raster_workers + 1)
+        # Each raster worker draws with its own camera; cairo contexts are cached per camera and buffer.
+        self._cameras = queue.Queue()
+        for _ in range(raster_workers):
+            self._cameras.put(type(self.camera)())
+        self._rasterizer = ThreadPoolExecutor(max_workers=raster_workers, thread_name_prefix="raster")
+        self._pending = queue.Queue(maxsize=2 * self.pool.size)
+        self._error = None
+        self._encoder = threading.Thread(target=self._encode_loop, name="encoder", daemon=True)
+        self._encoder.start()
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.file_writer = QueuedFileWriter(self, self.file_writer)
+
+    def enqueue_call(self, fn, *args, **kwargs):
+        self._put(("call", (fn, args, kwargs), None, 0))
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        if not moving_mobjects:
+            moving_mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        frozen = [snapshot_mobject(mob) for mob in self.camera.get_mobjects_to_display(moving_mobjects)]
+        buffer = self.pool.acquire()
+        future = self._rasterizer.submit(self._rasterize, buffer, self.static_image, frozen)
+        self._put(("frame", future, buffer, 1))
+        self.time += 1 / self.camera.frame_rate
+
+    def freeze_current_frame(self, duration: float):
+        # The pooled buffer is the only copy needed; skip get_frame()'s.
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
+
+    def add_frame(self, frame, num_frames=1):
+        # Used for frozen frames, which are rasterized on the render thread.
+        if self.skip_animations:
+            return
+        buffer = self.pool.acquire()
+        np.copyto(buffer, frame)
+        self._put(("frame", None, buffer, num_frames))
+        self.time += num_frames / self.camera.frame_rate
+
+    def scene_finished(self, scene):
+        self.drain()
+        super().scene_finished(scene)
+
+    def drain(self):
+        """Waits for every queued frame and writer call, then stops the workers."""
+        self._pending.put(None)
+        self._encoder.join()
+        self._rasterizer.shutdown()
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, item):
+        if self._error is not None:
+            raise self._error
+        self._pending.put(item)
+
+    def _rasterize(self, buffer, background, frozen):
+        camera = self._cameras.get()
+        try:
+            np.copyto(buffer, camera.background if background is None else background)
+            capture_into(camera, frozen, buffer)
+        finally:
+            self._cameras.put(camera)
+
+    def _encode_loop(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            kind, payload, buffer, num_frames = item
+            try:
+                if self._error is not None:
+                    continue  # keep draining so the render thread never blocks
+                if kind == "call":
+                    fn, args, kwargs = payload
+                    fn(*args, **kwargs)
+                    continue
+                if payload is not None:
+                    payload.result()
+                for _ in range(num_frames):
+                    self.file_writer.file_writer.write_frame(buffer)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                if buffer is not None:
+                    if payload is not None and not payload.done():
+                        payload.exception()  # wait: the raster worker may still be drawing into it
+                    self.pool.release(buffer)
+
+
+def render_pipelined(scene_class: type, quality: str = "h", raster_workers: int = DEFAULT_RASTER_WORKERS, max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES):
+    """
+    Renders one Scene class through the pipelined renderer.
+
+    Args:
+        scene_class: The Scene subclass to render.
+        quality: A manim quality flag ("l", "m", "h", "p", "k").
+        raster_workers: Number of rasterizer threads.
+        max_buffer_bytes: Memory cap for the frame buffer pool.
+
+    Returns:
+        The rendered Scene instance.
+    """
+    with tempconfig({**quality_settings(quality), "input_file": scene_input_file(scene_class)}):
+        renderer = PipelinedRenderer(raster_workers=raster_workers, max_buffer_bytes=max_buffer_bytes)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return scene
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes with pipelined rasterization and encoding.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_RASTER_WORKERS, help="rasterizer threads")
+    parser.add_argument("--max-buffer-mb", type=int, default=DEFAULT_MAX_BUFFER_BYTES // (1024 * 1024))
+    args = parser.parse_args()
+
+    for scene_name in args.scenes:
+        render_pipelined(
+            load_scene_class(args.module, scene_name),
+            args.quality,
+            args.workers,
+            args.max_buffer_mb * 1024 * 1024,
+        )
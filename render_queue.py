@@ -0,0 +1,334 @@
+"""
+A local render job queue with its state in SQLite.
+
+The render matrix (scene x quality x locale x variant) is expanded into one
+row per job. Workers claim jobs in priority order: the lowest resolution
+renders first, so previews are ready long before the finals. Each job runs in
+its own `python render_queue.py exec` subprocess, so a crash or leak in one
+render cannot take the worker down. Failed jobs are retried with exponential
+backoff until they run out of attempts. Every attempt's wall time, CPU time
+and exit status is kept in the `attempts` table for capacity planning; each
+successful or failed render also appends its render_metrics record (frames,
+cache hits, encoder time, ...) to --jsonl, labeled with its locale and variant.
+
+The queue is resumable: re-running `init` only adds missing jobs, and `run`
+puts jobs that were running when a previous run died back into the queue.
+
+    python render_queue.py init --qualities lh --locales en,de --variants customers.csv
+    python render_queue.py run --workers 6
+    python render_queue.py status
+    python render_queue.py timings > timings.csv
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from l2vpn_i18n import SOURCE_LOCALE, set_locale
+from render_common import COURSE_MODULES, load_scene_class, private_partial_movie_dir, quality_settings, scene_classes
+from render_locales import locale_settings
+from render_metrics import DEFAULT_JSONL, metered_render
+from render_variants import VariantText, read_table, text_factory_installed
+from text_prewarm import use_text_cache
+
+DEFAULT_DB = "render_queue.sqlite3"
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 30.0  # seconds before the first retry, doubled for every further one
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    module TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    variant TEXT NOT NULL DEFAULT '',
+    substitutions TEXT NOT NULL DEFAULT '{}',
+    priority INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    UNIQUE (module, scene, quality, locale, variant)
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (state, priority, id);
+CREATE TABLE IF NOT EXISTS attempts (
+    job_id INTEGER NOT NULL REFERENCES jobs (id),
+    attempt INTEGER NOT NULL,
+    worker TEXT NOT NULL,
+    started REAL NOT NULL,
+    wall_seconds REAL,
+    cpu_seconds REAL,
+    max_rss_kb INTEGER,
+    exit_code INTEGER,
+    PRIMARY KEY (job_id, attempt)
+);
+"""
+
+
+def connect(path=DEFAULT_DB) -> sqlite3.Connection:
+    db = sqlite3.connect(path, timeout=60, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def expand_matrix(db, modules, qualities, locales, variants) -> int:
+    """
+    Adds a job for every scene x quality x locale x variant not yet queued.
+
+    Args:
+        modules: Scene modules, expanded to their Scene classes in source order.
+        qualities: manim quality flags, e.g. "lh".
+        locales: Locale codes.
+        variants: (variant_name, substitutions) pairs; [("", {})] for no variants.
+
+    Returns:
+        The number of jobs added.
+    """
+    rows = []
+    for module in modules:
+        for scene_class in scene_classes(module):
+            for flag in qualities:
+                priority = quality_settings(flag)["pixel_height"]
+                for locale in locales:
+                    for name, substitutions in variants:
+                        rows.append((module, scene_class.__name__, flag, locale, name, json.dumps(substitutions), priority))
+    before = db.total_changes
+    db.executemany(
+        "INSERT OR IGNORE INTO jobs (module, scene, quality, locale, variant, substitutions, priority) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return db.total_changes - before
+
+
+def claim(db, worker: str):
+    """Marks the most urgent ready job as running and returns it, or None."""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        job = db.execute(
+            "SELECT * FROM jobs WHERE state = 'pending' AND not_before <= ? ORDER BY priority, id LIMIT 1",
+            (time.time(),),
+        ).fetchone()
+        if job is not None:
+            db.execute("UPDATE jobs SET state = 'running', attempts = attempts + 1 WHERE id = ?", (job["id"],))
+            db.execute(
+                "INSERT INTO attempts (job_id, attempt, worker, started) VALUES (?, ?, ?, ?)",
+                (job["id"], job["attempts"] + 1, worker, time.time()),
+            )
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    return job
+
+
+def finish(db, job, attempt: int, wall: float, usage, exit_code: int, error: str, max_attempts: int, backoff: float):
+    """Records an attempt and moves the job to done, back to pending, or to failed."""
+    db.execute("BEGIN IMMEDIATE")
+    db.execute(
+        "UPDATE attempts SET wall_seconds = ?, cpu_seconds = ?, max_rss_kb = ?, exit_code = ? WHERE job_id = ? AND attempt = ?",
+        (wall, usage.ru_utime + usage.ru_stime, usage.ru_maxrss, exit_code, job["id"], attempt),
+    )
+    if exit_code == 0:
+        db.execute("UPDATE jobs SET state = 'done', error = NULL WHERE id = ?", (job["id"],))
+    elif attempt < max_attempts:
+        retry_at = time.time() + backoff * 2 ** (attempt - 1)
+        db.execute("UPDATE jobs SET state = 'pending', not_before = ?, error = ? WHERE id = ?", (retry_at, error, job["id"]))
+    else:
+        db.execute("UPDATE jobs SET state = 'failed', error = ? WHERE id = ?", (error, job["id"]))
+    db.execute("COMMIT")
+
+
+def recover(db) -> int:
+    """Puts jobs left running by an interrupted run back into the queue."""
+    return db.execute("UPDATE jobs SET state = 'pending' WHERE state = 'running'").rowcount
+
+
+def _job_params(job) -> dict:
+    return {key: job[key] for key in ("module", "scene", "quality", "locale", "variant", "substitutions")}
+
+
+def render_job(params: dict, use_prewarmed_text: bool = False, concurrent: bool = False,
+               jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Renders one job in this process. Runs inside the `exec` subprocess.
+
+    Args:
+        concurrent: Other workers may render the same scene and quality at
+            the same time, so partial movies go to a directory of this job's own.
+        jsonl, textfile: Where to record the render's metrics, see render_metrics.metered_render().
+    """
+    set_locale(params["locale"])
+    scene_class = load_scene_class(params["module"], params["scene"])
+    settings = locale_settings(scene_class, params["locale"], params["quality"])
+    if params["variant"]:
+        parts = [params["scene"], params["locale"] if params["locale"] != SOURCE_LOCALE else "", params["variant"]]
+        settings["output_file"] = "_".join(part for part in parts if part)
+    factory = VariantText()
+    factory.substitutions = json.loads(params["substitutions"])
+    with text_factory_installed(factory), tempconfig(settings):
+        if concurrent:
+            tag = ".".join(part for part in (params["locale"], params["variant"]) if part)
+            config.partial_movie_dir = private_partial_movie_dir(scene_class, tag)
+        text_cache = use_text_cache(params["locale"]) if use_prewarmed_text else contextlib.nullcontext()
+        with text_cache:
+            metered_render(scene_class, params["quality"], jsonl, textfile,
+                           locale=params["locale"], variant=params["variant"])
+
+
+def _run_attempt(job, attempt: int, log_dir: Path, use_prewarmed_text: bool, concurrent: bool, jsonl, textfile):
+    """Runs one attempt in a subprocess. Returns (wall, rusage, exit code, last log line)."""
+    log_path = log_dir / f"{job['id']}-{attempt}.log"
+    command = [sys.executable, str(Path(__file__).resolve()), "exec", json.dumps(_job_params(job))]
+    if use_prewarmed_text:
+        command.append("--prewarmed-text")
+    if concurrent:
+        command.append("--concurrent")
+    command += ["--jsonl", jsonl or ""]
+    if textfile:
+        command += ["--textfile", textfile]
+    started = time.monotonic()
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        # wait4() rather than wait(): it also reports the child's CPU time and peak RSS.
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.monotonic() - started
+    error = None
+    if process.returncode != 0:
+        lines = log_path.read_text(encoding="utf-8", errors="replace").strip().splitlines()
+        error = lines[-1] if lines else f"exit code {process.returncode}"
+    return wall, usage, process.returncode, error
+
+
+def _worker_loop(db_path, worker: str, stop: threading.Event, log_dir: Path, max_attempts: int, backoff: float, use_prewarmed_text: bool, concurrent: bool, jsonl, textfile):
+    db = connect(db_path)
+    while not stop.is_set():
+        job = claim(db, worker)
+        if job is None:
+            waiting = db.execute("SELECT MIN(not_before) FROM jobs WHERE state = 'pending'").fetchone()[0]
+            if waiting is None:
+                return  # nothing pending: the other workers finish what is running
+            stop.wait(min(max(waiting - time.time(), 0.5), 5.0))
+            continue
+        attempt = job["attempts"] + 1
+        wall, usage, exit_code, error = _run_attempt(job, attempt, log_dir, use_prewarmed_text, concurrent, jsonl, textfile)
+        finish(db, job, attempt, wall, usage, exit_code, error, max_attempts, backoff)
+        print(f"[{worker}] {job['scene']} {job['quality']} {job['locale']} {job['variant']}".rstrip()
+              + f": {'ok' if exit_code == 0 else 'failed'} in {wall:.1f}s", flush=True)
+
+
+def run(db_path=DEFAULT_DB, workers: int = 2, max_attempts: int = DEFAULT_MAX_ATTEMPTS, backoff: float = DEFAULT_BACKOFF, use_prewarmed_text: bool = False,
+        jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Runs queued jobs on `workers` concurrent subprocesses until nothing is pending.
+    Render metrics go to `jsonl` and `textfile`, see render_metrics.metered_render().
+    """
+    db = connect(db_path)
+    recovered = recover(db)
+    if recovered:
+        print(f"Requeued {recovered} interrupted jobs")
+    log_dir = Path(db_path).resolve().parent / "render_logs"
+    log_dir.mkdir(exist_ok=True)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(
+            target=_worker_loop,
+            args=(db_path, f"worker-{i}", stop, log_dir, max_attempts, backoff, use_prewarmed_text, workers > 1,
+                  jsonl, textfile),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        # Running jobs finish; anything left over is requeued by the next run.
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def print_status(db):
+    counts = db.execute(
+        "SELECT quality, state, COUNT(*) AS n FROM jobs GROUP BY quality, state ORDER BY MIN(priority), state"
+    ).fetchall()
+    by_quality = {}
+    for row in counts:
+        by_quality.setdefault(row["quality"], {})[row["state"]] = row["n"]
+    for flag, states in by_quality.items():
+        total = sum(states.values())
+        summary = ", ".join(f"{state} {n}" for state, n in sorted(states.items()))
+        print(f"-q{flag}: {states.get('done', 0)}/{total} done ({summary})")
+    for row in db.execute("SELECT scene, quality, locale, variant, attempts, error FROM jobs WHERE state = 'failed' ORDER BY id"):
+        print(f"FAILED {row['scene']} -q{row['quality']} {row['locale']} {row['variant']} after {row['attempts']} attempts: {row['error']}")
+
+
+def write_timings(db, out):
+    writer = csv.writer(out)
+    writer.writerow(["module", "scene", "quality", "locale", "variant", "attempt", "worker", "started", "wall_seconds", "cpu_seconds", "max_rss_kb", "exit_code"])
+    rows = db.execute(
+        "SELECT j.module, j.scene, j.quality, j.locale, j.variant, a.attempt, a.worker, a.started, "
+        "a.wall_seconds, a.cpu_seconds, a.max_rss_kb, a.exit_code "
+        "FROM attempts a JOIN jobs j ON j.id = a.job_id ORDER BY a.started"
+    )
+    writer.writerows(tuple(row) for row in rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite-backed render job queue.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="queue database (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    init = commands.add_parser("init", help="expand the render matrix into jobs")
+    init.add_argument("--modules", nargs="+", default=list(COURSE_MODULES))
+    init.add_argument("--qualities", default="lh", help="manim quality flags (default: lh)")
+    init.add_argument("--locales", default=SOURCE_LOCALE, help="comma-separated locale codes")
+    init.add_argument("--variants", help="CSV substitution table, see render_variants.py")
+
+    run_parser = commands.add_parser("run", help="render queued jobs")
+    run_parser.add_argument("--workers", type=int, default=2)
+    run_parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    run_parser.add_argument("--backoff", type=float, default=DEFAULT_BACKOFF, help="seconds before the first retry")
+    run_parser.add_argument("--prewarmed-text", action="store_true", help="read Text from the text_prewarm.py cache")
+    run_parser.add_argument("--jsonl", default=DEFAULT_JSONL, help="render metrics output (default: %(default)s)")
+    run_parser.add_argument("--textfile", help="Prometheus textfile-collector output")
+
+    commands.add_parser("status", help="show progress and failures")
+    commands.add_parser("timings", help="write per-attempt timings as CSV to stdout")
+
+    exec_parser = commands.add_parser("exec", help=argparse.SUPPRESS)
+    exec_parser.add_argument("params")
+    exec_parser.add_argument("--prewarmed-text", action="store_true")
+    exec_parser.add_argument("--concurrent", action="store_true")
+    exec_parser.add_argument("--jsonl", default=DEFAULT_JSONL)
+    exec_parser.add_argument("--textfile")
+
+    args = parser.parse_args()
+    if args.command == "init":
+        variants = read_table(args.variants) if args.variants else [("", {})]
+        added = expand_matrix(connect(args.db), args.modules, args.qualities, args.locales.split(","), variants)
+        print(f"Queued {added} new jobs")
+    elif args.command == "run":
+        run(args.db, args.workers, args.max_attempts, args.backoff, args.prewarmed_text, args.jsonl, args.textfile)
+    elif args.command == "status":
+        print_status(connect(args.db))
+    elif args.command == "timings":
+        write_timings(connect(args.db), sys.stdout)
+    elif args.command == "exec":
+        render_job(json.loads(args.params), args.prewarmed_text, args.concurrent, args.jsonl or None, args.textfile)
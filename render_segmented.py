@@ -0,0 +1,244 @@
+"""
+Segmented (HLS) output that can be watched while the scene is still rendering.
+
+Every play() is encoded once and written twice through ffmpeg's tee muxer:
+to manim's usual partial movie file, and to fixed-duration fMP4 segments
+with a keyframe forced at every segment boundary. The segments of a play live
+in a directory named after the play's hash, next to the partial movie files:
+
+    videos/<module>/<quality>/segment_files/<Scene>/<hash>/init.mp4, seg_00000.m4s, ...
+
+A playlist next to the movie (<Scene>.m3u8) lists the segments of all plays
+so far, with a discontinuity between plays, and is rewritten about once per
+second of output. It is an EVENT playlist until the scene finishes, so any
+HLS player (Safari, hls.js, ffplay, VLC) can start from the beginning
+while the rest is still rendering.
+
+Because segments are keyed by the play hash, they follow manim's cache: a
+play whose hash is unchanged reuses its segments, so editing the end of a
+scene only regenerates the tail. A cached play with a partial movie file but
+no segments yet is remuxed into segments without re-encoding.
+
+    python render_segmented.py l2vpn_flow_scenes.py PacketFlowScene_PE2_Decapsulation -q h
+"""
+import argparse
+import math
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+from manim import config, tempconfig, __version__
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+from render_common import load_scene_class, quality_settings, scene_input_file
+
+DEFAULT_SEGMENT_SECONDS = 2.0
+
+PLAY_PLAYLIST = "index.m3u8"
+INIT_SEGMENT = "init.mp4"
+
+
+def read_play_playlist(segment_dir: Path):
+    """
+    Parses the playlist ffmpeg writes for one play.
+
+    Returns:
+        (segments, complete): segments is a list of (duration, file name), and
+        complete tells whether the play finished encoding.
+    """
+    path = segment_dir / PLAY_PLAYLIST
+    if not path.exists():
+        return [], False
+    segments, duration = [], None
+    lines = path.read_text(encoding="utf-8").splitlines()
+    for line in lines:
+        if line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:"):].split(",")[0])
+        elif line and not line.startswith("#") and duration is not None:
+            segments.append((duration, Path(line).name))
+            duration = None
+    return segments, "#EXT-X-ENDLIST" in lines
+
+
+def hls_options(segment_dir: Path, segment_seconds: float) -> str:
+    """The hls muxer options shared by encoding and remuxing."""
+    return ":".join([
+        "f=hls",
+        f"hls_time={segment_seconds}",
+        "hls_list_size=0",
+        "hls_playlist_type=event",
+        "hls_segment_type=fmp4",
+        f"hls_fmp4_init_filename={INIT_SEGMENT}",
+        f"hls_segment_filename={segment_dir / 'seg_%05d.m4s'}",
+    ])
+
+
+class SegmentedFileWriter(SceneFileWriter):
+    """
+    A SceneFileWriter that also writes each play as HLS segments and keeps a
+    scene playlist up to date. Only the default H.264/mp4 output is supported.
+    """
+    segment_seconds = DEFAULT_SEGMENT_SECONDS
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        if is_webm_format() or config["transparent"]:
+            raise ValueError("Segmented output needs the default mp4 (H.264) movie format")
+        super().__init__(renderer, scene_name, **kwargs)
+        self.play_segment_dirs = []
+        self.playlist_path = None
+        self._frames_since_refresh = 0
+        if write_to_movie():
+            self.segment_directory = self.partial_movie_directory.parent.parent / "segment_files" / scene_name
+            self.segment_directory.mkdir(parents=True, exist_ok=True)
+            self.playlist_path = self.movie_file_path.with_suffix(".m3u8")
+
+    def add_partial_movie_file(self, hash_animation):
+        super().add_partial_movie_file(hash_animation)
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return
+        if hash_animation is None:
+            self.play_segment_dirs.append(None)
+            return
+        segment_dir = self.segment_directory / hash_animation
+        self.play_segment_dirs.append(segment_dir)
+        partial_movie = Path(self.partial_movie_files[-1])
+        if partial_movie.exists() and not read_play_playlist(segment_dir)[1]:
+            # Cached play from a render without segments: remux, no re-encode.
+            self._remux(partial_movie, segment_dir)
+        self.refresh_playlist()
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        segment_dir = self.segment_directory / Path(file_path).stem
+        shutil.rmtree(segment_dir, ignore_errors=True)  # leftovers of an interrupted render
+        segment_dir.mkdir(parents=True)
+
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        seconds = self.segment_seconds
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", f"{config['pixel_width']}x{config['pixel_height']}",
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+            "-vcodec", "libx264",
+            "-pix_fmt", "yuv420p",
+            # A keyframe at every boundary, so every segment is exactly `seconds` long.
+            "-force_key_frames", f"expr:gte(t,n_forced*{seconds})",
+            "-flags", "+global_header",
+            "-map", "0:v",
+            "-f", "tee",
+            f"{file_path}|[{hls_options(segment_dir, seconds)}]{segment_dir / PLAY_PLAYLIST}",
+        ]
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._frames_since_refresh = 0
+
+    def write_frame(self, frame_or_renderer):
+        super().write_frame(frame_or_renderer)
+        self._frames_since_refresh += 1
+        if self._frames_since_refresh >= config["frame_rate"]:
+            self._frames_since_refresh = 0
+            self.refresh_playlist()
+
+    def close_movie_pipe(self):
+        super().close_movie_pipe()
+        self.refresh_playlist()
+
+    def finish(self):
+        super().finish()
+        if write_to_movie():
+            self.refresh_playlist(final=True)
+
+    def refresh_playlist(self, final: bool = False):
+        """Rewrites the scene playlist from the segments written so far."""
+        if self.playlist_path is None:
+            return
+        base = self.playlist_path.parent
+        entries, longest = [], self.segment_seconds
+        for segment_dir in self.play_segment_dirs:
+            if segment_dir is None:
+                continue
+            segments, _ = read_play_playlist(segment_dir)
+            if not segments:
+                continue
+            relative = Path(os.path.relpath(segment_dir, base)).as_posix()
+            entries += ["#EXT-X-DISCONTINUITY", f'#EXT-X-MAP:URI="{relative}/{INIT_SEGMENT}"']
+            for duration, name in segments:
+                entries += [f"#EXTINF:{duration:.6f},", f"{relative}/{name}"]
+                longest = max(longest, duration)
+        if entries:
+            entries = entries[1:]  # no discontinuity before the first play
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:7",
+            f"#EXT-X-TARGETDURATION:{math.ceil(longest)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:" + ("VOD" if final else "EVENT"),
+            "#EXT-X-INDEPENDENT-SEGMENTS",
+            *entries,
+        ]
+        if final:
+            lines.append("#EXT-X-ENDLIST")
+        staging = self.playlist_path.with_suffix(".m3u8.tmp")
+        staging.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(staging, self.playlist_path)  # players never see a half-written playlist
+
+    def _remux(self, partial_movie: Path, segment_dir: Path):
+        shutil.rmtree(segment_dir, ignore_errors=True)
+        segment_dir.mkdir(parents=True)
+        subprocess.run(
+            [
+                config.ffmpeg_executable, "-y",
+                "-loglevel", config["ffmpeg_loglevel"].lower(),
+                "-i", str(partial_movie),
+                "-c", "copy",
+                "-map", "0:v",
+                "-f", "tee",
+                f"[{hls_options(segment_dir, self.segment_seconds)}]{segment_dir / PLAY_PLAYLIST}",
+            ],
+            check=True,
+        )
+
+
+def render_segmented(scene_class: type, quality: str = "h", segment_seconds: float = DEFAULT_SEGMENT_SECONDS):
+    """
+    Renders one Scene class with segmented output.
+
+    Args:
+        scene_class: The Scene subclass to render.
+        quality: A manim quality flag.
+        segment_seconds: Target segment duration.
+
+    Returns:
+        The rendered Scene instance.
+    """
+    writer_class = type("SegmentedFileWriter", (SegmentedFileWriter,), {"segment_seconds": segment_seconds})
+    with tempconfig({**quality_settings(quality), "input_file": scene_input_file(scene_class)}):
+        scene = scene_class(renderer=CairoRenderer(file_writer_class=writer_class))
+        scene.render()
+    return scene
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes with progressive HLS segment output.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--segment-seconds", type=float, default=DEFAULT_SEGMENT_SECONDS)
+    args = parser.parse_args()
+
+    for scene_name in args.scenes:
+        scene = render_segmented(load_scene_class(args.module, scene_name), args.quality, args.segment_seconds)
+        print(scene.renderer.file_writer.playlist_path)
@@ -0,0 +1,214 @@
+"""
+Variant-batch rendering: the same scene personalized per customer.
+
+A substitution table (CSV) has a "variant" column plus one column per
+literal to replace, named after the literal itself:
+
+    variant,Customer Site A,Customer Site B,CE-A1,CE-B1,CE_B1,VC-L
+    acme,Acme Berlin,Acme Paris,ber-ce-01,par-ce-01,par-ce-01,VC 1042
+
+During the batch, `Text` in the scene modules (and in l2vpn_labels, which
+builds the router and packet labels) is replaced by a caching factory: every
+distinct string is laid out by Pango once per process and copied afterwards,
+so only Text that actually differs between variants is rebuilt. Labels made
+with create_label() are substituted before they are built, so atlas labels
+(see l2vpn_labels) show the variant's text as well. play() calls that show
+no substituted text are rendered once: in a single process every variant
+uses the scene's partial-movie cache; with --processes the first variant
+fills it and the others render into partial-movie directories of their own,
+seeded from it (manim's concat list and cache pruning are not safe for
+concurrent renders of one directory). Every render appends its
+render_metrics record, labeled with the variant, to --jsonl.
+
+    python render_variants.py l2vpn_flow_scenes.py PacketFlowScene_CE1_to_PE1 --table customers.csv -q h
+"""
+import argparse
+import contextlib
+import csv
+import multiprocessing
+import re
+
+from manim import Text, config, tempconfig
+
+from l2vpn_labels import create_label
+from render_common import load_module, load_scene_class, private_partial_movie_dir, quality_settings, scene_input_file
+from render_metrics import DEFAULT_JSONL, metered_render
+
+# Modules whose `Text` is swapped for the caching factory during a batch.
+TEXT_MODULES = ("l2vpn_flow_scenes", "l2vpn_topology_scene", "l2vpn_labels")
+# Modules whose `create_label` is swapped for the factory's substituting one.
+LABEL_MODULES = ("l2vpn_elements", "l2vpn_flow_scenes")
+
+
+def substitute(text: str, substitutions: dict) -> str:
+    """
+    Applies literal replacements in one pass, longest key first so "CE-A1"
+    wins over "CE-A"; replaced text is never substituted again.
+    """
+    if not substitutions:
+        return text
+    pattern = "|".join(re.escape(key) for key in sorted(substitutions, key=len, reverse=True))
+    return re.sub(pattern, lambda match: substitutions[match.group(0)], text)
+
+
+class VariantText:
+    """
+    Drop-in replacement for manim's Text that applies the current variant's
+    substitutions and caches every built Text by its final string and style.
+    """
+    def __init__(self):
+        self.substitutions = {}
+        self.built = 0
+        self.reused = 0
+        self._cache = {}
+
+    def __call__(self, text, *args, **kwargs):
+        text = substitute(text, self.substitutions)
+        key = (text, repr(args), repr(sorted(kwargs.items())))
+        if key in self._cache:
+            self.reused += 1
+        else:
+            self.built += 1
+            self._cache[key] = Text(text, *args, **kwargs)
+        return self._cache[key].copy()
+
+    def create_label(self, text, *args, **kwargs):
+        """
+        Drop-in replacement for l2vpn_labels.create_label. The text is
+        substituted before the label is built, so an AtlasLabel (and its
+        cached template) is keyed by the final string; a Text label still
+        comes from this factory's cache.
+        """
+        substitutions, self.substitutions = self.substitutions, {}
+        try:
+            return create_label(substitute(text, substitutions), *args, **kwargs)
+        finally:
+            self.substitutions = substitutions
+
+
+@contextlib.contextmanager
+def text_factory_installed(factory, modules=TEXT_MODULES, label_modules=LABEL_MODULES):
+    """
+    Temporarily rebinds `Text` in `modules` to `factory` and `create_label`
+    in `label_modules` to `factory.create_label`.
+
+    Raises:
+        ValueError: A module does not have the name to rebind, so its text
+            would silently go unsubstituted.
+    """
+    targets = [(name, "Text", factory) for name in modules]
+    targets += [(name, "create_label", factory.create_label) for name in label_modules]
+    patched = []
+    try:
+        for name, attribute, replacement in targets:
+            module = load_module(name)
+            if not hasattr(module, attribute):
+                raise ValueError(f"{module.__name__} has no {attribute} to substitute variants in")
+            patched.append((module, attribute, getattr(module, attribute)))
+            setattr(module, attribute, replacement)
+        yield factory
+    finally:
+        for module, attribute, original in patched:
+            setattr(module, attribute, original)
+
+
+def read_table(path) -> list:
+    """
+    Reads a substitution table.
+
+    Returns:
+        A list of (variant_name, substitutions) pairs. Empty cells are left unsubstituted.
+    """
+    with open(path, newline="", encoding="utf-8") as table:
+        rows = list(csv.DictReader(table))
+    variants = []
+    for row in rows:
+        name = row.pop("variant")
+        variants.append((name, {key: value for key, value in row.items() if value}))
+    return variants
+
+
+def render_variant_batch(scene_class: type, variants: list, quality: str = "h", factory: VariantText = None,
+                         concurrent: bool = False, jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Renders `scene_class` once per variant in this process.
+
+    Args:
+        scene_class: The Scene subclass to render.
+        variants: (variant_name, substitutions) pairs, see read_table().
+        quality: A manim quality flag.
+        factory: A VariantText to reuse; a fresh one is created if omitted.
+        concurrent: Other processes render variants of the scene at the same
+            time, so every variant gets a partial-movie directory of its own.
+        jsonl, textfile: Where to record the metrics of every render, see
+            render_metrics.metered_render().
+
+    Returns:
+        The VariantText, whose built/reused counters show how much Text work was shared.
+    """
+    factory = factory or VariantText()
+    with text_factory_installed(factory):
+        for name, substitutions in variants:
+            factory.substitutions = substitutions
+            settings = {
+                **quality_settings(quality),
+                "input_file": scene_input_file(scene_class),
+                "output_file": f"{scene_class.__name__}_{name}",
+            }
+            with tempconfig(settings):
+                if concurrent:
+                    config.partial_movie_dir = private_partial_movie_dir(scene_class, name)
+                metered_render(scene_class, quality, jsonl, textfile, variant=name)
+    return factory
+
+
+def _render_slice(job):
+    module, scene_name, variants, quality, concurrent, jsonl, textfile = job
+    factory = render_variant_batch(load_scene_class(module, scene_name), variants, quality,
+                                   concurrent=concurrent, jsonl=jsonl, textfile=textfile)
+    return factory.built, factory.reused
+
+
+def render_variants(module: str, scene_name: str, variants: list, quality: str = "h", processes: int = 1,
+                    jsonl=DEFAULT_JSONL, textfile=None):
+    """
+    Renders every variant of one scene, optionally across several processes.
+
+    The first variant is rendered on its own before fanning out, so the plays
+    all variants share are already cached (and linked into every worker's
+    partial-movie directory) and no two workers encode them at once.
+    """
+    if not variants:
+        return 0, 0
+    built, reused = _render_slice((module, scene_name, variants[:1], quality, False, jsonl, textfile))
+    rest = variants[1:]
+    if processes <= 1 or len(rest) <= 1:
+        slices = [rest] if rest else []
+        results = [_render_slice((module, scene_name, s, quality, False, jsonl, textfile)) for s in slices]
+    else:
+        slices = [rest[i::processes] for i in range(processes)]
+        jobs = [(module, scene_name, s, quality, True, jsonl, textfile) for s in slices if s]
+        with multiprocessing.Pool(len(jobs)) as pool:
+            results = pool.map(_render_slice, jobs)
+    for slice_built, slice_reused in results:
+        built += slice_built
+        reused += slice_reused
+    return built, reused
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render personalized variants of a scene.")
+    parser.add_argument("module", help="Scene module, e.g. l2vpn_flow_scenes.py")
+    parser.add_argument("scenes", nargs="+", help="Scene class names")
+    parser.add_argument("--table", required=True, help="CSV substitution table with a 'variant' column")
+    parser.add_argument("-q", "--quality", default="h", help="manim quality flag (default: h)")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--jsonl", default=DEFAULT_JSONL, help="render metrics output (default: %(default)s)")
+    parser.add_argument("--textfile", help="Prometheus textfile-collector output")
+    args = parser.parse_args()
+
+    table = read_table(args.table)
+    for scene_name in args.scenes:
+        built, reused = render_variants(args.module, scene_name, table, args.quality, args.processes,
+                                        args.jsonl, args.textfile)
+        print(f"{scene_name}: {len(table)} variants, {built} Text built, {reused} reused")
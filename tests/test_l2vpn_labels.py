@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Camera  # noqa: E402
+
+from l2vpn_labels import AtlasCamera, benchmark_scene  # noqa: E402
+from render_common import load_scene_class  # noqa: E402
+
+
+def test_benchmark_both_label_modes():
+    scene_class = load_scene_class("l2vpn_flow_scenes", "PacketFlowScene_PE1_Encapsulation")
+    results = {mode: benchmark_scene(scene_class, camera_class, "l")
+               for mode, camera_class in (("vector", Camera), ("atlas", AtlasCamera))}
+    for mode, (frames, total, raster) in results.items():
+        print(f"{mode}: {frames} frames, {total:.2f}s total, {1000 * raster / frames:.2f} ms/frame rasterizing")
+    assert results["vector"][0] == results["atlas"][0] > 0
+    assert all(0 < raster <= total for _frames, total, raster in results.values())
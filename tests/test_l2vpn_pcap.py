@@ -0,0 +1,35 @@
+import pytest
+
+from l2vpn_pcap import pseudowire_frame, pseudowire_packets, summarize, write_pcap
+
+DST, SRC = 0x001B213A4C00, 0x0050569C1E01  # both start with a 0 nibble, like a control word
+
+
+@pytest.fixture
+def capture(tmp_path):
+    path = tmp_path / "pw.pcap"
+    write_pcap(path, [
+        pseudowire_frame([16001, 300], True, inner_dst=DST, inner_src=SRC),
+        pseudowire_frame([16001, 301], False, inner_dst=DST, inner_src=SRC),
+        pseudowire_frame([302], False),  # the default 02:00:5e:... MACs
+        pseudowire_frame([16002, 303], True),
+    ])
+    return path
+
+
+def test_auto_detects_control_words(capture):
+    packets = list(pseudowire_packets(capture))
+    assert [packet["control_word"] for packet in packets] == [True, False, False, True]
+    assert [packet["inner_dst"] for packet in packets[:2]] == [DST, DST]
+    assert [packet["inner_src"] for packet in packets[:2]] == [SRC, SRC]
+    assert all(packet["inner_ethertype"] == 0x0800 for packet in packets)
+    assert summarize(capture)["control_words"] == 2
+
+
+def test_explicit_control_word_modes(capture):
+    assert [packet["control_word"] for packet in pseudowire_packets(capture, control_word="never")] == [False] * 4
+    always = list(pseudowire_packets(capture, control_word="always"))
+    assert [packet["control_word"] for packet in always] == [True] * 4
+    assert always[0]["inner_dst"] == DST
+    with pytest.raises(ValueError):
+        summarize(capture, control_word="sometimes")
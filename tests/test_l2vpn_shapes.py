@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import DOWN, LEFT, PI, VGroup  # noqa: E402
+
+from l2vpn_elements import CUSTOMER_COLOR, PROVIDER_COLOR, create_router  # noqa: E402
+from l2vpn_shapes import shared_rectangle, shared_square  # noqa: E402
+
+
+def test_copies_share_points():
+    first = shared_square(1.0, PROVIDER_COLOR, fill_opacity=0.2)
+    second = shared_square(1.0, PROVIDER_COLOR, fill_opacity=0.2)
+    assert first.points_shared() and first.points is second.points
+    assert first.copy().points is first.points
+
+
+def test_group_transforms_copy_on_write():
+    pristine = shared_square(1.0, CUSTOMER_COLOR, fill_opacity=0.2).points.copy()
+    routers = VGroup(create_router("CE1", CUSTOMER_COLOR), create_router("PE1", PROVIDER_COLOR))
+    routers.arrange()
+    group = VGroup(routers, shared_rectangle(2.0, 0.5, PROVIDER_COLOR, fill_opacity=0.3))
+
+    group.scale(0.8).rotate(PI / 6).shift(LEFT * 2 + DOWN)
+    group.stretch(1.5, 0).flip()
+
+    square = routers[0][0]
+    assert not square.points_shared()
+    assert not np.allclose(square.points, pristine)
+    untouched = shared_square(1.0, CUSTOMER_COLOR, fill_opacity=0.2)
+    np.testing.assert_allclose(untouched.points, pristine)
+    assert untouched.points_shared()
+
+
+def test_topology_scales():
+    from l2vpn_flow_scenes import create_l2vpn_topology
+
+    topology = create_l2vpn_topology()
+    width = topology.width
+    topology.scale(0.9)
+    assert topology.width == pytest.approx(0.9 * width)
+
+
+def test_pipeline_snapshot_of_shifted_shape():
+    from manim import RIGHT
+
+    from render_pipeline import snapshot_mobject
+
+    rectangle = shared_rectangle(1.0, 0.5, PROVIDER_COLOR, fill_opacity=0.7)
+    rectangle.shift(RIGHT)  # the first write gives it a private, writable array
+    frozen = snapshot_mobject(rectangle)
+    drawn = frozen.points.copy()
+    rectangle.shift(RIGHT)
+    assert frozen.points is not rectangle.points
+    np.testing.assert_allclose(frozen.points, drawn)
+
+
+def test_memory_profiler_sees_shared_points():
+    from render_memory import array_bytes, is_invisible
+
+    rectangle = shared_rectangle(1.0, 0.5, PROVIDER_COLOR, fill_opacity=0.7)
+    assert array_bytes(rectangle) >= rectangle.points.nbytes > 0
+    assert not is_invisible(rectangle)
+    assert is_invisible(rectangle.set_opacity(0))
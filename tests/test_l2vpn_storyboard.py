@@ -0,0 +1,33 @@
+import json
+import sys
+
+import pytest
+
+from l2vpn_i18n import extract_messages
+from l2vpn_storyboard import load_storyboard
+
+STORYBOARD = {
+    "scene": "JsonStoryboard",
+    "title": "Core Transit",
+    "steps": [{"caption": "PE1 forwards the packet.", "actions": [{"move": "P1"}]}],
+}
+
+
+@pytest.fixture
+def without_yaml(monkeypatch):
+    monkeypatch.setitem(sys.modules, "yaml", None)  # import yaml raises ImportError
+
+
+def test_json_storyboard_needs_no_yaml(tmp_path, without_yaml):
+    path = tmp_path / "board.json"
+    path.write_text(json.dumps(STORYBOARD), encoding="utf-8")
+    assert load_storyboard(path)["scene"] == "JsonStoryboard"
+    assert extract_messages([path]) == ["Core Transit", "PE1 forwards the packet."]
+
+
+def test_yaml_errors_are_value_errors(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "board.yaml"
+    path.write_text("scene: [unclosed\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="board.yaml: YAML"):
+        load_storyboard(path)
@@ -0,0 +1,14 @@
+import numpy as np
+
+from l2vpn_vpls import FLOOD, synthetic_trace, simulate
+
+
+def test_absolute_timestamps_age_like_relative_ones():
+    trace = synthetic_trace(8, 2000, 50000, rate=2000.0, seed=1)
+    captured = trace._replace(time=trace.time + 1.7e9)  # epoch seconds, as in a capture
+    relative = simulate(trace, 8, aging=2.0, record=10)
+    absolute = simulate(captured, 8, aging=2.0, record=10)
+    np.testing.assert_array_equal(absolute.frames, relative.frames)
+    np.testing.assert_array_equal(absolute.table_entries, relative.table_entries)
+    assert absolute.frames[:, FLOOD].sum() < len(trace.time) / 2
+    assert absolute.events[0][0] == captured.time[0]
@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from render_common import load_scene_class  # noqa: E402
+from render_dirty import _TimedRenderer, render_dirty  # noqa: E402
+
+
+def test_dirty_regions_match_full_redraws():
+    scene_class = load_scene_class("l2vpn_summary_scene", "L2VPNSummaryScene")
+    stats = render_dirty(scene_class, "l", verify=True, write_movie=False).stats
+    assert stats["frames"] > stats["full_frames"]  # some frames were drawn by region
+    assert stats["mismatched_frames"] == 0
+
+
+def test_dirty_regions_draw_the_same_frames_as_the_stock_renderer():
+    scene_class = load_scene_class("l2vpn_summary_scene", "L2VPNSummaryScene")
+    dirty = render_dirty(scene_class, "l", write_movie=False).stats
+    baseline = render_dirty(scene_class, "l", write_movie=False, renderer_class=_TimedRenderer).stats
+    assert dirty["frames"] == baseline["frames"]
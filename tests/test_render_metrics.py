@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from render_metrics import EXPORTED, append_jsonl, latest_records, write_textfile  # noqa: E402
+
+
+def _record(locale, variant, wall, **labels):
+    record = {field: 0 for field, _metric, _help in EXPORTED}
+    record.update(scene="PacketFlowScene_CE1_to_PE1", module="l2vpn_flow_scenes", quality="l",
+                  locale=locale, variant=variant, wall_seconds=wall, **labels)
+    return record
+
+
+def test_batch_renders_keep_one_series_per_locale_and_variant(tmp_path):
+    jsonl = tmp_path / "metrics.jsonl"
+    for record in (_record("en", "", 1.0), _record("de", "", 2.0), _record("en", "acme", 3.0), _record("en", "", 4.0)):
+        append_jsonl(jsonl, record)
+    latest = latest_records(jsonl)
+    assert sorted((r["locale"], r["variant"], r["wall_seconds"]) for r in latest) == [
+        ("de", "", 2.0), ("en", "", 4.0), ("en", "acme", 3.0),
+    ]
+
+    textfile = tmp_path / "manim.prom"
+    write_textfile(textfile, latest)
+    assert 'locale="en",variant="acme"} 3.0' in textfile.read_text()
+
+
+def test_records_without_batch_labels_still_load(tmp_path):
+    jsonl = tmp_path / "metrics.jsonl"
+    record = _record("", "", 1.0)
+    del record["locale"], record["variant"]
+    append_jsonl(jsonl, record)
+    write_textfile(tmp_path / "manim.prom", latest_records(jsonl))
+    assert 'quality="l",locale="",variant=""} 1.0' in (tmp_path / "manim.prom").read_text()
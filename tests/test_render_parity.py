@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from render_parity import (  # noqa: E402
+    DEFAULT_MAX_CHANGED,
+    DEFAULT_MAX_MEAN_DIFF,
+    RENDERERS,
+    compare_frames,
+    render_in_subprocess,
+)
+
+MODULE, SCENE = "l2vpn_summary_scene.py", "L2VPNSummaryScene"
+
+
+def _has_gl_context() -> bool:
+    probe = "import moderngl; moderngl.create_standalone_context()"
+    return subprocess.run([sys.executable, "-c", probe], capture_output=True).returncode == 0
+
+
+@pytest.mark.skipif(not _has_gl_context(), reason="no OpenGL context (needs a display or EGL)")
+def test_renderers_agree_on_summary_scene(tmp_path):
+    outputs = {renderer: tmp_path / f"{renderer}.npz" for renderer in RENDERERS}
+    processes = {renderer: render_in_subprocess(MODULE, SCENE, renderer, "l", out) for renderer, out in outputs.items()}
+    assert all(process.wait() == 0 for process in processes.values())
+    cairo, opengl = (np.load(outputs[renderer])["frames"] for renderer in RENDERERS)
+
+    assert len(cairo) > 0
+    assert cairo.shape == opengl.shape
+    for reference, candidate in zip(cairo, opengl):
+        result = compare_frames(reference, candidate)
+        assert result["mean_diff"] <= DEFAULT_MAX_MEAN_DIFF
+        assert result["changed"] <= DEFAULT_MAX_CHANGED
@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import l2vpn_labels  # noqa: E402
+from render_variants import VariantText, substitute, text_factory_installed  # noqa: E402
+
+SUBSTITUTIONS = {"CE-A1": "ber-ce-01", "CE-A": "ber", "VC-L": "VC 1042"}
+
+
+def test_substitute_prefers_longest_key():
+    assert substitute("CE-A1 and CE-A2", SUBSTITUTIONS) == "ber-ce-01 and ber2"
+
+
+def test_substitute_does_not_substitute_replacements():
+    substitutions = {"PE1": "PE1-Berlin", "PE": "Provider Edge"}
+    assert substitute("PE1 forwards to PE2", substitutions) == "PE1-Berlin forwards to Provider Edge2"
+
+
+@pytest.mark.parametrize("atlas", [False, True], ids=["vector", "atlas"])
+def test_variant_changes_router_name_and_vc_label(atlas):
+    from l2vpn_flow_scenes import create_full_l2vpn_packet, create_l2vpn_topology
+
+    factory = VariantText()
+    factory.substitutions = SUBSTITUTIONS
+    l2vpn_labels.set_atlas_labels(atlas)
+    try:
+        with text_factory_installed(factory):
+            routers, _lines, _labels = create_l2vpn_topology()
+            packet = create_full_l2vpn_packet()
+    finally:
+        l2vpn_labels.set_atlas_labels(False)
+
+    router_label = routers[0][1]
+    vc_label = packet[2][1]
+    assert isinstance(router_label, l2vpn_labels.AtlasLabel) == atlas
+    assert router_label.original_text == "ber-ce-01"
+    assert vc_label.original_text == "VC 1042"
+    assert factory.built > 0
+
+
+def test_factory_is_uninstalled():
+    import manim
+
+    import l2vpn_elements
+
+    with text_factory_installed(VariantText()):
+        assert l2vpn_labels.Text is not manim.Text
+    assert l2vpn_labels.Text is manim.Text
+    assert l2vpn_elements.create_label is l2vpn_labels.create_label
+
+
+def test_missing_target_is_an_error():
+    import manim
+
+    # l2vpn_elements builds its labels with create_label and has no Text of its own
+    with pytest.raises(ValueError, match="l2vpn_elements has no Text"):
+        with text_factory_installed(VariantText(), modules=("l2vpn_labels", "l2vpn_elements")):
+            pass
+    assert l2vpn_labels.Text is manim.Text
@@ -0,0 +1,306 @@
+"""
+Ahead-of-time prewarm of the Text glyph cache.
+
+Every Text(...) in the scene modules whose string and style can be known
+statically is found via the AST, including:
+    Text("...") and Text(_("..."))              literal and translatable strings
+    for point_text in points: Text(point_text)    bullet lists built from a list literal
+    create_label("VC-L", 16, WHITE)               helpers that pass a parameter on to Text
+    create_router("PE1", PROVIDER_COLOR)          ... or on to such a helper (create_label)
+
+The distinct (string, style) pairs are then laid out by Pango in parallel
+processes, one SVG per pair, into a text directory per locale (the same
+media/texts/<locale> layout render_locales.py uses). Each pair is built by
+exactly one process, so nothing is written twice.
+
+Render workers attach with use_text_cache(): prewarmed SVGs are symlinked
+into a private per-process directory, so hits read the shared files and
+misses (f-strings, computed labels) are written privately. The shared cache
+is never written after the prewarm.
+
+    python text_prewarm.py --locales en,de -j 8
+"""
+import argparse
+import ast
+import contextlib
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+
+from manim import Text, config, tempconfig
+
+from l2vpn_i18n import SOURCE_LOCALE, available_locales, load_catalog
+from render_common import REPO_DIR, load_module, module_name_from_path
+
+DEFAULT_TEXT_DIR = "{media_dir}/texts/{locale}"
+
+
+def _literal(node):
+    """Returns (string, translatable) for "..." or _("..."), otherwise None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value, False
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "_"
+        and node.args
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    ):
+        return node.args[0].value, True
+    return None
+
+
+def _innermost_functions(tree):
+    """Maps id(node) to the innermost FunctionDef containing it (None at module level)."""
+    owner = {}
+    for func in ast.walk(tree):
+        if isinstance(func, ast.FunctionDef):
+            for node in ast.walk(func):
+                owner[id(node)] = func  # nested functions are walked later and win
+    return owner
+
+
+def _loop_literals(func, name):
+    """
+    Resolves `name` when it is the variable of a loop over a list literal
+    assigned in the same function, e.g. `for i, point_text in enumerate(points)`
+    or `for label_text, width in parts`.
+    """
+    lists = {}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and isinstance(node.value, (ast.List, ast.Tuple)):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    lists[target.id] = node.value.elts
+    for node in ast.walk(func):
+        if not isinstance(node, ast.For):
+            continue
+        target, source = node.target, node.iter
+        if isinstance(source, ast.Call) and isinstance(source.func, ast.Name) and source.func.id == "enumerate":
+            # for i, item in enumerate(items)
+            if not (isinstance(target, ast.Tuple) and len(target.elts) == 2):
+                continue
+            target, source = target.elts[1], source.args[0]
+        if not (isinstance(source, ast.Name) and source.id in lists):
+            continue
+        elements = lists[source.id]
+        if isinstance(target, ast.Tuple):
+            # for label_text, width in parts, where parts holds tuple literals
+            names = [t.id if isinstance(t, ast.Name) else None for t in target.elts]
+            if name not in names:
+                continue
+            index = names.index(name)
+            elements = [e.elts[index] for e in elements if isinstance(e, ast.Tuple) and len(e.elts) > index]
+        elif not (isinstance(target, ast.Name) and target.id == name):
+            continue
+        return [lit for lit in map(_literal, elements) if lit is not None]
+    return []
+
+
+def _text_calls(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "Text":
+            if node.args and all(kw.arg is not None for kw in node.keywords):
+                yield node
+
+
+def extract_text_specs(paths) -> list:
+    """
+    Finds the statically known Text calls in the given modules.
+
+    Returns:
+        A list of (string, translatable, kwargs) where kwargs maps each keyword
+        to (module_name, expression node) for evaluation in that module.
+    """
+    trees = {module_name_from_path(str(path)): ast.parse(Path(path).read_text(encoding="utf-8")) for path in paths}
+    specs = []
+    helpers = {}  # function name -> (module, FunctionDef, parameter name, Text keywords)
+
+    for module, tree in trees.items():
+        owner = _innermost_functions(tree)
+        for call in _text_calls(tree):
+            keywords = {kw.arg: (module, kw.value) for kw in call.keywords}
+            literal = _literal(call.args[0])
+            if literal is not None:
+                specs.append((*literal, keywords))
+                continue
+            func = owner.get(id(call))
+            if func is None or not isinstance(call.args[0], ast.Name):
+                continue
+            name = call.args[0].id
+            if name in [arg.arg for arg in func.args.args]:
+                helpers[func.name] = (module, func, name, keywords)
+            else:
+                specs.extend((*literal, keywords) for literal in _loop_literals(func, name))
+
+    # Helpers that pass a parameter on to another helper are helpers too
+    # (create_router -> create_label -> Text), resolved until nothing new turns up.
+    found = True
+    while found:
+        found = False
+        for module, tree in trees.items():
+            owner = _innermost_functions(tree)
+            for call, bound, resolved in _helper_calls(module, tree, helpers):
+                func = owner.get(id(call))
+                argument = bound[helpers[call.func.id][2]][1]
+                if func is None or func.name in helpers or not isinstance(argument, ast.Name):
+                    continue
+                if argument.id in [arg.arg for arg in func.args.args]:
+                    helpers[func.name] = (module, func, argument.id, resolved)
+                    found = True
+
+    for module, tree in trees.items():
+        owner = _innermost_functions(tree)
+        for call, bound, resolved in _helper_calls(module, tree, helpers):
+            argument = bound[helpers[call.func.id][2]][1]
+            literal = _literal(argument)
+            if literal is not None:
+                specs.append((*literal, resolved))
+            elif isinstance(argument, ast.Name) and owner.get(id(call)) is not None:
+                specs.extend((*literal, resolved) for literal in _loop_literals(owner[id(call)], argument.id))
+    return specs
+
+
+def _helper_calls(module, tree, helpers):
+    """
+    Yields (call, bound arguments, Text keywords) for every call of a helper
+    in `tree`, the keywords resolved against the call's arguments.
+    """
+    for call in ast.walk(tree):
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id in helpers):
+            continue
+        helper_module, func, param, keywords = helpers[call.func.id]
+        bound = _bind_arguments(module, call, helper_module, func)
+        if bound is None or param not in bound:
+            continue
+        params = [arg.arg for arg in func.args.args]
+        resolved = {}
+        for key, (kw_module, expr) in keywords.items():
+            if isinstance(expr, ast.Name) and expr.id in params and expr.id in bound:
+                resolved[key] = bound[expr.id]
+            else:
+                resolved[key] = (kw_module, expr)
+        yield call, bound, resolved
+
+
+def _bind_arguments(module, call, helper_module, func):
+    """Maps the helper's parameters to (module, expression) from the call site or the defaults."""
+    params = [arg.arg for arg in func.args.args]
+    if len(call.args) > len(params) or any(kw.arg is None for kw in call.keywords):
+        return None
+    defaults = func.args.defaults
+    bound = {name: (helper_module, expr) for name, expr in zip(params[len(params) - len(defaults):], defaults)}
+    bound.update({name: (module, expr) for name, expr in zip(params, call.args)})
+    bound.update({kw.arg: (module, kw.value) for kw in call.keywords})
+    return bound
+
+
+def _evaluate(module, expr):
+    code = compile(ast.Expression(expr), f"<{module}>", "eval")
+    return eval(code, vars(load_module(module)))
+
+
+def resolve_specs(specs, locale: str = SOURCE_LOCALE) -> list:
+    """
+    Evaluates the keyword expressions and translates the strings for one locale.
+
+    Returns:
+        Distinct (string, kwargs) pairs, ready for Text(string, **kwargs). Calls
+        whose keywords depend on runtime values are dropped.
+    """
+    catalog = load_catalog(locale)
+    resolved = {}
+    for string, translatable, keywords in specs:
+        try:
+            kwargs = {key: _evaluate(module, expr) for key, (module, expr) in keywords.items()}
+        except Exception:
+            continue
+        if translatable:
+            string = catalog.get(string) or string
+        resolved.setdefault((string, repr(sorted(kwargs.items()))), (string, kwargs))
+    return list(resolved.values())
+
+
+def _prewarm_chunk(job):
+    text_dir, items = job
+    failed = []
+    with tempconfig({"text_dir": text_dir}):
+        for string, kwargs in items:
+            try:
+                Text(string, **kwargs)
+            except Exception as exc:
+                failed.append((string, repr(exc)))
+    return len(items) - len(failed), failed
+
+
+def prewarm(locales: list = None, processes: int = None, text_dir: str = DEFAULT_TEXT_DIR, paths=None) -> dict:
+    """
+    Lays out every statically known Text of the scene modules.
+
+    Args:
+        locales: Locale codes; defaults to every locale with a catalog.
+        processes: Worker processes; defaults to the CPU count.
+        text_dir: Target directory pattern; {media_dir} and {locale} are filled in.
+        paths: Source files to scan; defaults to every module in the repository.
+
+    Returns:
+        A dict mapping each locale to (built, failed) where failed lists (string, error).
+    """
+    specs = extract_text_specs(paths or sorted(REPO_DIR.glob("*.py")))
+    media_dir = config.get_dir("media_dir")
+    processes = processes or os.cpu_count()
+    jobs, owners = [], []
+    for locale in locales or available_locales():
+        items = resolve_specs(specs, locale)
+        target = text_dir.format(media_dir=media_dir, locale=locale)
+        for start in range(processes):
+            chunk = items[start::processes]
+            if chunk:
+                jobs.append((target, chunk))
+                owners.append(locale)
+    report = {}
+    with multiprocessing.Pool(processes) as pool:
+        for locale, (built, failed) in zip(owners, pool.map(_prewarm_chunk, jobs)):
+            total_built, total_failed = report.get(locale, (0, []))
+            report[locale] = (total_built + built, total_failed + failed)
+    return report
+
+
+def attach_text_cache(shared_dir, private_dir) -> Path:
+    """
+    Symlinks every SVG of `shared_dir` into `private_dir`, which is returned.
+    Point config.text_dir at the result: hits read the shared files, misses
+    are written to `private_dir` only.
+    """
+    shared_dir, private_dir = Path(shared_dir), Path(private_dir)
+    private_dir.mkdir(parents=True, exist_ok=True)
+    for svg in shared_dir.glob("*.svg"):
+        link = private_dir / svg.name
+        if not link.exists():
+            link.symlink_to(svg.resolve())
+    return private_dir
+
+
+@contextlib.contextmanager
+def use_text_cache(locale: str = SOURCE_LOCALE, text_dir: str = DEFAULT_TEXT_DIR):
+    """Renders inside this context read the prewarmed cache of `locale` without writing to it."""
+    shared_dir = Path(text_dir.format(media_dir=config.get_dir("media_dir"), locale=locale))
+    with tempfile.TemporaryDirectory(prefix=f"texts-{locale}-") as scratch:
+        with tempconfig({"text_dir": str(attach_text_cache(shared_dir, scratch))}):
+            yield
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prewarm the Text glyph cache for all scene modules.")
+    parser.add_argument("--locales", help="comma-separated locale codes (default: all catalogs)")
+    parser.add_argument("-j", "--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--text-dir", default=DEFAULT_TEXT_DIR, help="target pattern (default: %(default)s)")
+    args = parser.parse_args()
+
+    requested = args.locales.split(",") if args.locales else None
+    for locale, (built, failed) in prewarm(requested, args.processes, args.text_dir).items():
+        print(f"{locale}: {built} texts cached, {len(failed)} failed")
+        for string, error in failed:
+            print(f"  {string!r}: {error}")